@@ -18,11 +18,21 @@ Output:
 AI files are PostScript-based and contain a %%Creator comment near the start.
 """
 
+import importlib.util
 import json
+import os
 import sys
 import re
 from pathlib import Path
 
+# Load validation/ai_sniffer.py on its own: importing it through the package
+# would run validation/__init__.py (numpy, shapely, svgpathtools, rules)
+_SNIFFER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'validation', 'ai_sniffer.py')
+_spec = importlib.util.spec_from_file_location('ai_sniffer', _SNIFFER_PATH)
+ai_sniffer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ai_sniffer)
+
 # Adobe Illustrator version to CC year mapping
 VERSION_MAP = {
     # CC 2025+ versions
@@ -82,7 +92,7 @@ def extract_ai_version(file_path: str) -> dict:
     AI files contain PostScript comments including:
       %%Creator: Adobe Illustrator(R) XX.X
 
-    We read first 4KB which should contain the header.
+    The header (first 16KB) is scanned by validation/ai_sniffer.py.
     """
     try:
         path = Path(file_path)
@@ -99,51 +109,15 @@ def extract_ai_version(file_path: str) -> dict:
                 'error': f'Not an AI file: {file_path}'
             }
 
-        # Read first 16KB of file (XMP metadata can be further in)
-        with open(file_path, 'rb') as f:
-            header = f.read(16384)
-
-        # Try to decode as UTF-8, fallback to latin-1
-        try:
-            header_text = header.decode('utf-8', errors='replace')
-        except:
-            header_text = header.decode('latin-1', errors='replace')
-
-        # Pattern 1: XMP metadata format (modern AI files)
-        # <xmp:CreatorTool>Adobe Illustrator 29.8 (Windows)</xmp:CreatorTool>
-        xmp_pattern = r'<xmp:CreatorTool>Adobe Illustrator[^\d]*(\d+(?:\.\d+)?)'
-        xmp_match = re.search(xmp_pattern, header_text, re.IGNORECASE)
-
-        if xmp_match:
-            raw_version = xmp_match.group(1)
-            return _build_version_result(raw_version)
-
-        # Pattern 2: PostScript %%Creator format (older AI files)
-        # %%Creator: Adobe Illustrator(R) 24.0
-        # %%Creator: Adobe Illustrator(TM) 24.0
-        # %%Creator: Adobe Illustrator 24.0
-        creator_pattern = r'%%Creator:\s*Adobe Illustrator[^0-9]*(\d+(?:\.\d+)?)'
-        creator_match = re.search(creator_pattern, header_text, re.IGNORECASE)
+        # Header-only read, same patterns the converters use
+        raw_version, creator = ai_sniffer.sniff_ai_header(file_path)
 
-        if creator_match:
-            raw_version = creator_match.group(1)
-            return _build_version_result(raw_version)
-
-        # Pattern 3: softwareAgent in XMP (sometimes version differs)
-        # <stEvt:softwareAgent>Adobe Illustrator 29.1 (Windows)</stEvt:softwareAgent>
-        agent_pattern = r'<stEvt:softwareAgent>Adobe Illustrator[^\d]*(\d+(?:\.\d+)?)'
-        agent_match = re.search(agent_pattern, header_text, re.IGNORECASE)
-
-        if agent_match:
-            raw_version = agent_match.group(1)
+        # Patterns 1-3: XMP CreatorTool, %%Creator, XMP softwareAgent
+        if raw_version:
             return _build_version_result(raw_version)
 
         # Pattern 4: Generic Creator in PDF metadata
-        pdf_pattern = r'%%Creator:\s*([^\n\r]+)'
-        pdf_match = re.search(pdf_pattern, header_text)
-
-        if pdf_match:
-            creator = pdf_match.group(1).strip()
+        if creator:
             # Try to extract version from generic creator string
             version_in_creator = re.search(r'(\d+(?:\.\d+)?)', creator)
             if version_in_creator and 'illustrator' in creator.lower():
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Boundary tests for circle recognition (validation/circle_fit.py).
+
+Usage:
+    python3 -m pytest test_circle_fit.py
+
+CIRCLE_TOLERANCE is calibrated to the bbox test it replaced, which
+accepted ellipses down to a 0.98 aspect ratio.
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from validation.circle_fit import fit_circle
+from validation.path_data import parse_path_data
+
+KAPPA = 0.5522847498
+
+
+def _kappa_ellipse(rx: float, ry: float, cx: float = 50, cy: float = 50) -> str:
+    """Four-cubic ellipse as Illustrator writes it."""
+    kx, ky = KAPPA * rx, KAPPA * ry
+    return (f'M {cx + rx} {cy} C {cx + rx} {cy + ky} {cx + kx} {cy + ry} {cx} {cy + ry} '
+            f'C {cx - kx} {cy + ry} {cx - rx} {cy + ky} {cx - rx} {cy} '
+            f'C {cx - rx} {cy - ky} {cx - kx} {cy - ry} {cx} {cy - ry} '
+            f'C {cx + kx} {cy - ry} {cx + rx} {cy - ky} {cx + rx} {cy} Z')
+
+
+def _arc_ellipse(rx: float, ry: float, cx: float = 50, cy: float = 50) -> str:
+    return (f'M {cx + rx} {cy} A {rx} {ry} 0 0 1 {cx - rx} {cy} '
+            f'A {rx} {ry} 0 0 1 {cx + rx} {cy} Z')
+
+
+def _polygon(sides: int, r: float = 10, cx: float = 50, cy: float = 50) -> str:
+    points = [(cx + r * math.cos(2 * math.pi * i / sides), cy + r * math.sin(2 * math.pi * i / sides))
+              for i in range(sides)]
+    return 'M ' + ' L '.join(f'{x} {y}' for x, y in points) + ' Z'
+
+
+def _is_circle(d: str) -> bool:
+    fit = fit_circle(parse_path_data(d))
+    return fit is not None and fit.is_circle
+
+
+@pytest.mark.parametrize('build', [_kappa_ellipse, _arc_ellipse])
+@pytest.mark.parametrize('aspect, expected', [(1.0, True), (0.99, True), (0.98, True),
+                                              (0.979, False), (0.97, False)])
+def test_aspect_ratio_boundary(build, aspect, expected):
+    assert _is_circle(build(5, 5 * aspect)) is expected
+    assert _is_circle(build(500 * aspect, 500, cx=1e4, cy=1e4)) is expected
+
+
+@pytest.mark.parametrize('sides, expected', [(4, False), (8, False), (12, False), (16, False),
+                                             (32, True)])
+def test_polygons(sides, expected):
+    assert _is_circle(_polygon(sides)) is expected
+
+
+def test_kappa_circle_diameter():
+    fit = fit_circle(parse_path_data(_kappa_ellipse(5, 5)))
+    assert fit.method == 'kappa'
+    assert fit.diameter == pytest.approx(10)
+    assert fit.center == pytest.approx((50, 50))
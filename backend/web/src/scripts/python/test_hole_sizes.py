@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Matching rules of the standard hole size catalog (validation/hole_sizes.py).
+
+Usage:
+    python3 -m pytest test_hole_sizes.py
+
+HoleSizeCatalog replaced three hand-written linear matchers; these tests pin
+the rules they shared: nearest size within tolerance, ties to the earliest
+row in database order, DEFAULT_TOLERANCE_MM for a NULL tolerance and rows
+without a diameter left out.
+"""
+
+import math
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from validation.hole_sizes import DEFAULT_TOLERANCE_MM, HoleSizeCatalog
+
+SIZES = [
+    {'hole_size_id': 1, 'name': 'Wire', 'category': 'wire', 'diameter_mm': 9.5, 'tolerance_mm': 0.5},
+    {'hole_size_id': 2, 'name': 'Mounting', 'category': 'mounting', 'diameter_mm': 5.0,
+     'tolerance_mm': 0.5},
+    {'hole_size_id': 3, 'name': 'Small', 'category': 'mounting', 'diameter_mm': 4.0,
+     'tolerance_mm': 0.5},
+    {'hole_size_id': 4, 'name': 'Mounting (dup)', 'category': 'mounting', 'diameter_mm': '5.0',
+     'tolerance_mm': '0.5'},
+    {'hole_size_id': 5, 'name': 'Drain', 'category': 'drain', 'diameter_mm': 12,
+     'tolerance_mm': None},
+    {'hole_size_id': 6, 'name': 'Vent', 'category': 'vent', 'diameter_mm': 20},
+    {'hole_size_id': 7, 'name': 'Broken', 'category': 'vent', 'diameter_mm': None,
+     'tolerance_mm': 5},
+]
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    return HoleSizeCatalog(SIZES)
+
+
+def _id(row):
+    return row['hole_size_id'] if row else None
+
+
+@pytest.mark.parametrize('diameter, expected', [
+    (9.5, 1), (9.9, 1), (10.1, None),
+    (4.2, 3), (4.8, 2),   # nearest size wins when both are within tolerance
+    (3.4, None),
+])
+def test_nearest_within_tolerance(catalog, diameter, expected):
+    assert _id(catalog.match(diameter)) == expected
+
+
+def test_ties_go_to_earliest_row(catalog):
+    # 4.5 is exactly 0.5 from both 4.0 (row 3) and 5.0 (row 2): row 2 is listed first
+    assert _id(catalog.match(4.5)) == 2
+    # Rows 2 and 4 share a diameter: row 2 is listed first
+    assert _id(catalog.match(5.0)) == 2
+    reordered = HoleSizeCatalog([SIZES[3], SIZES[2], SIZES[1]])
+    assert _id(reordered.match(5.0)) == 4
+    assert _id(reordered.match(4.5)) == 4
+
+
+@pytest.mark.parametrize('diameter, expected', [
+    (12.02, 5), (11.98, 5), (12.05, None),   # NULL tolerance_mm
+    (20.02, 6), (19.95, None),               # missing tolerance_mm
+])
+def test_missing_tolerance_uses_default(catalog, diameter, expected):
+    assert DEFAULT_TOLERANCE_MM == 0.03
+    assert _id(catalog.match(diameter)) == expected
+
+
+def test_null_diameter_is_skipped(capsys):
+    catalog = HoleSizeCatalog(SIZES)
+    assert 'Broken' in capsys.readouterr().err
+    # Row 7's 5 mm tolerance must not widen the search window into a match
+    assert catalog.match(25.0) is None
+    assert len(catalog) == len(SIZES)
+    assert catalog.first('vent')['hole_size_id'] == 6
+    assert HoleSizeCatalog([SIZES[6]]).match(0.0) is None
+
+
+def test_nan_input(catalog):
+    assert catalog.match(math.nan) is None
+    assert list(catalog.match_many(np.array([math.nan, math.inf, 9.5]))) == [-1, -1, 0]
+
+
+def test_empty_catalog():
+    catalog = HoleSizeCatalog([])
+    assert catalog.match(5.0) is None
+    assert list(catalog.match_many(np.array([5.0]))) == [-1]
+
+
+def test_first_by_category(catalog):
+    assert catalog.first('mounting')['hole_size_id'] == 2
+    assert catalog.first('missing') is None
+
+
+def test_match_many_agrees_with_match(catalog):
+    rng = random.Random(0)
+    diameters = [rng.uniform(3, 22) for _ in range(2000)]
+    diameters += [4.5, 5.0, 9.0, 10.0, 12.03, 19.97, 20.03, math.nan]
+    rows = catalog.match_many(np.array(diameters))
+    for diameter, row in zip(diameters, rows.tolist()):
+        expected = catalog.match(diameter)
+        assert (catalog.sizes[row] if row >= 0 else None) is expected, diameter
+    assert list(catalog.matches_any(np.array(diameters))) == [r >= 0 for r in rows.tolist()]
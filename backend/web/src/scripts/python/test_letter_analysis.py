@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Regression tests for letter identification and hole assignment
+(validation/letter_analysis.py: ContainmentTree, identify_letters,
+find_holes_in_letters).
+
+Usage:
+    python3 -m pytest test_letter_analysis.py
+
+Layers are built from hand-made PathInfo records (shapely boxes), so the
+containment rules are pinned independently of SVG parsing.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from shapely.geometry import Polygon, box
+
+from validation.core import PathInfo
+from validation.letter_analysis import (
+    build_containment_trees, find_holes_in_letters, find_paths_inside_letter, identify_letters,
+)
+
+
+def _path(path_id: str, polygon, bbox=None, layer: str = 'Return') -> PathInfo:
+    """Closed, non-circular path with the given polygon (bbox defaults to its bounds)."""
+    return PathInfo(
+        path_id, '', None, None, '#000000', None,
+        bbox=bbox or tuple(polygon.bounds), length=polygon.length, area=polygon.area,
+        is_closed=True, num_holes=0, layer_name=layer, is_circle=False,
+        circle_diameter=None, polygon=polygon, is_compound=False, num_subpaths=1,
+    )
+
+
+def _ids(paths):
+    return [p.path_id for p in paths]
+
+
+def _holes(letters, paths, trees=None):
+    return [_ids(inner) for inner in find_holes_in_letters(letters, paths, 0.5, trees)]
+
+
+def test_nested_outlines():
+    outer = _path('outer', box(0, 0, 100, 100))
+    middle = _path('middle', box(10, 10, 90, 90))
+    inner = _path('inner', box(20, 20, 80, 80))
+    paths = [inner, outer, middle]
+
+    assert _ids(identify_letters(paths)) == ['outer']
+    # Each excluded candidate records its immediate (smallest) container
+    assert middle._contained_by == 'outer'
+    assert inner._contained_by == 'middle'
+    assert outer._contained_by is None
+
+
+def test_overlapping_larger_shape():
+    # small's centroid lies inside large and vice versa, but a smaller
+    # candidate never contains a larger one
+    small = _path('small', box(0, 0, 10, 10))
+    large = _path('large', box(1, 1, 17, 9))
+    paths = [small, large]
+
+    assert _ids(identify_letters(paths)) == ['large']
+    assert small._contained_by == 'large'
+
+    # Hole search keeps path_is_inside_letter semantics (centroid test) even
+    # for a hole larger than its letter
+    trees = build_containment_trees(paths, 0.5)
+    assert _holes([small], paths, trees) == _holes([small], paths) == [['large']]
+    assert _holes([large], paths, trees) == _holes([large], paths) == [['small']]
+
+
+def test_bbox_fallback_without_polygon():
+    # Candidates whose polygon is empty are compared by bbox (tolerance 1.0)
+    letter = _path('letter', box(0, 0, 100, 100))
+    flat = _path('flat', Polygon(), bbox=(10, 10, 20, 20))
+    flat_outer = _path('flat_outer', Polygon(), bbox=(200, 200, 300, 300))
+    boxed = _path('boxed', box(210, 210, 220, 220))
+    paths = [letter, flat, flat_outer, boxed]
+
+    assert _ids(identify_letters(paths)) == ['letter', 'flat_outer']
+    assert flat._contained_by == 'letter'
+    assert boxed._contained_by == 'flat_outer'
+
+
+def test_letters_only_contain_within_their_layer():
+    letter = _path('letter', box(0, 0, 100, 100), layer='Return')
+    face = _path('face', box(10, 10, 20, 20), layer='Face')
+
+    assert _ids(identify_letters([letter, face])) == ['letter', 'face']
+    assert _ids(identify_letters([letter, face], layer_name='Face')) == ['face']
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_hole_search_with_and_without_trees(seed):
+    rng = random.Random(seed)
+    paths = []
+    for n in range(120):
+        x, y = rng.uniform(0, 200), rng.uniform(0, 200)
+        w, h = rng.uniform(0.5, 60), rng.uniform(0.5, 60)
+        paths.append(_path(f'p{n}', box(x, y, x + w, y + h),
+                           layer=rng.choice(['Return', 'Face'])))
+
+    trees = build_containment_trees(paths, 0.5)
+    letters = identify_letters(paths, trees=trees)
+    assert _ids(letters) == _ids(identify_letters(paths))
+
+    with_trees = _holes(letters, paths, trees)
+    assert with_trees == _holes(letters, paths)
+    assert with_trees == [_ids(find_paths_inside_letter(letter, paths, 0.5))
+                          for letter in letters]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Parity tests: validation/path_data.parse_path_data against svgpathtools.parse_path.
+
+Usage:
+    python3 -m pytest test_path_data.py
+
+parse_path_data() feeds bbox, closure, polygons, corners and circles, so for
+every d string it must produce the same segments svgpathtools does: count,
+kinds, control points and endpoints, and the same continuous_subpaths()
+splits.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from svgpathtools import Arc, CubicBezier, Line, QuadraticBezier, parse_path
+
+from validation.path_data import parse_path_data
+from validation.sampling import SEG_ARC, SEG_CUBIC, SEG_LINE, SEG_QUAD
+
+_KIND = {Line: SEG_LINE, QuadraticBezier: SEG_QUAD, CubicBezier: SEG_CUBIC, Arc: SEG_ARC}
+
+D_STRINGS = [
+    # Absolute / relative lines, implicit linetos after M and m
+    'M 10 10 L 90 10 L 90 90 L 10 90 Z',
+    'm 10 10 80 0 0 80 -80 0 z',
+    'M10,10 20,20 30,10',
+    'M10 10h50v30H10V10',
+    'M10 10 h50 v30 h-50 z',
+    # Implicit repeats of C, Q, S, T
+    'M0 0 C 10 0 20 10 20 20 30 30 40 30 50 20',
+    'M0 0c10 0 20 10 20 20 10 10 20 10 30 0',
+    'M0 0 Q 10 10 20 0 30 -10 40 0',
+    # Smooth curves: reflection after C/S and Q/T, no reflection otherwise
+    'M0 0 C 0 10 10 20 20 20 S 40 10 40 0 s 10 -20 20 -20',
+    'M0 0 L 10 0 S 20 10 30 0',
+    'M0 0 Q 10 20 20 0 T 40 0 t 20 0',
+    'M0 0 L 10 0 T 20 10',
+    # Arcs, compact flags, zero radius
+    'M 10 50 A 40 40 0 0 1 90 50 A 40 40 0 0 1 10 50 Z',
+    'M10 50a40 40 0 1 0 80 0a40 40 0 1 0-80 0z',
+    'M10 50 a40,40 0 0,1 80,0',
+    'M 10 10 A 0 20 0 0 1 50 50',
+    # Multiple subpaths; Z with and without a gap to the start point
+    'M 0 0 L 10 0 L 10 10 Z M 20 20 L 30 20 L 30 30 Z',
+    'M 0 0 L 10 0 L 0 0 Z M 5 5 l 1 0 z',
+    'M 0 0 L 10 0 L 10 10 M 20 20 L 30 20',
+    'M 0 0 L 10 0 Z L 10 10 Z',
+    'm 0 0 10 0 10 10 z m 20 20 10 0 0 10 z',
+    # Exponents and packed numbers
+    'M1e1 1e1L2.5e1-5.0.5.5',
+]
+
+
+@pytest.mark.parametrize('d', D_STRINGS)
+def test_segments_match_svgpathtools(d):
+    expected = parse_path(d)
+    data = parse_path_data(d)
+    arrays = data.arrays
+
+    assert len(data) == len(expected)
+    for i, seg in enumerate(expected):
+        assert arrays.kinds[i] == _KIND[type(seg)], f'segment {i} of {d!r}'
+        c = arrays.ctrl[i]
+        assert c[0] == pytest.approx(seg.start)
+        assert c[3] == pytest.approx(seg.end)
+        if isinstance(seg, CubicBezier):
+            assert c[1] == pytest.approx(seg.control1)
+            assert c[2] == pytest.approx(seg.control2)
+        elif isinstance(seg, QuadraticBezier):
+            assert c[1] == pytest.approx(seg.control)
+        elif isinstance(seg, Arc):
+            assert data.to_path()[i] == seg
+
+
+@pytest.mark.parametrize('d', D_STRINGS)
+def test_subpath_splits_match_svgpathtools(d):
+    expected = parse_path(d).continuous_subpaths()
+    actual = parse_path_data(d).continuous_subpaths()
+
+    assert [len(sub) for sub in actual] == [len(sub) for sub in expected]
+    for sub, ref in zip(actual, expected):
+        starts, ends = sub.subpath_ends()
+        assert starts[0] == pytest.approx(ref.start)
+        assert ends[-1] == pytest.approx(ref.end)
+    assert parse_path_data(d).iscontinuous() == parse_path(d).iscontinuous()
+
+
+@pytest.mark.parametrize('d', D_STRINGS)
+def test_bbox_and_length_match_svgpathtools(d):
+    expected = parse_path(d)
+    data = parse_path_data(d)
+    assert data.bbox() == pytest.approx(expected.bbox())
+    assert data.length() == pytest.approx(expected.length(), rel=1e-6)
+
+
+@pytest.mark.parametrize('d', ['10 10 L 20 20', 'M 0 0 L 10', 'M 0 0 Z 5'])
+def test_rejects_what_svgpathtools_rejects(d):
+    with pytest.raises(Exception):
+        parse_path(d)
+    with pytest.raises(ValueError):
+        parse_path_data(d)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Fixture tests for the native PDF content-stream interpreter (validation/pdf_extract.py).
+
+Usage:
+    python3 -m pytest test_pdf_extract.py
+
+The fixture is a hand-built single-page PDF (no xref needed: PdfDocument
+indexes objects by scanning for "N 0 obj" headers) covering path
+construction (m l c v y h re), cm, q/Q, w, colors, clipping and
+BDC /OC layer naming, including an OCG that is OFF by default.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from validation.pdf_extract import PdfDocument, _interpret_first_page
+
+CONTENT = b"""
+/OC /MC0 BDC
+q
+1 0 0 1 10 20 cm
+2 w
+1 0 0 RG
+0 0 m 30 0 l h S
+Q
+0 0 1 rg
+50 10 20 30 re f
+0.00001 w
+0 G
+0 0 m 5 0 l S
+EMC
+/OC /MC1 BDC
+0 g
+100 10 m 110 20 120 20 130 10 c 140 20 150 10 v 160 0 170 10 y h f
+EMC
+/OC /MC2 BDC
+0 0 m 1 1 l S
+EMC
+0 0 200 100 re W n
+180 0 m 190 0 l S
+"""
+
+
+def _build_pdf(content: bytes) -> bytes:
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R /OCProperties << /OCGs [5 0 R 6 0 R 7 0 R] '
+        b'/D << /OFF [7 0 R] >> >> >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 100] /Contents 4 0 R '
+        b'/Resources << /Properties << /MC0 5 0 R /MC1 6 0 R /MC2 7 0 R >> >> >>',
+        b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream',
+        b'<< /Type /OCG /Name (Return) >>',
+        b'<< /Type /OCG /Name <FEFF0046006100630065> >>',  # UTF-16BE "Face"
+        b'<< /Type /OCG /Name (Guides) >>',
+    ]
+    out = b'%PDF-1.6\n'
+    for num, body in enumerate(objects, start=1):
+        out += b'%d 0 obj\n' % num + body + b'\nendobj\n'
+    return out + b'%%EOF\n'
+
+
+@pytest.fixture(scope='module')
+def records():
+    return _interpret_first_page(PdfDocument(_build_pdf(CONTENT)))
+
+
+def test_cm_and_q_restore(records):
+    # Translated by cm, flipped to SVG orientation (y down from the MediaBox top)
+    stroked = records[0]
+    assert stroked['layer'] == 'Return'
+    assert stroked['d'] == 'M 10,80 L 40,80 L 10,80 Z'
+    assert stroked['stroke'] == '#ff0000'
+    assert stroked['fill'] is None
+    assert stroked['stroke_width'] == pytest.approx(2 * 0.75)
+
+    # After Q the translation is gone
+    rect = records[1]
+    assert rect['d'] == 'M 50,90 L 70,90 L 70,60 L 50,60 L 50,90 Z'
+    assert rect['fill'] == '#0000ff'
+    assert rect['stroke'] is None
+
+
+def test_tiny_stroke_width_is_not_truncated(records):
+    assert records[2]['stroke_width'] == pytest.approx(0.00001 * 0.75)
+
+
+def test_curve_operators(records):
+    curves = records[3]
+    assert curves['layer'] == 'Face'
+    # v takes its first control point from the current point, y its second from the end point
+    assert curves['d'] == ('M 100,90 C 110,80 120,80 130,90 C 130,90 140,80 150,90 '
+                           'C 160,100 170,90 170,90 L 100,90 Z')
+    assert curves['fill'] == '#000000'
+    assert len(curves['data']) == 4
+
+
+def test_layers_hidden_and_unmarked(records):
+    assert records[4]['layer'] == '_hidden_'
+    # The clip-only rectangle (W n) is not output; the path after it has no OCG
+    assert len(records) == 6
+    assert records[5]['layer'] == '_no_layer_'
+    assert records[5]['d'] == 'M 180,100 L 190,100'
+
+
+def test_no_optional_content_falls_back():
+    assert _interpret_first_page(PdfDocument(_build_pdf(b'0 0 m 10 10 l S'))) is None
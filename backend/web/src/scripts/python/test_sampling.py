@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Bounds of adaptive curve flattening (validation/sampling.flatten_parameters).
+
+Usage:
+    python3 -m pytest test_sampling.py
+
+validate_file() relies on two guarantees for Bezier segments: consecutive
+samples are never more than max_point_distance apart, and no chord strays
+more than the flattening tolerance from the curve.
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from svgpathtools import CubicBezier, Line, QuadraticBezier
+
+from validation.sampling import SegmentArrays, flatten_parameters
+
+# Curve points tested between consecutive samples for the chord deviation
+_INTERIOR = 15
+
+
+def _bezier(seg, t: np.ndarray) -> np.ndarray:
+    """Vectorized Bernstein evaluation of a quadratic or cubic segment."""
+    p = np.array(seg.bpoints())
+    n = len(p) - 1
+    s = 1 - t
+    coeffs = [1, 2, 1] if n == 2 else [1, 3, 3, 1]
+    return sum(c * s ** (n - i) * t ** i * p[i] for i, c in enumerate(coeffs))
+
+
+def _gap_and_deviation(seg, t: np.ndarray):
+    """Largest sample gap and chord deviation of one segment sampled at t."""
+    ts = np.append(t, 1.0)
+    assert np.all(np.diff(ts) >= 0)
+    pts = _bezier(seg, ts)
+    gap = np.abs(np.diff(pts)).max()
+
+    frac = np.linspace(0, 1, _INTERIOR + 2)[1:-1]
+    t0, t1 = ts[:-1, None], ts[1:, None]
+    inner = _bezier(seg, t0 + (t1 - t0) * frac)
+    p0, p1 = pts[:-1, None], pts[1:, None]
+    chord = p1 - p0
+    length = np.abs(chord)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        off = np.where(length > 0, np.abs(((inner - p0) * chord.conjugate()).imag) / length,
+                       np.abs(inner - p0))
+    return gap, off.max()
+
+
+def _random_segments(seed: int, scale: float, count: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        pts = [complex(rng.uniform(0, scale), rng.uniform(0, scale)) for _ in range(4)]
+        if rng.random() < 0.3:
+            # Crossed handles: near-cusps with a sharp speed peak
+            pts[1] = pts[3] + (pts[0] - pts[3]) * rng.uniform(0.8, 1.2)
+            pts[2] = pts[0] + (pts[3] - pts[0]) * rng.uniform(0.8, 1.2)
+        yield CubicBezier(*pts)
+        yield QuadraticBezier(*pts[:3])
+
+
+@pytest.mark.parametrize('scale', [5, 50, 500])
+@pytest.mark.parametrize('max_point_distance, tolerance', [(1.0, 0.05), (2.83, 0.14)])
+def test_gap_and_chord_deviation_bounds(scale, max_point_distance, tolerance):
+    segments = list(_random_segments(scale, scale, 300))
+    counts, t = flatten_parameters(SegmentArrays(segments), max_point_distance, tolerance)
+    starts = np.cumsum(counts) - counts
+
+    worst_gap = worst_deviation = 0.0
+    for seg, start, count in zip(segments, starts, counts):
+        gap, deviation = _gap_and_deviation(seg, t[start:start + count])
+        worst_gap = max(worst_gap, gap)
+        worst_deviation = max(worst_deviation, deviation)
+    assert worst_gap <= max_point_distance
+    assert worst_deviation <= tolerance
+
+
+def test_lines_emit_only_their_start_point():
+    arrays = SegmentArrays([Line(0j, 100 + 0j), CubicBezier(100, 150 + 50j, 200 + 50j, 250),
+                            Line(250, 250 + 100j)])
+    counts, t = flatten_parameters(arrays, 1.0, 0.05)
+    assert counts[0] == 1 and counts[2] == 1
+    assert counts[1] > 1
+    assert t[0] == 0.0 and t[-1] == 0.0
@@ -11,10 +11,27 @@ Dependencies:
 
 Usage:
   python3 validate_ai_file.py <ai_file_path> [--rules-json <rules_json>]
+  python3 validate_ai_file.py --worker
+  python3 validate_ai_file.py --batch [--max-workers N] < requests.ndjson
 
 Output:
   JSON object with validation results to stdout
 
+Worker mode (--worker):
+  Long-lived process that reads newline-delimited JSON requests from stdin
+  and writes one JSON result per line to stdout, so callers can keep warm
+  workers instead of paying interpreter + import startup per file.
+
+  Request:  {"id": "abc", "file_path": "/path/to/file.ai", "rules": {...}}
+  Response: {"id": "abc", "success": true, "status": "passed", ...}
+
+  The "id" is echoed back unchanged. The worker exits on EOF.
+
+Batch mode (--batch):
+  Reads all requests (same format as worker mode) from stdin, validates the
+  files in parallel across a process pool, and writes one JSON result per
+  line as each file finishes (completion order, not input order).
+
 Available Rules:
   - no_duplicate_overlapping: Check for duplicate paths on same layer
   - stroke_requirements: Validate stroke color/width/fill
@@ -24,7 +41,9 @@ Available Rules:
 """
 
 import argparse
+import contextlib
 import json
+import os
 import sys
 
 # Check dependencies before importing validation module
@@ -39,7 +58,103 @@ except ImportError as e:
     }))
     sys.exit(1)
 
-from validation import validate_file
+from validation import validate_file, validate_files
+
+
+def _error_response(request_id, file_path: str, error: str) -> dict:
+    """Build an error result in the same shape as ValidationResult.to_dict()."""
+    return {
+        'id': request_id,
+        'success': False,
+        'file_path': file_path,
+        'file_name': os.path.basename(file_path),
+        'status': 'error',
+        'issues': [],
+        'stats': {},
+        'error': error,
+    }
+
+
+def _parse_request(line: str):
+    """
+    Parse one request line.
+
+    Returns:
+        Tuple of (request_id, file_path, rules, error_response) — error_response
+        is None when the request is well-formed.
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return None, '', {}, _error_response(None, '', f"Invalid request JSON: {e}")
+
+    if not isinstance(request, dict):
+        return None, '', {}, _error_response(None, '', "Request must be a JSON object")
+
+    request_id = request.get('id')
+    file_path = request.get('file_path') or ''
+    rules = request.get('rules') or {}
+
+    if not file_path:
+        return request_id, '', rules, _error_response(request_id, '', "Request is missing 'file_path'")
+
+    return request_id, file_path, rules, None
+
+
+def _handle_request(line: str) -> dict:
+    """Run validation for one worker request line and return the response dict."""
+    request_id, file_path, rules, error = _parse_request(line)
+    if error:
+        return error
+
+    try:
+        # Keep stdout reserved for the one-result-per-line protocol
+        with contextlib.redirect_stdout(sys.stderr):
+            result = validate_file(file_path, rules)
+    except Exception as e:
+        return _error_response(request_id, file_path, f"Worker error: {e}")
+
+    return {'id': request_id, **result.to_dict()}
+
+
+def run_worker(stdin=sys.stdin, stdout=sys.stdout) -> None:
+    """
+    Serve validation requests from stdin until EOF.
+
+    One JSON request per line in, one JSON result per line out.
+    """
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        stdout.write(json.dumps(_handle_request(line)) + '\n')
+        stdout.flush()
+
+
+def run_batch(max_workers=None, stdin=sys.stdin, stdout=sys.stdout) -> None:
+    """
+    Validate every request on stdin in parallel, streaming results as they finish.
+    """
+    paths, rules_per_file, request_ids = [], [], []
+
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request_id, file_path, rules, error = _parse_request(line)
+        if error:
+            stdout.write(json.dumps(error) + '\n')
+            stdout.flush()
+            continue
+        paths.append(file_path)
+        rules_per_file.append(rules)
+        request_ids.append(request_id)
+
+    with contextlib.redirect_stdout(sys.stderr):
+        results = validate_files(paths, rules_per_file, max_workers=max_workers)
+        for index, result in results:
+            stdout.write(json.dumps({'id': request_ids[index], **result.to_dict()}) + '\n')
+            stdout.flush()
 
 
 def main():
@@ -48,11 +163,28 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
-    parser.add_argument('ai_file', help='Path to the AI file to validate')
+    parser.add_argument('ai_file', nargs='?', help='Path to the AI file to validate')
     parser.add_argument('--rules-json', help='JSON string of validation rules')
+    parser.add_argument('--worker', action='store_true',
+                        help='Serve newline-delimited JSON requests from stdin')
+    parser.add_argument('--batch', action='store_true',
+                        help='Validate all JSON requests from stdin in parallel')
+    parser.add_argument('--max-workers', type=int,
+                        help='Process count for --batch (default: CPU count)')
 
     args = parser.parse_args()
 
+    if args.worker:
+        run_worker()
+        sys.exit(0)
+
+    if args.batch:
+        run_batch(max_workers=args.max_workers)
+        sys.exit(0)
+
+    if not args.ai_file:
+        parser.error('ai_file is required unless --worker or --batch is given')
+
     # Parse rules
     rules = {}
     if args.rules_json:
@@ -6,9 +6,21 @@ Provides modular validation for AI files used in sign manufacturing.
 Structure:
 - core.py: Data structures (PathInfo, ValidationIssue, ValidationResult, LetterGroup, etc.)
 - svg_parser.py: AI to SVG conversion and path extraction
+- svg_ingest.py: Single-pass SVG walk (shapes, layer context, transforms, scale)
+- pdf_extract.py: Opt-in native vector extraction from PDF-compatible AI files (AI_NATIVE_PDF=1)
+- ai_sniffer.py: Memory-mapped single scan of AI files (version, OCG layers, PDF compatibility)
+- conversion_cache.py: Content-addressed on-disk cache of AI→SVG output
+- geometry_cache.py: On-disk cache of parsed PathInfo geometry (WKB + scalars)
 - transforms.py: SVG transform utilities
 - geometry.py: Geometric utilities (bbox, containment, circles, polygon ops)
+- circle_fit.py: Circle recognition from control points (kappa cubics, arcs, least squares)
+- path_data.py: Native SVG path-data parser producing segment arrays (PathData)
+- path_geometry.py: Lazily computed per-path geometry backing PathInfo fields
+- path_table.py: Columnar (NumPy) view of per-path scalars for vectorized filters/stats
+- buffer_cache.py: Per-validation memo of the letter buffers the containment checks share
+- sampling.py: Vectorized (NumPy) segment sampling and arc lengths for polygon construction
 - letter_analysis.py: Letter-hole geometry analysis (spec-agnostic, returns unclassified holes)
+- hole_sizes.py: Standard hole size catalog (diameter index, category lookups, bulk matching)
 - base_rules.py: Common validation rules (overlaps, strokes, etc.)
 - rules/: Spec-type specific validation rules
   - front_lit.py: Front Lit channel letter rules + hole classification
@@ -16,24 +28,37 @@ Structure:
   - (future: halo_lit.py, non_lit.py, etc.)
 
 Usage:
-    from validation import validate_file
+    from validation import validate_file, validate_files
 
     result = validate_file('/path/to/file.ai', {
         'no_duplicate_overlapping': {'tolerance': 0.01},
         'front_lit_structure': {'check_wire_holes': True},
         'letter_hole_analysis': {'layer': 'return'}
     })
+
+    # Whole order folder, fanned out across CPU cores (results in completion order)
+    for index, result in validate_files(paths, rules_per_file, max_workers=8):
+        print(index, result.file_name, result.status)
 """
 
 import os
-import re
-from typing import Dict, List, Any
+import queue
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Any, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .core import (
     ValidationIssue, ValidationResult, PathInfo,
     LetterGroup, LetterAnalysisResult, HoleInfo
 )
-from .svg_parser import convert_ai_to_svg, extract_paths_from_svg, detect_svg_scale
+from .svg_parser import (
+    convert_ai_to_svg_bytes, iter_convert_many_ai_to_svg, extract_paths_from_svg, detect_svg_scale,
+    non_production_layers
+)
+from .pdf_extract import extract_paths_from_pdf, is_native_candidate
 from .base_rules import (
     check_overlapping_paths,
     check_stroke_requirements,
@@ -45,10 +70,17 @@ from .rules import check_halo_lit_structure, generate_halo_lit_letter_issues
 from .rules import check_push_thru_structure
 from .rules.front_lit import generate_letter_analysis_issues
 from .letter_analysis import analyze_letter_hole_associations
-
-
-_SYSTEM_LAYERS = frozenset(('_no_layer_', '_defs_', '_hidden_'))
-_DEFAULT_LAYER_RE = re.compile(r'^Layer[\s_]\d+$')
+from .hole_sizes import HoleSizeCatalog
+from .path_table import PathTable
+from . import buffer_cache
+
+# Rules that run letter-hole analysis
+_LETTER_ANALYSIS_RULES = (
+    'letter_hole_analysis', 'front_lit_structure', 'front_lit_acrylic_face_structure',
+    'halo_lit_structure', 'push_thru_structure',
+)
+# Rules that read polygon geometry (polygon, area, num_holes)
+_GEOMETRY_RULES = _LETTER_ANALYSIS_RULES + ('structural_mounting_holes',)
 
 
 def filter_production_paths(paths: List[PathInfo]) -> List[PathInfo]:
@@ -64,69 +96,48 @@ def filter_production_paths(paths: List[PathInfo]) -> List[PathInfo]:
         ONLY when named production layers also exist.
         If default layers are the only layers, keeps them
         so non-front-lit files still get analysis.
-    """
-    # Pass 1: Remove system + separator layers
-    paths = [
-        p for p in paths
-        if not (
-            p.layer_name in _SYSTEM_LAYERS
-            or (p.layer_name and not re.search(r'[a-zA-Z0-9]', p.layer_name))
-        )
-    ]
 
-    # Pass 2: Only strip default layers when named production layers exist
-    remaining_layers = set(p.layer_name for p in paths if p.layer_name)
-    has_named_layers = any(
-        not _DEFAULT_LAYER_RE.match(name) for name in remaining_layers
-    )
-    if has_named_layers:
-        paths = [
-            p for p in paths
-            if not (p.layer_name and _DEFAULT_LAYER_RE.match(p.layer_name))
-        ]
-
-    return paths
+    validate_file() already prunes these layers during extraction; this
+    remains for callers that extract without pruning.
+    """
+    dropped = non_production_layers(p.layer_name for p in paths)
+    if not dropped:
+        return paths
+    return [p for p in paths if p.layer_name not in dropped]
 
 
-def _classify_holes_from_standards(analysis: 'LetterAnalysisResult', standard_sizes: list) -> None:
+def _classify_holes_from_standards(analysis: 'LetterAnalysisResult',
+                                   hole_sizes: HoleSizeCatalog) -> None:
     """
     Classify all unclassified holes using standard hole sizes from the database.
     Mutates HoleInfo objects in place — sets hole_type, matched_name, matched_size_id.
+    All circular holes are matched in one vectorized catalog lookup.
     """
-    if not standard_sizes:
+    if not hole_sizes:
         return
 
-    def classify_one(hole):
-        if hole.hole_type != 'unclassified':
-            return
+    holes = [hole for group in analysis.letter_groups for hole in group.holes]
+    holes.extend(analysis.orphan_holes)
+    holes = [hole for hole in holes if hole.hole_type == 'unclassified']
 
-        # Non-circular paths (diameter_real_mm <= 0) can't match standard hole sizes
-        # Set them to 'unknown' so they can be further classified by subsequent steps
+    # Non-circular paths (diameter_real_mm <= 0) can't match standard hole sizes
+    # Set them to 'unknown' so they can be further classified by subsequent steps
+    circular = [hole for hole in holes if hole.diameter_real_mm > 0]
+    for hole in holes:
         if hole.diameter_real_mm <= 0:
             hole.hole_type = 'unknown'
-            return
 
-        # Try to match circular holes to standard sizes
-        best_dist = float('inf')
-        best_match = None
-        for std in standard_sizes:
-            dist = abs(hole.diameter_real_mm - std['diameter_mm'])
-            if dist <= std['tolerance_mm'] and dist < best_dist:
-                best_dist = dist
-                best_match = std
-        if best_match:
+    # Try to match circular holes to standard sizes (nearest within tolerance)
+    matches = hole_sizes.match_many([hole.diameter_real_mm for hole in circular])
+    for hole, row in zip(circular, matches.tolist()):
+        if row >= 0:
+            best_match = hole_sizes.sizes[row]
             hole.hole_type = best_match['category']
             hole.matched_name = best_match['name']
             hole.matched_size_id = best_match.get('hole_size_id')
         else:
             hole.hole_type = 'unknown'
 
-    for group in analysis.letter_groups:
-        for hole in group.holes:
-            classify_one(hole)
-    for hole in analysis.orphan_holes:
-        classify_one(hole)
-
 
 def _classify_unknown_inside_paths(analysis: 'LetterAnalysisResult') -> None:
     """
@@ -172,7 +183,8 @@ def _classify_backer_cutouts(analysis: 'LetterAnalysisResult', backer_layer: str
                 hole.hole_type = 'letter_cutout'
 
 
-def validate_file(ai_path: str, rules: Dict[str, Dict]) -> ValidationResult:
+def validate_file(ai_path: str, rules: Dict[str, Dict],
+                  converted_svg: Optional[str] = None) -> ValidationResult:
     """
     Main validation function.
 
@@ -185,35 +197,34 @@ def validate_file(ai_path: str, rules: Dict[str, Dict]) -> ValidationResult:
                - structural_mounting_holes: Check hole count based on size
                - path_closure: Check paths are closed
                - front_lit_structure: Front Lit channel letter validation
+        converted_svg: SVG already converted from ai_path (see validate_files);
+                       skips conversion. The caller keeps ownership of the file.
 
     Returns:
         ValidationResult with issues and stats
     """
+    # Share each letter's containment-tolerance buffer between the containment
+    # sweep and the per-path checks for the duration of this one validation
+    with buffer_cache.scope() as cache:
+        result = _validate_file(ai_path, rules, converted_svg)
+
+    buf_stats = cache.stats()
+    if buffer_cache.stats_enabled() and (buf_stats['hits'] or buf_stats['misses']):
+        print(f"Buffer cache: {buf_stats['hits']} hits, {buf_stats['misses']} misses "
+              f"({buf_stats['hit_rate']:.0%} hit rate)", file=sys.stderr)
+    return result
+
+
+def _validate_file(ai_path: str, rules: Dict[str, Dict],
+                   converted_svg: Optional[str] = None) -> ValidationResult:
+    """validate_file() body, run inside a buffer cache scope."""
     file_name = os.path.basename(ai_path)
     all_issues: List[ValidationIssue] = []
     stats: Dict[str, Any] = {}
-    temp_svg = None
 
     try:
-        # SVG files don't need conversion — use directly
-        detected_svg_scale = None
-        if ai_path.lower().endswith('.svg'):
-            svg_path = ai_path
-            temp_svg = None  # Don't delete the original!
-            detected_svg_scale = detect_svg_scale(svg_path)
-        else:
-            success, result, temp_svg = convert_ai_to_svg(ai_path)
-            if not success:
-                return ValidationResult(
-                    success=False,
-                    file_path=ai_path,
-                    file_name=file_name,
-                    status='error',
-                    issues=[],
-                    stats={},
-                    error=result
-                )
-            svg_path = result
+        is_svg = ai_path.lower().endswith('.svg')
+        detected_svg_scale = detect_svg_scale(ai_path) if is_svg else None
 
         # Determine file_scale for dynamic polygon sampling
         # Priority: detected SVG scale > rules config > default 0.1
@@ -225,46 +236,92 @@ def validate_file(ai_path: str, rules: Dict[str, Dict]) -> ValidationResult:
         else:
             pre_file_scale = 0.1
 
-        # 1mm in file units: ensures polygon samples are never >1mm apart
+        # 1mm in file units: polygon samples are never >1mm apart (strict for
+        # Bezier segments under adaptive flattening, see flatten_parameters)
         max_point_distance = 1.0 * 72 * pre_file_scale / 25.4
-
-        # Parse paths from SVG
-        # For .svg files, pass None as ai_path to skip binary OCG extraction
-        source_ai_path = None if ai_path.lower().endswith('.svg') else ai_path
-        paths_info = extract_paths_from_svg(svg_path, source_ai_path, max_point_distance)
-
-        # Filter out non-production paths (system layers, separators, default layers)
-        paths_info = filter_production_paths(paths_info)
-
-        # Collect stats
-        layers_found = set(p.layer_name for p in paths_info if p.layer_name)
-        paths_per_layer = {}
-        for p in paths_info:
-            layer = p.layer_name or '_unknown_'
-            paths_per_layer[layer] = paths_per_layer.get(layer, 0) + 1
+        # 0.05mm chord deviation: adaptive flattening densifies tight curves
+        # and emits only endpoints for straight lines
+        flatten_tolerance = 0.05 * 72 * pre_file_scale / 25.4
+
+        # Non-production layers (system, separators, default layers) are pruned
+        # before polygonization. Every production layer is kept: letter analysis
+        # and the layer stats span all of them.
+        # Cheap rules (stroke, closure, overlap) never read circle or corner
+        # geometry: don't compute every field just to fill a cache entry
+        needs_geometry = any(name in rules for name in _GEOMETRY_RULES)
+
+        paths_info = None
+        if not is_svg and converted_svg is None:
+            # PDF-compatible AI files with AI_NATIVE_PDF=1: read the page
+            # content stream directly (authoritative OCG layer names, no
+            # converter startup)
+            paths_info = extract_paths_from_pdf(ai_path, max_point_distance,
+                                                flatten_tolerance=flatten_tolerance,
+                                                prune_layers=True,
+                                                write_cache=needs_geometry)
+
+        if paths_info is None:
+            # SVG files don't need conversion — use directly
+            if is_svg:
+                svg_source = ai_path
+            elif converted_svg is not None:
+                svg_source = converted_svg  # Batch-converted; owned by the caller
+            else:
+                # Converter output stays in memory (no temp SVG on disk)
+                success, result = convert_ai_to_svg_bytes(ai_path)
+                if not success:
+                    return ValidationResult(
+                        success=False,
+                        file_path=ai_path,
+                        file_name=file_name,
+                        status='error',
+                        issues=[],
+                        stats={},
+                        error=result
+                    )
+                svg_source = result
+
+            # Parse paths from SVG
+            # For .svg files, pass None as ai_path to skip binary OCG extraction
+            source_ai_path = None if is_svg else ai_path
+            paths_info = extract_paths_from_svg(svg_source, source_ai_path, max_point_distance,
+                                                flatten_tolerance=flatten_tolerance,
+                                                prune_layers=True,
+                                                write_cache=needs_geometry)
+
+        # Collect stats (vectorized over the columnar view)
+        path_table = PathTable(paths_info)
 
         stats = {
-            'total_paths': len(paths_info),
-            'closed_paths': sum(1 for p in paths_info if p.is_closed),
-            'paths_with_stroke': sum(1 for p in paths_info if p.stroke),
-            'paths_with_fill': sum(1 for p in paths_info if p.fill and p.fill != 'none'),
-            'total_holes': sum(p.num_holes for p in paths_info),
-            'total_area': sum(p.area or 0 for p in paths_info),
-            'total_perimeter': sum(p.length for p in paths_info),
-            'layers': list(layers_found),
-            'paths_per_layer': paths_per_layer
+            'total_paths': len(path_table),
+            'closed_paths': int(path_table.is_closed.sum()),
+            'paths_with_stroke': int(path_table.has_stroke.sum()),
+            'paths_with_fill': int(path_table.has_fill.sum()),
+            'total_holes': int(path_table.num_holes.sum()),
+            'total_area': float(np.nansum(path_table.area)),
+            'total_perimeter': float(path_table.length.sum()),
+            'layers': list(path_table.layers_found()),
+            'paths_per_layer': path_table.paths_per_layer()
         }
 
+        # Standard hole sizes from DB, indexed once for every lookup in this request
+        hole_sizes = HoleSizeCatalog(
+            rules.get('letter_hole_analysis', {}).get('standard_hole_sizes', [])
+        )
+
         # Letter-hole geometry analysis (run before other validations if requested)
         # Returns UNCLASSIFIED holes — spec rules classify them before serialization
         letter_analysis = None
-        if 'letter_hole_analysis' in rules or 'front_lit_structure' in rules or 'front_lit_acrylic_face_structure' in rules or 'halo_lit_structure' in rules or 'push_thru_structure' in rules:
+        if any(name in rules for name in _LETTER_ANALYSIS_RULES):
             analysis_config = rules.get('letter_hole_analysis', {})
 
             # For SVG files with detected unit scale, override file_scale
             if detected_svg_scale is not None:
                 analysis_config = {**analysis_config, 'file_scale': detected_svg_scale}
 
+            # Share the request's catalog with the tiny-circle filter
+            analysis_config = {**analysis_config, '_hole_size_catalog': hole_sizes}
+
             # 1. Geometry analysis — all layers (returns UNCLASSIFIED holes)
             letter_analysis = analyze_letter_hole_associations(
                 paths_info,
@@ -273,9 +330,8 @@ def validate_file(ai_path: str, rules: Dict[str, Dict]) -> ValidationResult:
             )
 
             # 2. Classify holes using standard sizes from DB (if provided)
-            standard_sizes = analysis_config.get('standard_hole_sizes', [])
-            if standard_sizes:
-                _classify_holes_from_standards(letter_analysis, standard_sizes)
+            if hole_sizes:
+                _classify_holes_from_standards(letter_analysis, hole_sizes)
 
             # 2b. Distinguish unknown holes from unknown inside paths (GENERAL RULE)
             _classify_unknown_inside_paths(letter_analysis)
@@ -396,30 +452,24 @@ def validate_file(ai_path: str, rules: Dict[str, Dict]) -> ValidationResult:
             if letter_analysis:
                 front_lit_rules['_letter_analysis'] = letter_analysis
             # Pass standard hole sizes so mounting hole warnings can show expected size
-            analysis_cfg = rules.get('letter_hole_analysis', {})
-            std_sizes = analysis_cfg.get('standard_hole_sizes', [])
-            if std_sizes:
-                front_lit_rules['_standard_hole_sizes'] = std_sizes
+            if hole_sizes:
+                front_lit_rules['_hole_size_catalog'] = hole_sizes
             all_issues.extend(check_front_lit_structure(paths_info, front_lit_rules))
 
         if 'front_lit_acrylic_face_structure' in rules:
             acrylic_rules = rules['front_lit_acrylic_face_structure'].copy()
             if letter_analysis:
                 acrylic_rules['_letter_analysis'] = letter_analysis
-            analysis_cfg = rules.get('letter_hole_analysis', {})
-            std_sizes = analysis_cfg.get('standard_hole_sizes', [])
-            if std_sizes:
-                acrylic_rules['_standard_hole_sizes'] = std_sizes
+            if hole_sizes:
+                acrylic_rules['_hole_size_catalog'] = hole_sizes
             all_issues.extend(check_front_lit_acrylic_face_structure(paths_info, acrylic_rules))
 
         if 'halo_lit_structure' in rules:
             halo_rules = rules['halo_lit_structure'].copy()
             if letter_analysis:
                 halo_rules['_letter_analysis'] = letter_analysis
-            analysis_cfg = rules.get('letter_hole_analysis', {})
-            std_sizes = analysis_cfg.get('standard_hole_sizes', [])
-            if std_sizes:
-                halo_rules['_standard_hole_sizes'] = std_sizes
+            if hole_sizes:
+                halo_rules['_hole_size_catalog'] = hole_sizes
             all_issues.extend(check_halo_lit_structure(paths_info, halo_rules))
 
         if 'push_thru_structure' in rules:
@@ -458,16 +508,193 @@ def validate_file(ai_path: str, rules: Dict[str, Dict]) -> ValidationResult:
             stats=stats,
             error=str(e)
         )
-    finally:
-        if temp_svg and os.path.exists(temp_svg):
+
+
+def _init_pool_worker() -> None:
+    """
+    Point a pool worker's stdout at stderr.
+
+    Results travel back to the parent by pickling, so nothing a worker prints
+    belongs on stdout, which callers such as validate_ai_file.py --batch
+    reserve for their own protocol. The parent's redirect_stdout() does not
+    reach workers started by spawn or forkserver, so each worker redirects
+    both sys.stdout and file descriptor 1 (subprocesses, C extensions).
+    """
+    sys.stdout.flush()
+    try:
+        os.dup2(sys.stderr.fileno(), 1)
+    except (AttributeError, OSError, ValueError):
+        pass  # stderr without a real descriptor: sys.stdout is still redirected
+    sys.stdout = sys.stderr
+
+
+def _error_result(ai_path: str, error: str) -> ValidationResult:
+    """Error result for a file that never produced a validation of its own."""
+    return ValidationResult(
+        success=False,
+        file_path=ai_path,
+        file_name=os.path.basename(ai_path),
+        status='error',
+        issues=[],
+        stats={},
+        error=error
+    )
+
+
+def _start_batch_conversion(ai_paths: Sequence[str], sessions: int,
+                            on_converted: Callable[[str, Tuple[bool, str, Optional[str]]], None],
+                            temp_svgs: List[str]) -> threading.Thread:
+    """
+    Convert ai_paths through shared Inkscape shell sessions in a background thread.
+
+    on_converted(ai_path, (success, svg_path_or_error, temp_svg)) is called
+    from that thread as each file finishes; every path is reported exactly
+    once. Temp SVGs are appended to temp_svgs for the caller to delete.
+    """
+    def convert() -> None:
+        remaining = set(ai_paths)
+        try:
+            for ai_path, outcome in iter_convert_many_ai_to_svg(ai_paths, sessions=sessions):
+                remaining.discard(ai_path)
+                if outcome[2]:
+                    temp_svgs.append(outcome[2])
+                on_converted(ai_path, outcome)
+        except Exception as e:
+            for ai_path in remaining:
+                on_converted(ai_path, (False, f'Conversion error: {e}', None))
+
+    thread = threading.Thread(target=convert, name='ai-batch-conversion', daemon=True)
+    thread.start()
+    return thread
+
+
+def validate_files(paths: Sequence[str], rules_per_file: Sequence[Dict[str, Dict]],
+                   max_workers: Optional[int] = None) -> Iterator[Tuple[int, ValidationResult]]:
+    """
+    Validate many files in parallel, yielding each result as its file finishes.
+
+    Each file is validated independently by validate_file() in its own worker
+    process — Inkscape conversion and shapely analysis are CPU-bound, so this
+    scales with cores rather than being bound by the GIL.
+
+    AI files that need an external converter (not handled by the native PDF
+    extractor) are converted in a background thread through shared Inkscape
+    shell sessions (iter_convert_many_ai_to_svg), so Inkscape starts once per
+    session instead of once per file. Each file goes to the pool as soon as
+    its SVG is ready, overlapping conversion with validation.
+
+    Args:
+        paths: File paths to validate
+        rules_per_file: Rule configuration for each path (same order as paths)
+        max_workers: Process count (default: os.cpu_count(), capped at len(paths))
+
+    Yields:
+        (index, ValidationResult) per file, in completion order (not input
+        order). index is the file's position in paths, so callers can tell
+        apart entries that name the same file with different rules.
+    """
+    if len(paths) != len(rules_per_file):
+        raise ValueError(
+            f'rules_per_file has {len(rules_per_file)} entries for {len(paths)} paths'
+        )
+
+    if not paths:
+        return
+
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+
+    indices: Dict[str, List[int]] = {}
+    for index, ai_path in enumerate(paths):
+        indices.setdefault(ai_path, []).append(index)
+
+    # A lone file is cheaper to convert inside validate_file() than via a shell session
+    to_convert = [p for p in indices if not p.lower().endswith('.svg') and not is_native_candidate(p)]
+    if len(to_convert) <= 1:
+        to_convert = []
+    batched = set(to_convert)
+    temp_svgs: List[str] = []
+    converter: Optional[threading.Thread] = None
+
+    try:
+        # Single worker: skip process spawn + pickling overhead entirely
+        if workers <= 1:
+            conversions: queue.Queue = queue.Queue()
+            if to_convert:
+                converter = _start_batch_conversion(
+                    to_convert, 1, lambda ai_path, outcome: conversions.put((ai_path, outcome)),
+                    temp_svgs)
+            for index, ai_path in enumerate(paths):
+                if ai_path not in batched:
+                    yield index, validate_file(ai_path, rules_per_file[index])
+            for _ in to_convert:
+                ai_path, (success, svg_or_error, _) = conversions.get()
+                for index in indices[ai_path]:
+                    if success:
+                        yield index, validate_file(ai_path, rules_per_file[index], svg_or_error)
+                    else:
+                        # Every converter already failed for this file
+                        yield index, _error_result(ai_path, svg_or_error)
+            return
+
+        # (index, Future or ready ValidationResult) as each file finishes
+        finished: queue.Queue = queue.Queue()
+
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_pool_worker) as executor:
+            def submit(index: int, svg_path: Optional[str] = None) -> None:
+                try:
+                    future = executor.submit(validate_file, paths[index],
+                                             rules_per_file[index], svg_path)
+                except Exception as e:
+                    # Pool already broken (a worker died) — report instead of hanging
+                    finished.put((index, _error_result(paths[index], f'Validation worker failed: {e}')))
+                    return
+                future.add_done_callback(lambda f, index=index: finished.put((index, f)))
+
+            def on_converted(ai_path: str, outcome: Tuple[bool, str, Optional[str]]) -> None:
+                success, svg_or_error, _ = outcome
+                for index in indices[ai_path]:
+                    if success:
+                        submit(index, svg_or_error)
+                    else:
+                        # Every converter already failed for this file
+                        finished.put((index, _error_result(ai_path, svg_or_error)))
+
             try:
-                os.unlink(temp_svg)
-            except Exception:
-                pass
+                if to_convert:
+                    converter = _start_batch_conversion(to_convert, workers, on_converted, temp_svgs)
+                for index, ai_path in enumerate(paths):
+                    if ai_path not in batched:
+                        submit(index)
+
+                for _ in paths:
+                    index, outcome = finished.get()
+                    if isinstance(outcome, ValidationResult):
+                        yield index, outcome
+                        continue
+                    try:
+                        yield index, outcome.result()
+                    except Exception as e:
+                        # Worker process died (e.g. OOM kill) — report, keep draining
+                        yield index, _error_result(paths[index], f'Validation worker failed: {e}')
+            finally:
+                # Keep the pool open until the converter stops submitting to it
+                if converter:
+                    converter.join()
+    finally:
+        if converter:
+            converter.join()
+        for temp_svg in temp_svgs:
+            if os.path.exists(temp_svg):
+                try:
+                    os.unlink(temp_svg)
+                except Exception:
+                    pass
 
 
 __all__ = [
     'validate_file',
+    'validate_files',
     'filter_production_paths',
     'ValidationIssue',
     'ValidationResult',
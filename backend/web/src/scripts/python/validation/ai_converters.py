@@ -5,20 +5,46 @@ Provides conversion functions for different AI file versions using:
 1. Inkscape (primary, handles most modern AI files)
 2. UniConvertor (fallback for legacy formats)
 3. Ghostscript + pdf2svg (fallback for very old formats)
+
+Successful conversions are stored in a content-addressed cache
+(conversion_cache.py) so unchanged files skip the converters entirely.
+
+Batches (iter_convert_many_ai_to_svg_multi) go through one `inkscape --shell`
+session per chunk instead of one Inkscape process per file, reporting each
+file as soon as its output is written; only files the session could not
+convert fall back to the per-file chain.
+
+convert_ai_to_svg_in_memory() keeps the SVG off disk: Inkscape exports to
+stdout, and tools that need real paths (UniConvertor, Ghostscript's PDF for
+pdf2svg) write to scratch_dir(), which prefers tmpfs over the default temp dir.
+
+Environment:
+    AI_SCRATCH_DIR  Directory for converter scratch files (default: /dev/shm
+                    when writable, else the system temp dir)
 """
 
 import os
-import re
+import queue
 import shutil
 import subprocess
 import sys
 import tempfile
-from typing import Tuple, Optional, Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Tuple, Optional, Dict, Iterator, List, Sequence, Set
+
+from . import conversion_cache
+from .ai_sniffer import sniff_ai_file
+
+INKSCAPE_TIMEOUT = 60  # seconds per file, also the stall limit of a shell session
+SHELL_POLL_INTERVAL = 0.2  # seconds between output checks of a shell session
+_TMPFS_DIR = '/dev/shm'
 
 
 def detect_ai_version(ai_path: str) -> Dict[str, any]:
     """
-    Detect Adobe Illustrator version from file header.
+    Detect Adobe Illustrator version from file header (see ai_sniffer.py).
 
     Returns:
         Dict with version info: {
@@ -28,73 +54,51 @@ def detect_ai_version(ai_path: str) -> Dict[str, any]:
         }
     """
     try:
-        with open(ai_path, 'rb') as f:
-            header = f.read(16384)  # Read first 16KB
-
-        try:
-            header_text = header.decode('utf-8', errors='replace')
-        except:
-            header_text = header.decode('latin-1', errors='replace')
-
-        # Try XMP metadata format (modern AI files)
-        xmp_pattern = r'<xmp:CreatorTool>Adobe Illustrator[^\d]*(\d+(?:\.\d+)?)'
-        xmp_match = re.search(xmp_pattern, header_text, re.IGNORECASE)
-
-        if xmp_match:
-            raw_version = xmp_match.group(1)
-            numeric_version = float(raw_version)
-            return {
-                'numeric_version': numeric_version,
-                'display_name': f'AI {raw_version}',
-                'raw_version': raw_version
-            }
-
-        # Try PostScript %%Creator format (older AI files)
-        creator_pattern = r'%%Creator:\s*Adobe Illustrator[^0-9]*(\d+(?:\.\d+)?)'
-        creator_match = re.search(creator_pattern, header_text, re.IGNORECASE)
-
-        if creator_match:
-            raw_version = creator_match.group(1)
-            numeric_version = float(raw_version)
-            return {
-                'numeric_version': numeric_version,
-                'display_name': f'AI {raw_version}',
-                'raw_version': raw_version
-            }
-
-        # Try softwareAgent in XMP
-        agent_pattern = r'<stEvt:softwareAgent>Adobe Illustrator[^\d]*(\d+(?:\.\d+)?)'
-        agent_match = re.search(agent_pattern, header_text, re.IGNORECASE)
-
-        if agent_match:
-            raw_version = agent_match.group(1)
-            numeric_version = float(raw_version)
-            return {
-                'numeric_version': numeric_version,
-                'display_name': f'AI {raw_version}',
-                'raw_version': raw_version
-            }
-
-        return {
-            'numeric_version': None,
-            'display_name': 'Unknown',
-            'raw_version': None
-        }
-
+        info = sniff_ai_file(ai_path)
     except Exception as e:
         print(f"Warning: Could not detect AI version: {e}", file=sys.stderr)
+        info = None
+
+    if info is None or info.raw_version is None:
         return {
             'numeric_version': None,
             'display_name': 'Unknown',
             'raw_version': None
         }
 
+    return {
+        'numeric_version': float(info.raw_version),
+        'display_name': f'AI {info.raw_version}',
+        'raw_version': info.raw_version
+    }
+
 
 def check_converter_available(converter_name: str) -> bool:
     """Check if a converter command is available in PATH."""
     return shutil.which(converter_name) is not None
 
 
+def scratch_dir() -> str:
+    """
+    Directory for converter files that have to exist on disk.
+
+    Prefers tmpfs: the default temp dir can sit on the same network mount as
+    the order folders, where temp-file churn adds latency.
+    """
+    configured = os.environ.get('AI_SCRATCH_DIR')
+    if configured:
+        return configured
+    if os.path.isdir(_TMPFS_DIR) and os.access(_TMPFS_DIR, os.W_OK):
+        return _TMPFS_DIR
+    return tempfile.gettempdir()
+
+
+def is_valid_svg_data(data: bytes) -> bool:
+    """Whether converter output looks like a usable SVG document."""
+    # Check for basic SVG structure in the first 1KB
+    return bool(data) and b'<svg' in data[:1024].lower()
+
+
 def validate_svg_output(svg_path: str) -> bool:
     """
     Validate that SVG output is valid and usable.
@@ -108,16 +112,23 @@ def validate_svg_output(svg_path: str) -> bool:
     if os.path.getsize(svg_path) == 0:
         return False
 
-    # Check for basic SVG structure
     try:
-        with open(svg_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read(1024)  # Read first 1KB
-            if '<svg' not in content.lower():
-                return False
+        with open(svg_path, 'rb') as f:
+            return is_valid_svg_data(f.read(1024))
     except Exception:
         return False
 
-    return True
+
+def _svg_output_complete(svg_path: str) -> bool:
+    """validate_svg_output() plus the closing tag, so a file still being written doesn't count."""
+    if not validate_svg_output(svg_path):
+        return False
+    try:
+        with open(svg_path, 'rb') as f:
+            f.seek(max(0, os.path.getsize(svg_path) - 1024))
+            return b'</svg>' in f.read().lower()
+    except OSError:
+        return False
 
 
 def try_inkscape(ai_path: str, output_svg: str) -> Tuple[bool, str]:
@@ -135,7 +146,7 @@ def try_inkscape(ai_path: str, output_svg: str) -> Tuple[bool, str]:
             ['inkscape', ai_path, '--export-filename=' + output_svg],
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=INKSCAPE_TIMEOUT
         )
 
         if result.returncode != 0:
@@ -147,11 +158,183 @@ def try_inkscape(ai_path: str, output_svg: str) -> Tuple[bool, str]:
         return True, ""
 
     except subprocess.TimeoutExpired:
-        return False, "Inkscape conversion timed out (60s)"
+        return False, f"Inkscape conversion timed out ({INKSCAPE_TIMEOUT}s)"
     except Exception as e:
         return False, f"Inkscape error: {str(e)}"
 
 
+def try_inkscape_to_memory(ai_path: str) -> Tuple[bool, str, Optional[bytes]]:
+    """
+    Try converting AI to SVG using Inkscape, reading the SVG from its stdout.
+
+    Returns:
+        Tuple of (success, error_message, svg_data)
+    """
+    if not check_converter_available('inkscape'):
+        return False, "Inkscape not installed", None
+
+    try:
+        result = subprocess.run(
+            ['inkscape', ai_path, '--export-type=svg', '--export-filename=-'],
+            capture_output=True,
+            timeout=INKSCAPE_TIMEOUT
+        )
+
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', errors='replace')
+            return False, f"Inkscape failed (exit {result.returncode}): {stderr[:200]}", None
+
+        # Drop any console noise printed ahead of the document
+        data = result.stdout
+        starts = [i for i in (data.find(b'<?xml'), data.find(b'<svg')) if i >= 0]
+        data = data[min(starts):] if starts else b''
+        if not is_valid_svg_data(data):
+            return False, "Inkscape produced invalid/empty output", None
+
+        return True, "", data
+
+    except subprocess.TimeoutExpired:
+        return False, f"Inkscape conversion timed out ({INKSCAPE_TIMEOUT}s)", None
+    except Exception as e:
+        return False, f"Inkscape error: {str(e)}", None
+
+
+def _via_scratch_file(converter, ai_path: str) -> Tuple[bool, str, Optional[bytes]]:
+    """Run a file-based converter into scratch_dir() and read the SVG back into memory."""
+    temp_fd, temp_svg = tempfile.mkstemp(suffix='.svg', dir=scratch_dir())
+    os.close(temp_fd)
+    try:
+        success, error = converter(ai_path, temp_svg)
+        if not success:
+            return False, error, None
+        with open(temp_svg, 'rb') as f:
+            return True, "", f.read()
+    except OSError as e:
+        return False, f"Could not read converter output: {e}", None
+    finally:
+        if os.path.exists(temp_svg):
+            os.unlink(temp_svg)
+
+
+def _run_shell_session(jobs: Sequence[Tuple[str, str]],
+                       on_converted: Optional[Callable[[str], None]]) -> Tuple[Set[int], str]:
+    """
+    Run one `inkscape --shell` session over jobs.
+
+    The session is killed once no new output completes for INKSCAPE_TIMEOUT
+    seconds, so one hung file costs a single timeout rather than one per job.
+
+    Returns:
+        Tuple of (indices of jobs whose output is complete, error for the rest)
+    """
+    commands = ''.join(
+        f'file-open:{ai_path}; export-filename:{output_svg}; export-do; file-close\n'
+        for ai_path, output_svg in jobs
+    ) + 'quit\n'
+
+    completed: Set[int] = set()
+    stalled = False
+    # Commands and stderr go through files: a pipe could fill up and block either side
+    with tempfile.TemporaryFile(mode='w+', dir=scratch_dir()) as command_file, \
+            tempfile.TemporaryFile(dir=scratch_dir()) as stderr_file:
+        command_file.write(commands)
+        command_file.flush()
+        command_file.seek(0)
+        process = subprocess.Popen(
+            ['inkscape', '--shell'],
+            stdin=command_file,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file
+        )
+        deadline = time.monotonic() + INKSCAPE_TIMEOUT
+        while True:
+            exited = process.poll() is not None
+            for index, (ai_path, output_svg) in enumerate(jobs):
+                if index not in completed and _svg_output_complete(output_svg):
+                    completed.add(index)
+                    deadline = time.monotonic() + INKSCAPE_TIMEOUT
+                    if on_converted:
+                        on_converted(ai_path)
+            if exited:
+                break
+            if time.monotonic() > deadline:
+                process.kill()
+                process.wait()
+                stalled = True
+                break
+            time.sleep(SHELL_POLL_INTERVAL)
+
+        if stalled:
+            error = f"Inkscape shell session stalled (no output for {INKSCAPE_TIMEOUT}s)"
+        elif process.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', errors='replace')
+            error = f"Inkscape shell failed (exit {process.returncode}): {stderr[-200:]}"
+        else:
+            error = "Inkscape produced invalid/empty output"
+    return completed, error
+
+
+def try_inkscape_batch(jobs: Sequence[Tuple[str, str]],
+                       on_converted: Optional[Callable[[str], None]] = None
+                       ) -> Dict[str, Tuple[bool, str]]:
+    """
+    Convert several AI files in one `inkscape --shell` session.
+
+    Inkscape's startup dominates a single conversion, so the session opens,
+    exports and closes each file in turn. Outputs appear in job order: when the
+    session dies or stalls on a file, that file is reported as failed and the
+    files after it are retried in a fresh session. A session that converts
+    nothing at all (e.g. an Inkscape without the file-open/export-do actions)
+    fails every remaining job instead of being relaunched per file.
+
+    Args:
+        jobs: (ai_path, output_svg) pairs
+        on_converted: Called with each ai_path as soon as its output is complete
+
+    Returns:
+        Dict of ai_path -> (success, error_message) for every job
+    """
+    if not check_converter_available('inkscape'):
+        return {ai_path: (False, "Inkscape not installed") for ai_path, _ in jobs}
+
+    results: Dict[str, Tuple[bool, str]] = {}
+    pending = []
+    for ai_path, output_svg in jobs:
+        # Shell actions are separated by ';' and newlines — such paths can't be quoted
+        if any(ch in path for path in (ai_path, output_svg) for ch in ';\r\n'):
+            results[ai_path] = (False, "Path not usable in Inkscape shell mode")
+        else:
+            pending.append((ai_path, output_svg))
+
+    while pending:
+        try:
+            completed, error = _run_shell_session(pending, on_converted)
+        except Exception as e:
+            for ai_path, _ in pending:
+                results[ai_path] = (False, f"Inkscape error: {str(e)}")
+            break
+
+        for index in completed:
+            results[pending[index][0]] = (True, "")
+        if not completed:
+            for ai_path, _ in pending:
+                results[ai_path] = (False, error)
+            break
+
+        # Files before the last output were skipped by the session: genuine
+        # failures. The first file after it is the one the session died on.
+        last = max(completed)
+        for ai_path, _ in pending[:last]:
+            results.setdefault(ai_path, (False, error))
+        retry = pending[last + 1:]
+        if retry:
+            results[retry[0][0]] = (False, error)
+        pending = retry[1:]
+
+    return results
+
+
 def try_uniconvertor(ai_path: str, output_svg: str) -> Tuple[bool, str]:
     """
     Try converting AI to SVG using UniConvertor.
@@ -206,7 +389,7 @@ def try_ghostscript_pdf2svg(ai_path: str, output_svg: str) -> Tuple[bool, str]:
     temp_pdf = None
     try:
         # Stage 1: AI → PDF using Ghostscript
-        temp_fd, temp_pdf = tempfile.mkstemp(suffix='.pdf')
+        temp_fd, temp_pdf = tempfile.mkstemp(suffix='.pdf', dir=scratch_dir())
         os.close(temp_fd)
 
         gs_result = subprocess.run(
@@ -252,11 +435,13 @@ def try_ghostscript_pdf2svg(ai_path: str, output_svg: str) -> Tuple[bool, str]:
                 pass
 
 
-def convert_ai_to_svg_multi(ai_path: str, output_svg: str) -> Tuple[bool, str, List[str]]:
+def convert_ai_to_svg_multi(ai_path: str, output_svg: str,
+                            use_cache: bool = True) -> Tuple[bool, str, List[str]]:
     """
     Convert AI file to SVG using multiple converter fallbacks.
 
-    Tries converters in priority order:
+    Checks the conversion cache first (keyed by file content + converter
+    toolchain), then tries converters in priority order:
     1. Inkscape (best for modern AI files)
     2. UniConvertor (good for legacy formats)
     3. Ghostscript + pdf2svg (fallback for very old formats)
@@ -264,6 +449,7 @@ def convert_ai_to_svg_multi(ai_path: str, output_svg: str) -> Tuple[bool, str, L
     Args:
         ai_path: Path to input AI file
         output_svg: Path where SVG should be written
+        use_cache: Check/populate the on-disk conversion cache
 
     Returns:
         Tuple of (success, error_message, attempted_converters)
@@ -280,27 +466,189 @@ def convert_ai_to_svg_multi(ai_path: str, output_svg: str) -> Tuple[bool, str, L
 
     attempts = []
 
-    # Try Inkscape first (best for modern AI files)
-    success, error = try_inkscape(ai_path, output_svg)
-    attempts.append(f"Inkscape: {'✓ success' if success else error}")
-    if success:
-        return True, f"Converted using Inkscape ({version_str})", attempts
-
-    # Try UniConvertor (good for legacy formats)
-    success, error = try_uniconvertor(ai_path, output_svg)
-    attempts.append(f"UniConvertor: {'✓ success' if success else error}")
-    if success:
-        return True, f"Converted using UniConvertor ({version_str})", attempts
-
-    # Try Ghostscript + pdf2svg (fallback)
-    success, error = try_ghostscript_pdf2svg(ai_path, output_svg)
-    attempts.append(f"Ghostscript+pdf2svg: {'✓ success' if success else error}")
-    if success:
-        return True, f"Converted using Ghostscript+pdf2svg ({version_str})", attempts
-
-    # All converters failed
+    # Content-addressed cache: unchanged file + same toolchain → reuse SVG
+    cache_key = None
+    if use_cache:
+        try:
+            cache_key = conversion_cache.cache_key(ai_path)
+        except OSError as e:
+            print(f"Warning: Could not hash AI file for SVG cache: {e}", file=sys.stderr)
+        if cache_key and conversion_cache.lookup(cache_key, output_svg):
+            if validate_svg_output(output_svg):
+                attempts.append("Cache: ✓ hit")
+                return True, f"Converted using cache ({version_str})", attempts
+            attempts.append("Cache: invalid entry, reconverting")
+
+    converters = [
+        ('Inkscape', try_inkscape),               # best for modern AI files
+        ('UniConvertor', try_uniconvertor),       # good for legacy formats
+        ('Ghostscript+pdf2svg', try_ghostscript_pdf2svg),  # fallback
+    ]
+    for name, converter in converters:
+        success, error = converter(ai_path, output_svg)
+        attempts.append(f"{name}: {'✓ success' if success else error}")
+        if success:
+            if cache_key:
+                conversion_cache.store(cache_key, output_svg)
+            return True, f"Converted using {name} ({version_str})", attempts
+
+    return False, _all_failed_message(ai_path, version_str, attempts), attempts
+
+
+def convert_ai_to_svg_in_memory(ai_path: str, use_cache: bool = True
+                                ) -> Tuple[bool, str, List[str], Optional[bytes]]:
+    """
+    convert_ai_to_svg_multi() without an output file: the SVG is returned as bytes.
+
+    Inkscape exports to stdout; UniConvertor and Ghostscript+pdf2svg need
+    real paths and go through scratch_dir() (tmpfs when available).
+
+    Returns:
+        Tuple of (success, error_message, attempted_converters, svg_data)
+    """
+    if not os.path.exists(ai_path):
+        return False, f"File not found: {ai_path}", [], None
+
+    version_str = detect_ai_version(ai_path)['display_name']
+    attempts = []
+
+    cache_key = None
+    if use_cache:
+        try:
+            cache_key = conversion_cache.cache_key(ai_path)
+        except OSError as e:
+            print(f"Warning: Could not hash AI file for SVG cache: {e}", file=sys.stderr)
+        cached = conversion_cache.read(cache_key) if cache_key else None
+        if cached is not None:
+            if is_valid_svg_data(cached):
+                attempts.append("Cache: ✓ hit")
+                return True, f"Converted using cache ({version_str})", attempts, cached
+            attempts.append("Cache: invalid entry, reconverting")
+
+    converters = [
+        ('Inkscape', try_inkscape_to_memory),
+        ('UniConvertor', partial(_via_scratch_file, try_uniconvertor)),
+        ('Ghostscript+pdf2svg', partial(_via_scratch_file, try_ghostscript_pdf2svg)),
+    ]
+    for name, converter in converters:
+        success, error, data = converter(ai_path)
+        attempts.append(f"{name}: {'✓ success' if success else error}")
+        if success:
+            if cache_key:
+                conversion_cache.store_data(cache_key, data)
+            return True, f"Converted using {name} ({version_str})", attempts, data
+
+    return False, _all_failed_message(ai_path, version_str, attempts), attempts, None
+
+
+def _all_failed_message(ai_path: str, version_str: str, attempts: List[str]) -> str:
     error_msg = f"All converters failed for {version_str} file.\n"
     error_msg += "Attempted:\n" + "\n".join(f"  - {a}" for a in attempts)
     error_msg += "\n\nSuggestion: Check if file is corrupted or install missing converters."
+    try:
+        if not sniff_ai_file(ai_path).pdf_compatible:
+            error_msg += ("\nThis file was saved without PDF compatibility — re-save it from "
+                          "Illustrator with 'Create PDF Compatible File' enabled.")
+    except OSError:
+        pass
+    return error_msg
+
+
+def iter_convert_many_ai_to_svg_multi(jobs: Sequence[Tuple[str, str]], use_cache: bool = True,
+                                      sessions: int = 1
+                                      ) -> Iterator[Tuple[str, Tuple[bool, str, List[str]]]]:
+    """
+    Convert many AI files, sharing Inkscape shell sessions between them.
 
-    return False, error_msg, attempts
+    Cache hits are served first; the rest are split across `sessions`
+    concurrent Inkscape shells. Each file is yielded as soon as its SVG is
+    written, so callers can start on it while the session carries on. Files
+    the shell could not convert go through convert_ai_to_svg_multi() one at a
+    time, so a single bad file never fails the batch.
+
+    Args:
+        jobs: (ai_path, output_svg) pairs
+        use_cache: Check/populate the on-disk conversion cache
+        sessions: Number of Inkscape shell sessions to run in parallel
+
+    Yields:
+        (ai_path, (success, error_message, attempted_converters)) per file, as
+        returned by convert_ai_to_svg_multi(), in completion order
+    """
+    cache_keys: Dict[str, str] = {}
+    batch = []
+
+    for ai_path, output_svg in dict(jobs).items():
+        if not os.path.exists(ai_path):
+            yield ai_path, (False, f"File not found: {ai_path}", [])
+            continue
+        if use_cache:
+            try:
+                cache_keys[ai_path] = conversion_cache.cache_key(ai_path)
+            except OSError as e:
+                print(f"Warning: Could not hash AI file for SVG cache: {e}", file=sys.stderr)
+            key = cache_keys.get(ai_path)
+            if key and conversion_cache.lookup(key, output_svg) and validate_svg_output(output_svg):
+                version_str = detect_ai_version(ai_path)['display_name']
+                yield ai_path, (True, f"Converted using cache ({version_str})", ["Cache: ✓ hit"])
+                continue
+        batch.append((ai_path, output_svg))
+
+    if not batch:
+        return
+
+    finished: queue.Queue = queue.Queue()
+
+    def convert_chunk(chunk: List[Tuple[str, str]]) -> None:
+        outputs = dict(chunk)
+        reported = set()
+
+        def report(ai_path: str, result: Tuple[bool, str, List[str]]) -> None:
+            reported.add(ai_path)
+            finished.put((ai_path, result))
+
+        def on_converted(ai_path: str) -> None:
+            key = cache_keys.get(ai_path)
+            if key:
+                conversion_cache.store(key, outputs[ai_path])
+            version_str = detect_ai_version(ai_path)['display_name']
+            report(ai_path, (True, f"Converted using Inkscape shell ({version_str})",
+                             ["Inkscape shell: ✓ success"]))
+
+        try:
+            shell_results = try_inkscape_batch(chunk, on_converted=on_converted)
+            fallback = [(ai_path, output_svg, shell_results[ai_path][1])
+                        for ai_path, output_svg in chunk if not shell_results[ai_path][0]]
+            if fallback:
+                print(f"Inkscape shell: {len(chunk) - len(fallback)}/{len(chunk)} converted, "
+                      f"{len(fallback)} falling back to per-file converters", file=sys.stderr)
+            for ai_path, output_svg, error in fallback:
+                # Cache was already checked above
+                success, message, attempts = convert_ai_to_svg_multi(ai_path, output_svg,
+                                                                     use_cache=False)
+                if success and cache_keys.get(ai_path):
+                    conversion_cache.store(cache_keys[ai_path], output_svg)
+                report(ai_path, (success, message, [f"Inkscape shell: {error}"] + attempts))
+        except Exception as e:
+            for ai_path, _ in chunk:
+                if ai_path not in reported:
+                    report(ai_path, (False, f"Conversion error: {str(e)}", []))
+
+    sessions = max(1, min(sessions, len(batch)))
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        for i in range(sessions):
+            executor.submit(convert_chunk, batch[i::sessions])
+        for _ in batch:
+            yield finished.get()
+
+
+def convert_many_ai_to_svg_multi(jobs: Sequence[Tuple[str, str]], use_cache: bool = True,
+                                 sessions: int = 1) -> Dict[str, Tuple[bool, str, List[str]]]:
+    """
+    iter_convert_many_ai_to_svg_multi() collected into a dict.
+
+    Returns:
+        Dict of ai_path -> (success, error_message, attempted_converters),
+        as returned by convert_ai_to_svg_multi() for each file
+    """
+    return dict(iter_convert_many_ai_to_svg_multi(jobs, use_cache=use_cache, sessions=sessions))
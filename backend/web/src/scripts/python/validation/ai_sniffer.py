@@ -0,0 +1,157 @@
+"""
+Single-scan AI file sniffer.
+
+Several stages need a little information out of the raw .ai bytes: the
+converters want the Illustrator version for their messages, layer mapping
+needs the OCG (layer) names, and extract_ai_version.py reports the version
+to the backend. Each used to open the file itself — extract_layer_names_from_ai
+read the entire file into memory just to regex for /Type/OCG, which spikes
+worker RSS on 200 MB+ files with embedded rasters.
+
+sniff_ai_file() memory-maps the file instead and scans it once:
+- version markers in the 16 KB header (XMP CreatorTool, %%Creator, softwareAgent)
+- every OCG layer name, in file order
+- PDF compatibility (%PDF-x.y header vs. legacy PostScript-only files)
+- the first page box (/MediaBox, falling back to /ArtBox)
+
+Results are memoized per process on file identity (path, size, mtime), like
+conversion_cache.file_digest(), so repeated callers share one scan.
+sniff_ai_header() reads only the header, for callers that just need the
+version.
+
+This module only uses the standard library and imports nothing from the
+package, so stdlib-only scripts (extract_ai_version.py) load it by file
+path without running validation/__init__.py and its numpy/shapely imports.
+"""
+
+import mmap
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+HEADER_SIZE = 16384  # XMP metadata can sit a few KB into the file
+
+# Version patterns in priority order
+_VERSION_PATTERNS = (
+    # XMP metadata format (modern AI files)
+    re.compile(r'<xmp:CreatorTool>Adobe Illustrator[^\d]*(\d+(?:\.\d+)?)', re.IGNORECASE),
+    # PostScript %%Creator format (older AI files)
+    re.compile(r'%%Creator:\s*Adobe Illustrator[^0-9]*(\d+(?:\.\d+)?)', re.IGNORECASE),
+    # softwareAgent in XMP (sometimes version differs)
+    re.compile(r'<stEvt:softwareAgent>Adobe Illustrator[^\d]*(\d+(?:\.\d+)?)', re.IGNORECASE),
+)
+_CREATOR_PATTERN = re.compile(r'%%Creator:\s*([^\n\r]+)')
+_PDF_HEADER_PATTERN = re.compile(rb'%PDF-(\d+\.\d+)')
+
+# One pass over the whole file: OCG names and page boxes
+_BODY_PATTERN = re.compile(
+    rb'/Name\(([^)]+)\)/Type/OCG'
+    rb'|/(MediaBox|ArtBox)\s*\[\s*([-\d.\s]+?)\s*\]'
+)
+
+
+@dataclass(frozen=True)
+class AiFileInfo:
+    """What sniff_ai_file() learned about one AI file."""
+    size: int
+    raw_version: Optional[str] = None      # e.g. '24.0' (None if no Illustrator marker)
+    creator: Optional[str] = None          # Raw %%Creator line, if any
+    ocg_names: Tuple[str, ...] = ()        # Layer names in file order
+    pdf_compatible: bool = False           # Saved with "Create PDF Compatible File"
+    pdf_version: Optional[str] = None      # e.g. '1.6'
+    page_box: Optional[Tuple[float, float, float, float]] = None  # x0, y0, x1, y1 in points
+
+    @property
+    def numeric_version(self) -> Optional[float]:
+        try:
+            return float(self.raw_version) if self.raw_version else None
+        except ValueError:
+            return None
+
+
+def sniff_ai_file(ai_path: str) -> AiFileInfo:
+    """
+    Scan an AI file once (memory-mapped) for version, layers and PDF details.
+
+    Raises:
+        OSError when the file cannot be opened or read
+    """
+    st = os.stat(ai_path)
+    return _sniff(os.path.abspath(ai_path), st.st_size, st.st_mtime_ns)
+
+
+def sniff_ai_header(ai_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read only the header of an AI file for its version markers.
+
+    Returns:
+        (raw_version, creator) as in AiFileInfo
+
+    Raises:
+        OSError when the file cannot be opened or read
+    """
+    with open(ai_path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    return _parse_header(header)
+
+
+def _parse_header(header: bytes) -> Tuple[Optional[str], Optional[str]]:
+    header_text = header.decode('utf-8', errors='replace')
+
+    raw_version = None
+    for pattern in _VERSION_PATTERNS:
+        match = pattern.search(header_text)
+        if match:
+            raw_version = match.group(1)
+            break
+
+    creator_match = _CREATOR_PATTERN.search(header_text)
+    return raw_version, creator_match.group(1).strip() if creator_match else None
+
+
+@lru_cache(maxsize=64)
+def _sniff(abs_path: str, size: int, mtime_ns: int) -> AiFileInfo:
+    if size == 0:
+        return AiFileInfo(size=0)
+
+    with open(abs_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        header = mm[:HEADER_SIZE]
+        raw_version, creator = _parse_header(header)
+        pdf_match = _PDF_HEADER_PATTERN.match(header)
+
+        ocg_names = []
+        boxes = {}
+        for match in _BODY_PATTERN.finditer(mm):
+            if match.group(1) is not None:
+                try:
+                    ocg_names.append(match.group(1).decode('utf-8'))
+                except UnicodeDecodeError:
+                    pass
+            elif match.group(2) not in boxes:
+                box = _parse_box(match.group(3))
+                if box:
+                    boxes[match.group(2)] = box
+
+    return AiFileInfo(
+        size=size,
+        raw_version=raw_version,
+        creator=creator,
+        ocg_names=tuple(ocg_names),
+        pdf_compatible=pdf_match is not None,
+        pdf_version=pdf_match.group(1).decode('ascii') if pdf_match else None,
+        page_box=boxes.get(b'MediaBox') or boxes.get(b'ArtBox'),
+    )
+
+
+def _parse_box(raw: bytes) -> Optional[Tuple[float, float, float, float]]:
+    try:
+        values = [float(v) for v in raw.split()]
+    except ValueError:
+        return None
+    return tuple(values) if len(values) == 4 else None
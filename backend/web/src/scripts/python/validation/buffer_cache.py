@@ -0,0 +1,142 @@
+"""
+Per-validation memo of shapely buffer() results.
+
+The containment checks share one buffer per letter: polygon_contains_many()
+buffers each letter by the containment tolerance during the per-layer sweep,
+and point_in_polygon() / polygon_contains() buffer the same letter by the
+same tolerance again for every candidate path tested against it. The trim
+cap and cutout offset helpers (buffer_polygon_with_mitre(),
+buffer_polygon_round()) go through the same cache, so a letter offset by
+the same distance and join style by more than one rule is buffered once.
+
+Entries are keyed on geometry identity (id), distance, join style and mitre
+limit. The cache holds a reference to each source geometry so an id cannot
+be recycled while its entry is alive. A cache only exists inside a scope()
+block — validate_file() opens one per call — so nothing outlives a single
+validation (important for long-lived --worker processes). Outside a scope,
+buffers are computed directly.
+
+Usage:
+    with buffer_cache.scope() as cache:
+        ...  # geometry helpers reuse buffers here
+    print(cache.stats())  # {'hits': ..., 'misses': ..., 'hit_rate': ...}
+
+Environment:
+    AI_BUFFER_CACHE_STATS  Set to 1 to print hit/miss counts per validation
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import shapely
+except ImportError:
+    shapely = None
+
+# join_style values for keys (shapely accepts the names directly)
+JOIN_ROUND = 'round'
+JOIN_MITRE = 'mitre'
+
+
+class BufferCache:
+    """Memo of buffer() results for one validation run."""
+
+    def __init__(self):
+        self._entries: Dict[Tuple, Tuple[object, object]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(geom, distance: float, join_style: str, mitre_limit: float) -> Tuple:
+        return (id(geom), float(distance), join_style, float(mitre_limit))
+
+    def buffer(self, geom, distance: float, join_style: str = JOIN_ROUND,
+               mitre_limit: float = 5.0):
+        """Buffered geometry, computed on first request."""
+        key = self._key(geom, distance, join_style, mitre_limit)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = geom.buffer(distance, join_style=join_style, mitre_limit=mitre_limit)
+        self._entries[key] = (geom, result)
+        return result
+
+    def buffer_many(self, geoms: List, distance: float, join_style: str = JOIN_ROUND,
+                    mitre_limit: float = 5.0) -> List:
+        """Buffer a list of geometries; misses are computed in one vectorized call."""
+        results: List = [None] * len(geoms)
+        missing = []
+        for i, geom in enumerate(geoms):
+            entry = self._entries.get(self._key(geom, distance, join_style, mitre_limit))
+            if entry is not None:
+                self.hits += 1
+                results[i] = entry[1]
+            else:
+                missing.append(i)
+
+        if missing:
+            self.misses += len(missing)
+            computed = shapely.buffer([geoms[i] for i in missing], distance,
+                                      join_style=join_style, mitre_limit=mitre_limit)
+            for i, result in zip(missing, computed):
+                key = self._key(geoms[i], distance, join_style, mitre_limit)
+                self._entries[key] = (geoms[i], result)
+                results[i] = result
+        return results
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_active: Optional[BufferCache] = None
+
+
+def stats_enabled() -> bool:
+    return os.environ.get('AI_BUFFER_CACHE_STATS', '0') == '1'
+
+
+def active() -> Optional[BufferCache]:
+    """The cache of the enclosing scope(), or None outside one."""
+    return _active
+
+
+@contextmanager
+def scope() -> Iterator[BufferCache]:
+    """Activate a fresh buffer cache for the duration of the block."""
+    global _active
+    previous = _active
+    _active = BufferCache()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+def buffer(geom, distance: float, join_style: str = JOIN_ROUND, mitre_limit: float = 5.0):
+    """buffer() through the active cache, or directly when no scope is open."""
+    if _active is None:
+        return geom.buffer(distance, join_style=join_style, mitre_limit=mitre_limit)
+    return _active.buffer(geom, distance, join_style, mitre_limit)
+
+
+def buffer_many(geoms: List, distance: float, join_style: str = JOIN_ROUND,
+                mitre_limit: float = 5.0) -> List:
+    """Vectorized buffer() through the active cache, or directly when no scope is open."""
+    if _active is None:
+        return list(shapely.buffer(geoms, distance, join_style=join_style,
+                                   mitre_limit=mitre_limit))
+    return _active.buffer_many(geoms, distance, join_style, mitre_limit)
@@ -0,0 +1,179 @@
+"""
+Circle / ellipse recognition from path control points.
+
+is_circle_path() used to compare the bbox aspect ratio and the integrated
+arc length against 3.14159 * d. fit_circle() reads the segment arrays
+(path_data.PathData) directly instead:
+
+- Arc paths: every arc shares one center and radius (SVG <circle> and
+  <ellipse> elements convert to two or four arcs).
+- Cubic paths: the endpoints lie on a common circle and every handle is
+  tangent with the length 4/3 * tan(sweep / 4) * r, i.e. the kappa arcs
+  Illustrator emits (four quarter arcs with handles 0.5523 * r).
+- Anything else: a least-squares (Kåsa) circle fit on points sampled from
+  all segments at once.
+
+Each route returns a CircleFit with the center, diameter and the fit
+residual: the largest deviation from the fitted circle, relative to its
+radius. Near-circular ellipses show up as a residual of about
+(rx - ry) / (rx + ry), and their diameter is rx + ry — the bbox mean the
+old test reported.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .path_data import PathData
+from .sampling import SEG_CUBIC, SEG_ARC, sample_points
+
+# Largest relative residual still reported as a circle. Calibrated to the old
+# 0.98 bbox aspect-ratio bound: a 0.98 ellipse fits with a residual of about
+# 0.0103 ((1 - 0.98) / (1 + 0.98) plus the sampled fit's bias), a 0.979 one
+# with 0.0107; 16-gons (0.0128) stay out.
+CIRCLE_TOLERANCE = 0.0105
+
+# Samples per segment for the least-squares fallback
+_FIT_SAMPLES_PER_SEGMENT = 8
+
+# Sweep tolerance for "goes all the way round" (radians)
+_FULL_TURN_TOLERANCE = 0.02 * math.pi
+
+
+@dataclass(frozen=True)
+class CircleFit:
+    """Circle fitted to one path."""
+    center: Tuple[float, float]
+    diameter: float                 # File units
+    residual: float                 # Max deviation from the circle / radius
+    method: str                     # 'arc', 'kappa' or 'lsq'
+
+    @property
+    def is_circle(self) -> bool:
+        return self.residual <= CIRCLE_TOLERANCE
+
+
+def fit_circle(data: PathData) -> Optional[CircleFit]:
+    """
+    Fit a circle to a single closed subpath.
+
+    Returns:
+        CircleFit, or None when the path cannot be a circle (open, compound,
+        fewer than two segments, degenerate)
+    """
+    n = len(data)
+    if n < 2 or not data.iscontinuous():
+        return None
+
+    ctrl = data.arrays.ctrl
+    kinds = data.arrays.kinds
+    try:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if (kinds == SEG_ARC).all():
+                fit = _fit_arcs(data)
+            elif (kinds == SEG_CUBIC).all() and n >= 3:
+                fit = _fit_kappa_cubics(ctrl)
+            else:
+                fit = None
+            # Control-point checks only confirm; anything else gets the sampled fit
+            if fit is None or not fit.is_circle:
+                fit = _fit_least_squares(data)
+    except (ValueError, np.linalg.LinAlgError):
+        return None
+
+    if fit is None or not math.isfinite(fit.residual) or fit.diameter <= 0:
+        return None
+    # Must come back to its start (a circle is closed)
+    if abs(ctrl[0, 0] - ctrl[-1, 3]) > CIRCLE_TOLERANCE * fit.diameter:
+        return None
+    return fit
+
+
+def _fit_arcs(data: PathData) -> Optional[CircleFit]:
+    """Arc-only path: one shared center and radius going a full turn."""
+    arc = data.arrays.arc
+    cx, cy, rx, ry, delta = arc[:, 0], arc[:, 1], arc[:, 2], arc[:, 3], arc[:, 7]
+    if abs(np.abs(delta).sum() - 360) * math.pi / 180 > _FULL_TURN_TOLERANCE:
+        return None
+
+    r = float((rx + ry).mean()) / 2
+    if r <= 0:
+        return None
+    center_x = float(cx.mean())
+    center_y = float(cy.mean())
+    spread = max(float(np.abs(rx - r).max()), float(np.abs(ry - r).max()),
+                 float(np.hypot(cx - center_x, cy - center_y).max()))
+    return CircleFit((center_x, center_y), 2 * r, spread / r, 'arc')
+
+
+def _fit_kappa_cubics(ctrl: np.ndarray) -> Optional[CircleFit]:
+    """Cubic-only path: endpoints on one circle, tangent handles of kappa length."""
+    p0, p1, p2, p3 = ctrl[:, 0], ctrl[:, 1], ctrl[:, 2], ctrl[:, 3]
+    center = _kasa_center(np.column_stack((p0.real, p0.imag)))
+    if center is None:
+        return None
+    c = complex(*center)
+
+    u0 = p0 - c
+    u3 = p3 - c
+    radii = np.abs(u0)
+    r = float(radii.mean())
+    if r <= 0:
+        return None
+
+    # Signed sweep of every cubic; all must turn the same way, a full turn in total
+    sweep = np.angle(u3 / u0)
+    direction = np.sign(sweep)
+    if not (direction == direction[0]).all() or direction[0] == 0:
+        return None
+    if abs(np.abs(sweep).sum() - 2 * math.pi) > _FULL_TURN_TOLERANCE:
+        return None
+
+    # Control points of the exact circular arc with these endpoints
+    handle = 4 / 3 * np.tan(np.abs(sweep) / 4)
+    tangent = 1j * direction[0]
+    expected_p1 = p0 + handle * tangent * u0
+    expected_p2 = p3 - handle * tangent * u3
+
+    deviation = max(float(np.abs(radii - r).max()),
+                    float(np.abs(np.abs(u3) - r).max()),
+                    float(np.abs(p1 - expected_p1).max()),
+                    float(np.abs(p2 - expected_p2).max()))
+    return CircleFit(center, 2 * r, deviation / r, 'kappa')
+
+
+def _fit_least_squares(data: PathData) -> Optional[CircleFit]:
+    """Kåsa fit on points sampled from every segment in one batch."""
+    counts = np.full(len(data), _FIT_SAMPLES_PER_SEGMENT, dtype=np.int64)
+    points = sample_points(data.arrays, counts)
+    center = _kasa_center(points)
+    if center is None:
+        return None
+
+    dist = np.hypot(points[:, 0] - center[0], points[:, 1] - center[1])
+    r = float(dist.mean())
+    if r <= 0:
+        return None
+    residual = float(np.abs(dist - r).max()) / r
+    return CircleFit(center, 2 * r, residual, 'lsq')
+
+
+def _kasa_center(points: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Algebraic least-squares circle center of (N, 2) points.
+
+    Solves x^2 + y^2 + D x + E y + F = 0 in the least-squares sense, on
+    points shifted to their centroid for conditioning.
+    """
+    if len(points) < 3:
+        return None
+    origin = points.mean(axis=0)
+    x = points[:, 0] - origin[0]
+    y = points[:, 1] - origin[1]
+    a = np.column_stack((x, y, np.ones(len(x))))
+    (d, e, _), _, rank, _ = np.linalg.lstsq(a, -(x * x + y * y), rcond=None)
+    if rank < 3:
+        return None
+    return float(origin[0] - d / 2), float(origin[1] - e / 2)
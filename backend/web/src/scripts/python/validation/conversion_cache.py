@@ -0,0 +1,216 @@
+"""
+Content-addressed on-disk cache for AI→SVG conversion output.
+
+Converting an AI file with Inkscape can take up to 60s, and re-validating an
+order after a rule-profile change converts the exact same bytes again. Entries
+are keyed by a SHA-256 of the AI file contents plus a fingerprint of the
+installed converter toolchain, so editing the file or upgrading Inkscape
+naturally misses the cache.
+
+The cache is size-bounded with LRU eviction (entry mtime is bumped on every hit).
+
+Environment:
+    AI_SVG_CACHE_DIR     Cache directory (default: <tmpdir>/nexus_ai_svg_cache)
+    AI_SVG_CACHE_MAX_MB  Size bound in MB (default: 512, 0 disables the cache)
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from functools import lru_cache
+from typing import Optional
+
+# Bump when the cached SVG would differ for the same input (e.g. new converter flags)
+CACHE_FORMAT_VERSION = 1
+
+_CONVERTER_BINARIES = ('inkscape', 'uniconvertor', 'uniconv', 'gs', 'pdf2svg')
+_HASH_CHUNK_SIZE = 1024 * 1024
+_DEFAULT_MAX_MB = 512
+
+
+def cache_dir() -> str:
+    """Directory holding cached SVG entries."""
+    return os.environ.get('AI_SVG_CACHE_DIR') or os.path.join(
+        tempfile.gettempdir(), 'nexus_ai_svg_cache'
+    )
+
+
+def cache_max_bytes() -> int:
+    """Configured size bound in bytes (0 = cache disabled)."""
+    try:
+        max_mb = float(os.environ.get('AI_SVG_CACHE_MAX_MB', _DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = _DEFAULT_MAX_MB
+    return max(0, int(max_mb * 1024 * 1024))
+
+
+def file_digest(path: str) -> str:
+    """
+    SHA-256 hex digest of a file's contents, read in chunks.
+
+    Memoized per process on (path, size, mtime) so the conversion and
+    geometry caches can both key on the same file without hashing it twice.
+    """
+    st = os.stat(path)
+    return _file_digest(os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def converter_fingerprint() -> str:
+    """
+    Identity of the installed converter toolchain.
+
+    Uses each binary's resolved path, size and mtime rather than running
+    `inkscape --version`, which would cost a full Inkscape startup. Any
+    upgrade or reinstall changes the fingerprint and invalidates entries.
+    """
+    parts = [f'v{CACHE_FORMAT_VERSION}']
+    for name in _CONVERTER_BINARIES:
+        resolved = shutil.which(name)
+        if not resolved:
+            parts.append(f'{name}:-')
+            continue
+        try:
+            st = os.stat(os.path.realpath(resolved))
+            parts.append(f'{name}:{os.path.realpath(resolved)}:{st.st_size}:{int(st.st_mtime)}')
+        except OSError:
+            parts.append(f'{name}:{resolved}')
+    return '|'.join(parts)
+
+
+def cache_key(ai_path: str) -> str:
+    """Cache key for an AI file: content hash combined with converter identity."""
+    fingerprint = hashlib.sha256(converter_fingerprint().encode('utf-8')).hexdigest()[:16]
+    return f'{file_digest(ai_path)}_{fingerprint}'
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(cache_dir(), f'{key}.svg')
+
+
+def lookup(key: str, output_svg: str) -> bool:
+    """
+    Copy a cached conversion to output_svg if present.
+
+    Returns:
+        True on cache hit (output_svg written), False otherwise
+    """
+    if cache_max_bytes() <= 0:
+        return False
+
+    entry = _entry_path(key)
+    try:
+        shutil.copyfile(entry, output_svg)
+        os.utime(entry, None)  # LRU: mark as recently used
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        print(f"Warning: SVG cache read failed: {e}", file=sys.stderr)
+        return False
+
+
+def read(key: str) -> Optional[bytes]:
+    """Cached conversion as bytes (for in-memory parsing), or None on miss."""
+    if cache_max_bytes() <= 0:
+        return None
+
+    entry = _entry_path(key)
+    try:
+        with open(entry, 'rb') as f:
+            data = f.read()
+        os.utime(entry, None)  # LRU: mark as recently used
+        return data
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"Warning: SVG cache read failed: {e}", file=sys.stderr)
+        return None
+
+
+def store(key: str, svg_path: str) -> None:
+    """Store a successful conversion, then evict least-recently-used entries."""
+    _store(key, lambda temp_path: shutil.copyfile(svg_path, temp_path))
+
+
+def store_data(key: str, svg_data: bytes) -> None:
+    """store() for a conversion held in memory."""
+    def write(temp_path: str) -> None:
+        with open(temp_path, 'wb') as f:
+            f.write(svg_data)
+    _store(key, write)
+
+
+def _store(key: str, write) -> None:
+    max_bytes = cache_max_bytes()
+    if max_bytes <= 0:
+        return
+
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temp name first so concurrent readers never see partial files
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        os.close(temp_fd)
+        try:
+            write(temp_path)
+            os.replace(temp_path, _entry_path(key))
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+        evict(max_bytes)
+    except OSError as e:
+        print(f"Warning: SVG cache write failed: {e}", file=sys.stderr)
+
+
+def evict(max_bytes: Optional[int] = None, directory: Optional[str] = None,
+          suffix: str = '.svg') -> int:
+    """
+    Delete least-recently-used entries until the cache fits in max_bytes.
+
+    Defaults to the SVG conversion cache; other on-disk caches pass their
+    own directory/suffix to share the same LRU policy.
+
+    Returns:
+        Number of entries removed
+    """
+    if max_bytes is None:
+        max_bytes = cache_max_bytes()
+    if directory is None:
+        directory = cache_dir()
+
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(suffix):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except FileNotFoundError:
+        return 0
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+            removed += 1
+        except FileNotFoundError:
+            total -= size  # Already evicted by a concurrent process
+        except OSError:
+            continue
+    return removed
@@ -34,27 +34,130 @@ class ValidationIssue:
         return asdict(self)
 
 
-@dataclass
+# Expensive PathInfo fields, grouped by the computation that yields them.
+# Each group name is a method of the PathInfo.geometry source
+# (path_geometry.PathGeometry) returning the group's values in order.
+LAZY_FIELD_GROUPS = {
+    'bbox': ('bbox',),
+    'length': ('length',),
+    'closure': ('is_closed', 'is_compound', 'num_subpaths'),
+    'polygon': ('polygon', 'area', 'num_holes'),
+    'circle': ('is_circle', 'circle_diameter'),
+}
+_LAZY_FIELD_TO_GROUP = {
+    name: group for group, names in LAZY_FIELD_GROUPS.items() for name in names
+}
+# Values used when a lazy field has neither a value nor a geometry source
+_LAZY_FIELD_DEFAULTS = {
+    'bbox': None, 'length': 0.0,
+    'is_closed': False, 'is_compound': False, 'num_subpaths': 1,
+    'polygon': None, 'area': None, 'num_holes': 0,
+    'is_circle': False, 'circle_diameter': None,
+}
+_LAZY = object()
+
+
 class PathInfo:
-    """Information about a parsed path."""
-    path_id: str
-    d_attribute: str
-    stroke: Optional[str]
-    stroke_width: Optional[float]
-    fill: Optional[str]
-    transform: Optional[str]
-    bbox: Optional[Tuple[float, float, float, float]]
-    length: float
-    area: Optional[float]
-    is_closed: bool
-    num_holes: int
-    layer_name: Optional[str] = None
-    transform_chain: Optional[str] = None
-    is_circle: bool = False
-    circle_diameter: Optional[float] = None
-    polygon: Optional[Any] = None  # Shapely Polygon for geometric containment checks
-    is_compound: bool = False      # True if path has multiple subpaths (M...Z M...Z)
-    num_subpaths: int = 1          # Number of continuous subpaths
+    """
+    Information about a parsed path.
+
+    The expensive fields (bbox, length, closure/compound decomposition,
+    polygon/area/holes, circle detection) may be omitted when a `geometry`
+    source is given; each group is then computed on first access and
+    memoized, so rules that never read them never trigger polygonization.
+    Assigning a field (e.g. the globally transformed polygon) replaces it.
+
+    Slotted: one compact record per path, no per-instance __dict__. The
+    analysis-time attributes set by letter_analysis are declared up front.
+    """
+
+    # All fields in declaration order (serialization, geometry cache)
+    FIELDS = (
+        'path_id', 'd_attribute', 'stroke', 'stroke_width', 'fill', 'transform',
+        'bbox', 'length', 'area', 'is_closed', 'num_holes', 'layer_name',
+        'transform_chain', 'is_circle', 'circle_diameter', 'polygon',
+        'is_compound', 'num_subpaths',
+    )
+
+    __slots__ = FIELDS + (
+        'geometry',          # Lazy source (path_geometry.PathGeometry)
+        'original_bbox',     # Raw bbox before letter analysis applied the transform chain
+        'original_polygon',  # Raw polygon before letter analysis applied the transform chain
+        'compound_polygon',  # Letter polygon with counters, used for hole containment
+        '_contained_by',     # Debug: path_id of the letter candidate containing this path
+    )
+
+    def __init__(self, path_id: str, d_attribute: str, stroke: Optional[str],
+                 stroke_width: Optional[float], fill: Optional[str], transform: Optional[str],
+                 bbox: Optional[Tuple[float, float, float, float]] = _LAZY,
+                 length: float = _LAZY,
+                 area: Optional[float] = _LAZY,
+                 is_closed: bool = _LAZY,
+                 num_holes: int = _LAZY,
+                 layer_name: Optional[str] = None,
+                 transform_chain: Optional[str] = None,
+                 is_circle: bool = _LAZY,
+                 circle_diameter: Optional[float] = _LAZY,
+                 polygon: Optional[Any] = _LAZY,  # Shapely Polygon for geometric containment checks
+                 is_compound: bool = _LAZY,       # True if path has multiple subpaths (M...Z M...Z)
+                 num_subpaths: int = _LAZY,       # Number of continuous subpaths
+                 geometry: Optional[Any] = None):
+        self.path_id = path_id
+        self.d_attribute = d_attribute
+        self.stroke = stroke
+        self.stroke_width = stroke_width
+        self.fill = fill
+        self.transform = transform
+        self.layer_name = layer_name
+        self.transform_chain = transform_chain
+        self.geometry = geometry
+        self.original_bbox = None
+        self.original_polygon = None
+        self.compound_polygon = None
+        self._contained_by = None
+
+        lazy_values = {
+            'bbox': bbox, 'length': length, 'area': area, 'is_closed': is_closed,
+            'num_holes': num_holes, 'is_circle': is_circle, 'circle_diameter': circle_diameter,
+            'polygon': polygon, 'is_compound': is_compound, 'num_subpaths': num_subpaths,
+        }
+        for name, value in lazy_values.items():
+            if value is not _LAZY:
+                setattr(self, name, value)
+
+    def __getattr__(self, name: str):
+        # Only reached when the slot is still empty
+        group = _LAZY_FIELD_TO_GROUP.get(name)
+        if group is None:
+            raise AttributeError(f"'PathInfo' object has no attribute '{name}'")
+        names = LAZY_FIELD_GROUPS[group]
+        if self.geometry is not None:
+            values = getattr(self.geometry, group)()
+        else:
+            values = tuple(_LAZY_FIELD_DEFAULTS[n] for n in names)
+        for field_name, value in zip(names, values):
+            # Keep fields that were assigned explicitly
+            if not self.is_computed(field_name):
+                setattr(self, field_name, value)
+        return object.__getattribute__(self, name)
+
+    def is_computed(self, name: str) -> bool:
+        """True if the field holds a value (given, assigned or already computed)."""
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def materialize(self) -> 'PathInfo':
+        """Compute every lazy field now."""
+        for name in _LAZY_FIELD_TO_GROUP:
+            getattr(self, name)
+        return self
+
+    def __repr__(self) -> str:
+        return (f"PathInfo(path_id={self.path_id!r}, layer_name={self.layer_name!r}, "
+                f"d_attribute={self.d_attribute[:40]!r})")
 
 
 @dataclass
@@ -98,7 +201,7 @@ class ValidationResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HoleInfo:
     """Information about a hole within a letter. Created unclassified by geometry layer,
     classified later by spec-specific rules (e.g. front_lit classifies as wire/mounting)."""
@@ -148,7 +251,7 @@ class HoleInfo:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class LetterGroup:
     """A letter with its associated paths and holes.
     Holes are stored unclassified; spec-specific rules classify them later."""
@@ -229,6 +332,7 @@ class LetterAnalysisResult:
     detected_scale: float = 1.0              # Detected file scale
     stats: Dict[str, Any] = field(default_factory=dict)  # Summary statistics
     issues: List[Dict[str, Any]] = field(default_factory=list)  # Analysis-level validation issues
+    path_table: Optional[Any] = None         # PathTable of the analyzed (transformed) paths, for rules
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -6,21 +6,20 @@ Line→CubicBezier→Line segment transitions. Used by Push Thru
 validation to enforce minimum radius requirements.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-try:
-    from svgpathtools import parse_path, Line, CubicBezier
-except ImportError:
-    parse_path = None
-    Line = None
-    CubicBezier = None
+import numpy as np
+
+from .path_data import PathData, parse_path_data
+from .sampling import SEG_LINE, SEG_CUBIC
 
 # Kappa constant: ratio of cubic bezier handle length to radius for a circular arc
 _KAPPA = 0.5523
 
 
 def extract_corner_radii(d_attribute: str, file_scale: float,
-                         is_compound: bool = False) -> List[Dict[str, Any]]:
+                         is_compound: bool = False,
+                         data: Optional[PathData] = None) -> List[Dict[str, Any]]:
     """
     Extract corner radii from an SVG path d-attribute by analyzing
     Line→CubicBezier→Line transitions.
@@ -36,6 +35,8 @@ def extract_corner_radii(d_attribute: str, file_scale: float,
         d_attribute: SVG path d attribute string
         file_scale: File scale factor (e.g., 0.1 for 10% working files)
         is_compound: True if this is a compound path interior (CW winding)
+        data: Already parsed segment arrays of d_attribute (e.g. from the
+              path's PathGeometry), to avoid parsing the path again
 
     Returns:
         List of dicts with keys:
@@ -44,102 +45,112 @@ def extract_corner_radii(d_attribute: str, file_scale: float,
         - is_sharp: True if no bezier at this corner (sharp L-to-L junction)
         - position: (x, y) midpoint of the bezier curve
     """
-    if parse_path is None or Line is None or CubicBezier is None:
-        return []
+    if data is None:
+        try:
+            data = parse_path_data(d_attribute)
+        except Exception:
+            return []
 
-    try:
-        path = parse_path(d_attribute)
-    except Exception:
+    n_total = len(data)
+    if n_total < 2:
         return []
 
     # For compound paths, process each closed subpath separately
-    if is_compound:
-        try:
-            subpaths = path.continuous_subpaths()
-        except Exception:
-            subpaths = [path]
-    else:
-        subpaths = [path]
-
-    results = []
-    points_per_real_inch = 72 * file_scale
+    bounds = data.subpath_bounds if is_compound else (0, n_total)
 
-    for sp in subpaths:
-        segments = list(sp)
-        n = len(segments)
-        if n < 2:
+    # Cyclic previous/next segment index within each subpath
+    idx_parts, prev_parts, next_parts = [], [], []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if hi - lo < 2:
             continue
-
-        for i in range(n):
-            seg = segments[i]
-            prev_seg = segments[(i - 1) % n]
-            next_seg = segments[(i + 1) % n]
-
-            # Detect Line→CubicBezier→Line pattern (rounded corner)
-            if isinstance(seg, CubicBezier) and isinstance(prev_seg, Line) and isinstance(next_seg, Line):
-                _process_rounded_corner(
-                    seg, prev_seg, next_seg,
-                    points_per_real_inch, is_compound, results
-                )
-
-            # Detect Line→Line pattern (sharp corner — no bezier)
-            elif isinstance(seg, Line) and isinstance(next_seg, Line):
-                _process_sharp_corner(seg, next_seg, is_compound, results)
-
+        idx = np.arange(lo, hi)
+        idx_parts.append(idx)
+        prev_parts.append(np.roll(idx, 1))
+        next_parts.append(np.roll(idx, -1))
+    if not idx_parts:
+        return []
+    idx = np.concatenate(idx_parts)
+    prev_idx = np.concatenate(prev_parts)
+    next_idx = np.concatenate(next_parts)
+
+    kinds = data.arrays.kinds
+    ctrl = data.arrays.ctrl
+    is_line = kinds == SEG_LINE
+
+    # Line→CubicBezier→Line pattern (rounded corner)
+    rounded = (kinds[idx] == SEG_CUBIC) & is_line[prev_idx] & is_line[next_idx]
+    # Line→Line pattern (sharp corner — no bezier)
+    sharp = is_line[idx] & is_line[next_idx]
+
+    rounded_corners = _rounded_corners(ctrl, idx[rounded], prev_idx[rounded], next_idx[rounded],
+                                       72 * file_scale, is_compound)
+    sharp_corners = _sharp_corners(ctrl, idx[sharp], next_idx[sharp], is_compound)
+
+    # Report corners in path order
+    order = np.flatnonzero(rounded | sharp)
+    rounded_iter = iter(rounded_corners)
+    sharp_iter = iter(sharp_corners)
+    results = []
+    for k in order:
+        corner = next(rounded_iter) if rounded[k] else next(sharp_iter)
+        if corner is not None:
+            results.append(corner)
     return results
 
 
-def _process_rounded_corner(seg, prev_seg, next_seg,
-                            points_per_real_inch: float,
-                            is_compound: bool,
-                            results: list) -> None:
-    """Extract radius from a Line→CubicBezier→Line transition."""
-    p0 = seg.start
-    p1 = seg.control1
-    p2 = seg.control2
-    p3 = seg.end
+def _rounded_corners(ctrl: np.ndarray, idx: np.ndarray, prev_idx: np.ndarray,
+                     next_idx: np.ndarray, points_per_real_inch: float,
+                     is_compound: bool) -> List[Optional[Dict[str, Any]]]:
+    """Radius at each Line→CubicBezier→Line transition (None when degenerate)."""
+    p0, p1, p2, p3 = ctrl[idx, 0], ctrl[idx, 1], ctrl[idx, 2], ctrl[idx, 3]
 
-    handle_in = abs(p1 - p0)
-    handle_out = abs(p3 - p2)
+    # hypot (not np.abs) rounds exactly like Python's abs(complex)
+    handle_in = np.hypot((p1 - p0).real, (p1 - p0).imag)
+    handle_out = np.hypot((p3 - p2).real, (p3 - p2).imag)
     avg_handle = (handle_in + handle_out) / 2
 
-    if avg_handle < 1e-6:
-        return
-
     radius_file = avg_handle / _KAPPA
     radius_inches = radius_file / points_per_real_inch
 
     # Convex/concave via cross product of direction vectors
-    d_in = p0 - prev_seg.start   # incoming direction
-    d_out = next_seg.end - p3    # outgoing direction
+    d_in = p0 - ctrl[prev_idx, 0]     # incoming direction
+    d_out = ctrl[next_idx, 3] - p3    # outgoing direction
 
     cross = d_in.real * d_out.imag - d_in.imag * d_out.real
 
-    # In SVG coordinate system (Y down), positive cross = CW turn = convex
-    is_convex = cross > 0
+    # In SVG coordinate system (Y down), positive cross = CW turn = convex;
     # CW winding (compound path interiors) inverts the interpretation
-    if is_compound:
-        is_convex = not is_convex
-
-    midpoint = seg.point(0.5)
-    results.append({
-        'radius_inches': radius_inches,
-        'is_convex': is_convex,
-        'is_sharp': False,
-        'position': (midpoint.real, midpoint.imag),
-    })
-
-
-def _process_sharp_corner(seg, next_seg, is_compound: bool,
-                          results: list) -> None:
-    """Flag a Line→Line transition as a sharp corner if direction changes."""
-    d1 = seg.end - seg.start
-    d2 = next_seg.end - next_seg.start
+    is_convex = (cross > 0) != is_compound
+
+    # Curve midpoint, Horner form as in CubicBezier.point(0.5)
+    t = 0.5
+    midpoint = p0 + t * (3 * (p1 - p0) + t * (
+        3 * (p0 + p2) - 6 * p1 + t * (-p0 + 3 * (p1 - p2) + p3)))
+
+    return [
+        {
+            'radius_inches': float(radius_inches[i]),
+            'is_convex': bool(is_convex[i]),
+            'is_sharp': False,
+            'position': (float(midpoint[i].real), float(midpoint[i].imag)),
+        } if avg_handle[i] >= 1e-6 else None
+        for i in range(len(idx))
+    ]
+
+
+def _sharp_corners(ctrl: np.ndarray, idx: np.ndarray, next_idx: np.ndarray,
+                   is_compound: bool) -> List[Optional[Dict[str, Any]]]:
+    """Flag each Line→Line transition as a sharp corner if direction changes."""
+    d1 = ctrl[idx, 1] - ctrl[idx, 0]
+    d2 = ctrl[next_idx, 1] - ctrl[next_idx, 0]
     cross = d1.real * d2.imag - d1.imag * d2.real
-    if abs(cross) > 1e-6:
-        results.append({
+    end = ctrl[idx, 1]
+    return [
+        {
             'radius_inches': 0.0,
-            'is_convex': (cross > 0) != is_compound,
+            'is_convex': bool((cross[i] > 0) != is_compound),
             'is_sharp': True,
-            'position': (seg.end.real, seg.end.imag),
-        })
+            'position': (float(end[i].real), float(end[i].imag)),
+        } if abs(cross[i]) > 1e-6 else None
+        for i in range(len(idx))
+    ]
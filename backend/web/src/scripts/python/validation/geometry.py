@@ -5,14 +5,22 @@ Geometric utilities for path analysis.
 import math
 from typing import Tuple, Optional, Dict, List, Any
 
-# Minimum samples per curve segment even for very short segments
-_MIN_SAMPLES_PER_SEGMENT = 4
+import numpy as np
+
+from . import buffer_cache
+from .circle_fit import fit_circle
+from .path_data import PathData
+from .sampling import sample_segments, sample_subpaths, sample_split, ring_area
 
 try:
+    import shapely
+    from shapely import STRtree
     from shapely.geometry import Polygon, Point, LineString
     from shapely.geometry import JOIN_STYLE as _JOIN_STYLE
     from shapely.ops import nearest_points as _nearest_points
 except ImportError:
+    shapely = None
+    STRtree = None
     Polygon = None
     Point = None
     LineString = None
@@ -52,81 +60,56 @@ def is_circle_path(path) -> Tuple[bool, Optional[float]]:
     """
     Determine if a path is approximately circular.
 
+    Fits a circle to the path's control points (circle_fit.fit_circle: kappa
+    cubics, arcs, least-squares fallback) and accepts residuals within
+    circle_fit.CIRCLE_TOLERANCE — ellipses down to the old 0.98 aspect ratio
+    pass, while squares, rectangles and polygons up to 16 sides are rejected.
+
+    Args:
+        path: svgpathtools Path or path_data.PathData
+
     Returns:
         Tuple of (is_circle, diameter) where diameter is in file units
     """
     try:
-        if len(path) < 2:
-            return False, None
-
-        xmin, xmax, ymin, ymax = path.bbox()
-        width = xmax - xmin
-        height = ymax - ymin
-
-        if width <= 0 or height <= 0:
-            return False, None
-
-        # Check aspect ratio (circles are square)
-        # Stricter threshold: 98% match required to prevent false positives
-        # (rejects squares, rectangles, octagons, hexagons)
-        aspect_ratio = min(width, height) / max(width, height)
-        if aspect_ratio < 0.98:
-            return False, None
-
-        # Check path length vs expected circumference
-        # Stricter threshold: ±2% tolerance (98% match required)
-        expected_circumference = 3.14159 * (width + height) / 2
-        actual_length = path.length()
-
-        length_ratio = actual_length / expected_circumference if expected_circumference > 0 else 0
-        if abs(length_ratio - 1.0) > 0.02:
-            return False, None
-
-        diameter = (width + height) / 2
-        return True, diameter
-
+        data = path if isinstance(path, PathData) else PathData.from_path(path)
+        fit = fit_circle(data)
     except Exception:
         return False, None
 
-
-def _samples_for_segment(segment, max_point_distance: Optional[float],
-                         fallback: int = 10) -> int:
-    """Compute sample count for a single curve segment."""
-    if max_point_distance is None or max_point_distance <= 0:
-        return fallback
-    try:
-        seg_len = segment.length()
-        return max(_MIN_SAMPLES_PER_SEGMENT, math.ceil(seg_len / max_point_distance))
-    except Exception:
-        return fallback
+    if fit is None or not fit.is_circle:
+        return False, None
+    return True, fit.diameter
 
 
 def path_to_polygon(path, samples_per_segment: int = 10,
-                    max_point_distance: Optional[float] = None) -> Optional[Polygon]:
+                    max_point_distance: Optional[float] = None,
+                    flatten_tolerance: Optional[float] = None) -> Optional[Polygon]:
     """
-    Convert svgpathtools Path to Shapely Polygon by sampling points.
+    Convert a path to a Shapely Polygon by sampling points.
+
+    All segments are sampled in one vectorized batch (see sampling.py).
 
     Args:
-        path: svgpathtools Path object
+        path: svgpathtools Path or path_data.PathData
         samples_per_segment: Fixed sample count per segment (used when max_point_distance is None)
         max_point_distance: Max distance between consecutive samples in file units.
             When provided, samples per segment are computed dynamically from arc length.
+        flatten_tolerance: Max chord deviation in file units. When provided, curves
+            are flattened adaptively (still honouring max_point_distance) and
+            straight lines contribute only their endpoints.
     """
     if Polygon is None:
         return None
 
     try:
-        points = []
-        for i in range(len(path)):
-            segment = path[i]
-            n = _samples_for_segment(segment, max_point_distance, samples_per_segment)
-            for t in range(n):
-                point = segment.point(t / n)
-                points.append((point.real, point.imag))
+        segments = path.arrays if isinstance(path, PathData) else list(path)
+        points = sample_segments(segments, max_point_distance, samples_per_segment,
+                                 flatten_tolerance)
 
         if len(points) >= 3:
-            first_point = path[0].point(0)
-            points.append((first_point.real, first_point.imag))
+            # Close the ring on the first sample (t=0 of the first segment)
+            points = np.vstack((points, points[:1]))
 
             try:
                 polygon = Polygon(points)
@@ -142,7 +125,8 @@ def path_to_polygon(path, samples_per_segment: int = 10,
 
 
 def compound_path_to_polygon(path, samples_per_segment: int = 10,
-                             max_point_distance: Optional[float] = None) -> Optional[Polygon]:
+                             max_point_distance: Optional[float] = None,
+                             flatten_tolerance: Optional[float] = None) -> Optional[Polygon]:
     """
     Convert a compound SVG path (multiple subpaths like M...Z M...Z) to a
     Shapely Polygon with interior rings.
@@ -156,37 +140,32 @@ def compound_path_to_polygon(path, samples_per_segment: int = 10,
         return None
 
     try:
-        subpaths = path.continuous_subpaths()
-        if len(subpaths) < 2:
-            return path_to_polygon(path, samples_per_segment, max_point_distance)
-
-        # Convert each subpath to a list of points
+        if isinstance(path, PathData):
+            if path.num_subpaths < 2:
+                return path_to_polygon(path, samples_per_segment, max_point_distance,
+                                       flatten_tolerance)
+            sampled = sample_split(path.arrays, path.subpath_bounds, max_point_distance,
+                                   samples_per_segment, flatten_tolerance)
+        else:
+            subpaths = path.continuous_subpaths()
+            if len(subpaths) < 2:
+                return path_to_polygon(path, samples_per_segment, max_point_distance,
+                                       flatten_tolerance)
+            sampled = sample_subpaths(subpaths, max_point_distance, samples_per_segment,
+                                      flatten_tolerance)
+
+        # Every subpath was sampled in one batch; close each ring
         rings = []
-        for sp in subpaths:
-            points = []
-            for seg in sp:
-                n = _samples_for_segment(seg, max_point_distance, samples_per_segment)
-                for t in range(n):
-                    pt = seg.point(t / n)
-                    points.append((pt.real, pt.imag))
+        for points in sampled:
             if len(points) >= 3:
-                # Close the ring
-                first = sp[0].point(0)
-                points.append((first.real, first.imag))
-                rings.append(points)
+                rings.append(np.vstack((points, points[:1])))
 
         if not rings:
-            return path_to_polygon(path, samples_per_segment, max_point_distance)
+            return path_to_polygon(path, samples_per_segment, max_point_distance,
+                                   flatten_tolerance)
 
         # Largest area ring = exterior
-        ring_areas = []
-        for pts in rings:
-            try:
-                p = Polygon(pts)
-                ring_areas.append(abs(p.area))
-            except Exception:
-                ring_areas.append(0)
-
+        ring_areas = [ring_area(r) for r in rings]
         max_idx = ring_areas.index(max(ring_areas))
         exterior = rings[max_idx]
         interiors = [r for i, r in enumerate(rings) if i != max_idx]
@@ -197,7 +176,8 @@ def compound_path_to_polygon(path, samples_per_segment: int = 10,
         return poly.buffer(0)
 
     except Exception:
-        return path_to_polygon(path, samples_per_segment, max_point_distance)
+        return path_to_polygon(path, samples_per_segment, max_point_distance,
+                               flatten_tolerance)
 
 
 def centroid_distance(bbox1: Tuple[float, float, float, float],
@@ -258,12 +238,53 @@ def polygon_contains(outer: Optional[Polygon], inner: Optional[Polygon],
             return True
 
         # Secondary check: with tolerance buffer for edge cases
-        buffered_outer = outer.buffer(tolerance)
+        buffered_outer = buffer_cache.buffer(outer, tolerance)
         return buffered_outer.contains(inner)
     except Exception:
         return False
 
 
+def polygon_contains_many(outers: np.ndarray, inners: np.ndarray,
+                          outer_idx: np.ndarray, inner_idx: np.ndarray,
+                          tolerance: float = 0.5) -> np.ndarray:
+    """
+    Vectorized polygon_contains() over many (outer, inner) pairs.
+
+    Same two-stage test as polygon_contains(): inner centroid inside outer,
+    else outer buffered by tolerance contains inner. Centroids are computed
+    once per inner and tolerance buffers once per distinct outer, using
+    shapely 2's array functions.
+
+    Args:
+        outers: Array of outer (letter) polygons
+        inners: Array of inner (hole) polygons
+        outer_idx: Index into outers for each pair
+        inner_idx: Index into inners for each pair
+        tolerance: Buffer tolerance for edge cases
+
+    Returns:
+        Boolean array, one entry per pair
+    """
+    result = np.zeros(len(outer_idx), dtype=bool)
+    if len(outer_idx) == 0:
+        return result
+
+    # Primary check: inner centroid inside outer
+    centroids = shapely.centroid(inners)
+    result[:] = shapely.contains(outers[outer_idx], centroids[inner_idx])
+
+    # Secondary check: tolerance buffer, computed once per outer still in play
+    pending = np.flatnonzero(~result)
+    if len(pending):
+        needed = np.unique(outer_idx[pending])
+        buffered = np.empty(len(outers), dtype=object)
+        buffered[needed] = buffer_cache.buffer_many(list(outers[needed]), tolerance)
+        result[pending] = shapely.contains(
+            buffered[outer_idx[pending]], inners[inner_idx[pending]]
+        )
+    return result
+
+
 def point_in_polygon(polygon: Optional[Polygon], x: float, y: float,
                      tolerance: float = 0.0) -> bool:
     """
@@ -286,7 +307,7 @@ def point_in_polygon(polygon: Optional[Polygon], x: float, y: float,
         point = Point(x, y)
 
         if tolerance != 0.0:
-            polygon = polygon.buffer(tolerance)
+            polygon = buffer_cache.buffer(polygon, tolerance)
 
         return polygon.contains(point)
     except Exception:
@@ -497,6 +518,51 @@ def polygon_distance(poly1: Optional[Polygon], poly2: Optional[Polygon]) -> floa
         return float('inf')
 
 
+def find_close_pairs(polygons: List[Optional[Polygon]],
+                     max_distance: float) -> List[Tuple[int, int, float]]:
+    """
+    Find all polygon pairs whose boundaries are within max_distance.
+
+    Uses an STRtree 'dwithin' query so only nearby candidates are measured,
+    instead of computing the distance for every pair.
+
+    Args:
+        polygons: Shapely Polygons (None entries are skipped)
+        max_distance: Maximum distance in file units (inclusive)
+
+    Returns:
+        List of (i, j, distance) with i < j, sorted by (i, j)
+    """
+    valid = [i for i, p in enumerate(polygons) if p is not None]
+    if len(valid) < 2:
+        return []
+
+    if STRtree is None:
+        pairs = []
+        for a in range(len(valid)):
+            for b in range(a + 1, len(valid)):
+                i, j = valid[a], valid[b]
+                dist = polygon_distance(polygons[i], polygons[j])
+                if dist <= max_distance:
+                    pairs.append((i, j, dist))
+        return pairs
+
+    geoms = [polygons[i] for i in valid]
+    tree = STRtree(geoms)
+    left, right = tree.query(geoms, predicate='dwithin', distance=max_distance)
+    keep = left < right
+    left, right = left[keep], right[keep]
+    if len(left) == 0:
+        return []
+
+    distances = shapely.distance(tree.geometries[left], tree.geometries[right])
+    pairs = sorted(
+        (valid[a], valid[b], float(d))
+        for a, b, d in zip(left.tolist(), right.tolist(), distances.tolist())
+    )
+    return pairs
+
+
 def buffer_polygon_with_mitre(polygon: Optional[Polygon],
                               offset: float,
                               mitre_limit: float = 4.0) -> Optional[Polygon]:
@@ -519,8 +585,8 @@ def buffer_polygon_with_mitre(polygon: Optional[Polygon],
         return None
 
     try:
-        buffered = polygon.buffer(offset, join_style=_JOIN_STYLE.mitre,
-                                  mitre_limit=mitre_limit)
+        buffered = buffer_cache.buffer(polygon, offset, join_style=buffer_cache.JOIN_MITRE,
+                                       mitre_limit=mitre_limit)
         if buffered.is_empty:
             return None
         return buffered
@@ -547,7 +613,7 @@ def buffer_polygon_round(polygon: Optional[Polygon],
         return None
 
     try:
-        buffered = polygon.buffer(offset, join_style=_JOIN_STYLE.round)
+        buffered = buffer_cache.buffer(polygon, offset, join_style=buffer_cache.JOIN_ROUND)
         if buffered.is_empty:
             return None
         return buffered
@@ -0,0 +1,174 @@
+"""
+On-disk cache of parsed PathInfo geometry.
+
+extract_paths_from_svg() re-parses the SVG, integrates path lengths, detects
+circles and samples every path into a polygon on every run — even when only
+the rules changed. This cache stores the finished PathInfo list in a compact
+binary file keyed by the SVG content hash (file or in-memory bytes), the
+source AI file (which drives OCG layer naming) and the sampling parameters
+(max_point_distance and flatten_tolerance) that drive polygon construction.
+
+File layout (little-endian):
+    magic b'NXGC' | uint16 format version | uint32 header length
+    | header JSON (scalar PathInfo fields + WKB blob lengths)
+    | concatenated WKB polygon blobs
+
+Environment:
+    AI_GEOMETRY_CACHE_DIR     Cache directory (default: <tmpdir>/nexus_geometry_cache)
+    AI_GEOMETRY_CACHE_MAX_MB  Size bound in MB (default: 256, 0 disables the cache)
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from typing import List, Optional, Tuple, Union
+
+from .core import PathInfo
+from .conversion_cache import file_digest, evict
+
+try:
+    import shapely
+except ImportError:
+    shapely = None
+
+# Bump whenever PathInfo fields or their computation change
+# 3: bbox, closure and sampling read native PathData segment arrays
+# 4: lengths from batched Gauss-Legendre quadrature instead of path.length()
+# 5: control-point circle recognition
+# 6: flattening densities bounded per grid cell (strict 1mm gap)
+GEOMETRY_CACHE_VERSION = 6
+
+_MAGIC = b'NXGC'
+_PREAMBLE = struct.Struct('<4sHI')
+_SUFFIX = '.geom'
+_DEFAULT_MAX_MB = 256
+_TUPLE_FIELDS = ('bbox',)
+_SCALAR_FIELDS = tuple(name for name in PathInfo.FIELDS if name != 'polygon')
+
+
+def cache_dir() -> str:
+    """Directory holding cached geometry entries."""
+    return os.environ.get('AI_GEOMETRY_CACHE_DIR') or os.path.join(
+        tempfile.gettempdir(), 'nexus_geometry_cache'
+    )
+
+
+def cache_max_bytes() -> int:
+    """Configured size bound in bytes (0 = cache disabled)."""
+    try:
+        max_mb = float(os.environ.get('AI_GEOMETRY_CACHE_MAX_MB', _DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = _DEFAULT_MAX_MB
+    return max(0, int(max_mb * 1024 * 1024))
+
+
+def cache_key(svg_path: Union[str, bytes], ai_path: Optional[str],
+              max_point_distance: Optional[float],
+              flatten_tolerance: Optional[float] = None,
+              layer_filter: Optional[Tuple] = None) -> str:
+    """Cache key for one extraction: SVG bytes + AI bytes + sampling and layer-pruning parameters."""
+    parts = [
+        f'v{GEOMETRY_CACHE_VERSION}',
+        hashlib.sha256(svg_path).hexdigest() if isinstance(svg_path, bytes) else file_digest(svg_path),
+        file_digest(ai_path) if ai_path else '-',
+        repr(max_point_distance),
+        repr(flatten_tolerance),
+        repr(layer_filter),
+    ]
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(cache_dir(), f'{key}{_SUFFIX}')
+
+
+def load_paths(key: str) -> Optional[List[PathInfo]]:
+    """
+    Load cached PathInfo objects.
+
+    Returns:
+        List of PathInfo on cache hit, None on miss or unreadable entry
+    """
+    if shapely is None or cache_max_bytes() <= 0:
+        return None
+
+    entry = _entry_path(key)
+    try:
+        with open(entry, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"Warning: Geometry cache read failed: {e}", file=sys.stderr)
+        return None
+
+    try:
+        magic, version, header_len = _PREAMBLE.unpack_from(data, 0)
+        if magic != _MAGIC or version != GEOMETRY_CACHE_VERSION:
+            return None
+        offset = _PREAMBLE.size
+        header = json.loads(data[offset:offset + header_len].decode('utf-8'))
+        offset += header_len
+
+        blobs = []
+        for length in header['wkb_lengths']:
+            blobs.append(data[offset:offset + length] if length else None)
+            offset += length
+        polygons = shapely.from_wkb(blobs) if blobs else []
+
+        paths = []
+        for record, polygon in zip(header['paths'], polygons):
+            for name in _TUPLE_FIELDS:
+                if record.get(name) is not None:
+                    record[name] = tuple(record[name])
+            paths.append(PathInfo(polygon=polygon, **record))
+    except Exception as e:
+        print(f"Warning: Discarding unreadable geometry cache entry: {e}", file=sys.stderr)
+        return None
+
+    try:
+        os.utime(entry, None)  # LRU: mark as recently used
+    except OSError:
+        pass
+    return paths
+
+
+def save_paths(key: str, paths: List[PathInfo]) -> None:
+    """Serialize PathInfo objects to the cache, then evict LRU entries."""
+    max_bytes = cache_max_bytes()
+    if shapely is None or max_bytes <= 0:
+        return
+
+    try:
+        blobs = shapely.to_wkb([p.polygon for p in paths]) if paths else []
+        header = {
+            'paths': [{name: getattr(p, name) for name in _SCALAR_FIELDS} for p in paths],
+            'wkb_lengths': [len(b) if b is not None else 0 for b in blobs],
+        }
+        header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    except Exception as e:
+        print(f"Warning: Could not serialize geometry for cache: {e}", file=sys.stderr)
+        return
+
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temp name first so concurrent readers never see partial files
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(_PREAMBLE.pack(_MAGIC, GEOMETRY_CACHE_VERSION, len(header_bytes)))
+                f.write(header_bytes)
+                for blob in blobs:
+                    if blob is not None:
+                        f.write(blob)
+            os.replace(temp_path, _entry_path(key))
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+        evict(max_bytes, directory=directory, suffix=_SUFFIX)
+    except OSError as e:
+        print(f"Warning: Geometry cache write failed: {e}", file=sys.stderr)
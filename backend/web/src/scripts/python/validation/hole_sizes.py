@@ -0,0 +1,148 @@
+"""
+Standard hole size catalog.
+
+The standard_hole_sizes rows from the database (diameter_mm, tolerance_mm,
+category, name, hole_size_id) used to be scanned linearly for every hole:
+the tiny-circle filter in analyze_letter_hole_associations, the size match
+in _classify_holes_from_standards and the first-'mounting' lookups in the
+spec rules. HoleSizeCatalog is built once per validation request and
+indexes the rows instead:
+
+- sizes sorted by diameter; a hole can only match sizes within the largest
+  tolerance of its diameter, so bisect narrows each lookup to that window
+- per-category first rows (e.g. the mounting size shown in warnings)
+- match_many() classifies all holes of a file in one vectorized call
+
+Matching keeps the original rules: a size matches when
+|hole - diameter_mm| <= tolerance_mm, the nearest match wins and ties go to
+the row listed first. A NULL tolerance_mm falls back to DEFAULT_TOLERANCE_MM;
+rows with a NULL diameter_mm are left out of matching with a warning.
+"""
+
+import bisect
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Tolerance used when a row does not specify one (missing or NULL)
+DEFAULT_TOLERANCE_MM = 0.03
+
+# Slack on the bisect window so rounding never drops a boundary match
+_WINDOW_EPSILON = 1e-9
+
+
+class HoleSizeCatalog:
+    """standard_hole_sizes rows indexed by diameter and category."""
+
+    def __init__(self, sizes: Sequence[Dict[str, Any]]):
+        self.sizes: List[Dict[str, Any]] = list(sizes)
+
+        # Row indices sorted by diameter (stable: equal diameters keep list order).
+        # Rows without a usable diameter can never match and are left out.
+        diameters = {}
+        for i, size in enumerate(self.sizes):
+            diameter = _as_float(size.get('diameter_mm'))
+            if diameter is None:
+                print(f"Warning: Ignoring standard hole size {size.get('name') or i} "
+                      f"without a diameter", file=sys.stderr)
+            else:
+                diameters[i] = diameter
+        order = sorted(diameters, key=diameters.get)
+        self._order = np.array(order, dtype=np.int64)
+        self._diameters = [diameters[i] for i in order]
+        self._diameter_array = np.array(self._diameters, dtype=float)
+        self._tolerances = np.array([_tolerance(self.sizes[i]) for i in order], dtype=float)
+        self._window = float(self._tolerances.max()) + _WINDOW_EPSILON if order else 0.0
+
+        self._first_by_category: Dict[str, Dict[str, Any]] = {}
+        for size in self.sizes:
+            self._first_by_category.setdefault(size.get('category'), size)
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def first(self, category: str) -> Optional[Dict[str, Any]]:
+        """First row of a category (in database order), or None."""
+        return self._first_by_category.get(category)
+
+    def match(self, diameter_mm: float) -> Optional[Dict[str, Any]]:
+        """Nearest standard size whose tolerance covers diameter_mm, or None."""
+        if not self._diameters or not diameter_mm == diameter_mm:  # Empty index or NaN
+            return None
+        lo = bisect.bisect_left(self._diameters, diameter_mm - self._window)
+        hi = bisect.bisect_right(self._diameters, diameter_mm + self._window)
+
+        best = None
+        best_key = None
+        for k in range(lo, hi):
+            dist = abs(diameter_mm - self._diameters[k])
+            if dist <= self._tolerances[k]:
+                key = (dist, self._order[k])
+                if best_key is None or key < best_key:
+                    best, best_key = k, key
+        return self.sizes[self._order[best]] if best is not None else None
+
+    def match_many(self, diameters_mm: np.ndarray) -> np.ndarray:
+        """
+        Vectorized match() over many diameters.
+
+        Returns:
+            Row index into self.sizes per diameter (-1 where nothing matches)
+        """
+        d = np.asarray(diameters_mm, dtype=float)
+        result = np.full(len(d), -1, dtype=np.int64)
+        if not self._diameters or len(d) == 0:
+            return result
+
+        valid = np.isfinite(d)
+        lo = np.searchsorted(self._diameter_array, d - self._window, side='left')
+        hi = np.searchsorted(self._diameter_array, d + self._window, side='right')
+        hi[~valid] = lo[~valid]
+        width = int((hi - lo).max())
+        if width == 0:
+            return result
+
+        # (holes x window) candidate matrix over the sorted sizes
+        k = lo[:, None] + np.arange(width)[None, :]
+        in_window = k < hi[:, None]
+        k = np.minimum(k, len(self._diameters) - 1)
+        dist = np.abs(d[:, None] - self._diameter_array[k])
+        ok = in_window & (dist <= self._tolerances[k])
+        dist = np.where(ok, dist, np.inf)
+
+        # Nearest size; ties go to the earliest row in database order
+        nearest = ok & (dist == dist.min(axis=1, keepdims=True))
+        rows = np.where(nearest, self._order[k], len(self.sizes))
+        best = rows.min(axis=1)
+        found = best < len(self.sizes)
+        result[found] = best[found]
+        return result
+
+    def matches_any(self, diameters_mm: np.ndarray) -> np.ndarray:
+        """Boolean per diameter: within tolerance of some standard size."""
+        return self.match_many(diameters_mm) >= 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'HoleSizeCatalog':
+        """The catalog attached to a rules/config dict, else one built from its standard_hole_sizes."""
+        config = config or {}
+        catalog = config.get('_hole_size_catalog')
+        if catalog is None:
+            catalog = cls(config.get('standard_hole_sizes', []))
+        return catalog
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Numeric column value, or None for NULL / non-numeric / NaN."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value == value else None
+
+
+def _tolerance(size: Dict[str, Any]) -> float:
+    """Row tolerance; NULL or missing falls back to DEFAULT_TOLERANCE_MM."""
+    tolerance = _as_float(size.get('tolerance_mm'))
+    return DEFAULT_TOLERANCE_MM if tolerance is None else tolerance
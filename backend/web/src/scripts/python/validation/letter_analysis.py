@@ -6,8 +6,9 @@ each letter using polygon containment. Returns UNCLASSIFIED holes — spec-speci
 rules (e.g. front_lit.py) classify them later as wire/mounting/unknown.
 
 Key algorithms:
-1. Letter Identification: Find outer paths not contained within others
-2. Polygon Containment: Accurate geometric containment using Shapely
+1. Containment Tree: One per-layer sweep of polygon containment pairs (ContainmentTree)
+2. Letter Identification: Find outer paths not contained within others (tree roots)
+3. Polygon Containment: Accurate geometric containment using Shapely
 
 Counters (inner letter shapes like inside "O") are always part of the letter's
 compound path — they have interior rings baked into the polygon. All separate
@@ -22,13 +23,19 @@ from typing import List, Dict, Any, Optional, Tuple
 from .core import PathInfo, LetterGroup, LetterAnalysisResult, HoleInfo
 from .geometry import (
     get_centroid, bbox_contains,
-    polygon_contains, point_in_polygon
+    polygon_contains, polygon_contains_many, point_in_polygon
 )
+from .hole_sizes import HoleSizeCatalog
+from .path_table import PathTable
 from .transforms import apply_transform_to_bbox, apply_transform_to_polygon
 
 try:
+    import numpy as np
+    import shapely
     from shapely import STRtree
 except ImportError:
+    np = None
+    shapely = None
     STRtree = None
 
 
@@ -39,7 +46,164 @@ GEOMETRY_CONFIG = {
 }
 
 
-def identify_letters(paths_info: List[PathInfo], layer_name: Optional[str] = None) -> List[PathInfo]:
+def _clear_circles(table: PathTable, mask) -> None:
+    """Strip is_circle from the masked paths, keeping the table column in sync."""
+    for p in table.select(mask):
+        p.is_circle = False
+    table.is_circle[mask] = False
+
+
+def _layer_key(path: PathInfo) -> str:
+    return (path.layer_name or '').lower()
+
+
+def _has_area_geometry(geom) -> bool:
+    """Mirror the truthiness test used by path_is_inside_letter (non-empty geometry)."""
+    return geom is not None and not geom.is_empty
+
+
+class ContainmentTree:
+    """
+    Containment structure of one layer's paths, computed in one sweep.
+
+    Every (outer, inner) pair with polygon_contains(outer.polygon,
+    inner.polygon) is found once: one STRtree bulk query over the layer's
+    polygons, then polygon_contains_many() on the candidate pairs. Pairs whose
+    outer is strictly smaller than the inner path cannot be parents and are
+    only tested on demand by inside(). From those pairs:
+
+    - parents(): each letter candidate's smallest containing candidate
+      (candidates visited by area, largest first). Candidates without a
+      parent are the letters (roots).
+    - inside(): the paths inside a letter (its holes), in layer order.
+
+    identify_letters() and find_holes_in_letters() share one tree per layer
+    instead of each running their own containment loops.
+    """
+
+    def __init__(self, paths: List[PathInfo], tolerance: float = 0.5):
+        self.paths = paths
+        self.tolerance = tolerance
+        self._position = {id(p): i for i, p in enumerate(paths)}
+        self.geometric = np.fromiter((_has_area_geometry(p.polygon) for p in paths),
+                                     dtype=bool, count=len(paths))
+        self.outer_idx, self.inner_idx = self._containment_pairs()
+
+    def _containment_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(outer, inner) indices of every polygon containment pair."""
+        idx = np.flatnonzero(self.geometric)
+        self._deferred_outer = self._deferred_inner = np.empty(0, dtype=np.int64)
+        if len(idx) < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        polys = np.array([self.paths[i].polygon for i in idx], dtype=object)
+        area = np.fromiter((self.paths[i].area or 0 for i in idx), dtype=float, count=len(idx))
+        tol = self.tolerance
+
+        def candidates(outer, inner):
+            # Strictly smaller outers can never be parents(); only inside() needs
+            # them, so they are tested lazily per letter there
+            keep = outer != inner
+            outer, inner = outer[keep], inner[keep]
+            smaller = (area[outer] > 0) & (area[inner] > 0) & (area[outer] < area[inner])
+            self._deferred_outer = idx[outer[smaller]]
+            self._deferred_inner = idx[inner[smaller]]
+            return outer[~smaller], inner[~smaller]
+
+        try:
+            # Same bbox pre-check as polygon_contains (bounds grown by tolerance)
+            bounds = shapely.bounds(polys)
+            search = shapely.box(bounds[:, 0] - tol, bounds[:, 1] - tol,
+                                 bounds[:, 2] + tol, bounds[:, 3] + tol)
+            outer, inner = candidates(*STRtree(polys).query(search))
+            inside = polygon_contains_many(polys, polys, outer, inner, tol)
+        except Exception:
+            # Invalid geometry somewhere in the batch — fall back to scalar checks
+            n = len(idx)
+            outer, inner = candidates(np.repeat(np.arange(n), n), np.tile(np.arange(n), n))
+            inside = np.fromiter((polygon_contains(polys[o], polys[i], tol)
+                                  for o, i in zip(outer.tolist(), inner.tolist())),
+                                 dtype=bool, count=len(outer))
+        return idx[outer[inside]], idx[inner[inside]]
+
+    def parents(self, candidates: np.ndarray) -> np.ndarray:
+        """
+        Parent of every path among the masked letter candidates (-1 for roots).
+
+        A candidate is never contained by a strictly smaller one. Candidates
+        without usable polygons fall back to bbox containment (tolerance 1.0).
+        """
+        paths = self.paths
+        area = np.fromiter((p.area or 0 for p in paths), dtype=float, count=len(paths))
+        outer, inner = self.outer_idx, self.inner_idx
+        keep = candidates[outer] & candidates[inner]
+        outer, inner = outer[keep], inner[keep]
+
+        # Pairs involving a candidate without area geometry: bbox test
+        extra = []
+        no_geometry = np.flatnonzero(candidates & ~self.geometric)
+        if len(no_geometry):
+            others = np.flatnonzero(candidates)
+            for k in no_geometry.tolist():
+                for m in others.tolist():
+                    if m == k:
+                        continue
+                    a, b = paths[k].bbox, paths[m].bbox
+                    if not (a and b):
+                        continue
+                    if bbox_contains(a, b, tolerance=1.0):
+                        extra.append((k, m))
+                    if self.geometric[m] and bbox_contains(b, a, tolerance=1.0):
+                        extra.append((m, k))
+        if extra:
+            outer = np.concatenate((outer, [o for o, _ in extra])).astype(np.int64)
+            inner = np.concatenate((inner, [i for _, i in extra])).astype(np.int64)
+
+        smaller = (area[outer] > 0) & (area[inner] > 0) & (area[outer] < area[inner])
+        outer, inner = outer[~smaller], inner[~smaller]
+
+        # Smallest container per inner path (ties: earliest path)
+        parent = np.full(len(paths), -1, dtype=np.int64)
+        if len(inner):
+            order = np.lexsort((outer, area[outer], inner))
+            outer, inner = outer[order], inner[order]
+            first = np.unique(inner, return_index=True)[1]
+            parent[inner[first]] = outer[first]
+        return parent
+
+    def inside(self, letter: PathInfo) -> List[PathInfo]:
+        """Paths inside the letter's polygon, in layer order (path_is_inside_letter semantics)."""
+        k = self._position.get(id(letter))
+        if k is None:
+            return []
+        if self.geometric[k]:
+            found = set(self.inner_idx[self.outer_idx == k].tolist())
+            # Larger paths whose centroid may still fall inside the letter
+            for j in self._deferred_inner[self._deferred_outer == k].tolist():
+                if polygon_contains(letter.polygon, self.paths[j].polygon, self.tolerance):
+                    found.add(j)
+            # Paths the polygon pass did not cover
+            for j in np.flatnonzero(~self.geometric).tolist():
+                if path_is_inside_letter(self.paths[j], letter, self.tolerance):
+                    found.add(j)
+        else:
+            found = {j for j, path in enumerate(self.paths)
+                     if j != k and path_is_inside_letter(path, letter, self.tolerance)}
+        return [self.paths[j] for j in sorted(found)]
+
+
+def build_containment_trees(paths: List[PathInfo],
+                            tolerance: float = 0.5) -> Dict[str, ContainmentTree]:
+    """One ContainmentTree per layer (keyed by lowercased layer name)."""
+    layers: Dict[str, List[PathInfo]] = {}
+    for p in paths:
+        layers.setdefault(_layer_key(p), []).append(p)
+    return {key: ContainmentTree(layer_paths, tolerance) for key, layer_paths in layers.items()}
+
+
+def identify_letters(paths_info: List[PathInfo], layer_name: Optional[str] = None,
+                     table: Optional[PathTable] = None,
+                     trees: Optional[Dict[str, ContainmentTree]] = None) -> List[PathInfo]:
     """
     Find paths that are "outer shapes" (not contained within other paths).
     These are the letter outlines.
@@ -53,90 +217,46 @@ def identify_letters(paths_info: List[PathInfo], layer_name: Optional[str] = Non
     Args:
         paths_info: List of all paths
         layer_name: Optional layer to filter by (None = all layers)
+        table: Columnar view of paths_info (built here if not given)
+        trees: Per-layer containment trees (build_containment_trees), shared
+               with find_holes_in_letters(); built over the candidates if not given
 
     Returns:
         List of PathInfo objects that are letter outlines
     """
-    # Filter candidates
+    # Filter candidates: closed, with a polygon, not a small circle (letters are not holes)
+    if table is None:
+        table = PathTable(paths_info)
+    mask = table.is_closed & table.has_polygon & ~table.is_circle
     if layer_name:
-        candidates = [
-            p for p in paths_info
-            if p.layer_name and p.layer_name.lower() == layer_name.lower()
-            and p.is_closed
-            and p.polygon is not None
-            and not p.is_circle  # Letters are not small circles
-        ]
-    else:
-        candidates = [
-            p for p in paths_info
-            if p.is_closed
-            and p.polygon is not None
-            and not p.is_circle
-        ]
+        mask &= table.layer_mask(layer_name)
+    candidates = table.select(mask)
 
     if not candidates:
         return []
 
-    # Group candidates by layer for per-layer spatial indexing
+    # Group candidates by layer: containment is only checked within a layer
     layer_groups: Dict[str, List[PathInfo]] = {}
     for c in candidates:
-        key = (c.layer_name or '').lower()
-        layer_groups.setdefault(key, []).append(c)
+        layer_groups.setdefault(_layer_key(c), []).append(c)
 
     letters = []
-    contained_by = {}  # Debug: track what contains each excluded path
-
     for layer_key, layer_candidates in layer_groups.items():
-        # Build STRtree for this layer if enough paths to benefit
-        tree = None
-        tree_paths = None
-        if STRtree is not None and len(layer_candidates) >= 10:
-            polys = [c.polygon for c in layer_candidates]
-            if all(p is not None for p in polys):
-                tree = STRtree(polys)
-                tree_paths = layer_candidates
-
-        for path in layer_candidates:
-            is_contained = False
-            path_area = path.area or 0
-
-            # Determine which candidates to check against
-            if tree is not None and path.polygon is not None:
-                # Query tree for bbox-overlapping candidates
-                hit_indices = tree.query(path.polygon)
-                check_against = [tree_paths[i] for i in hit_indices]
-            else:
-                check_against = layer_candidates
-
-            for other in check_against:
-                if other.path_id == path.path_id:
-                    continue
-
-                other_area = other.area or 0
-                if other_area > 0 and path_area > 0 and other_area < path_area:
-                    continue
-
-                if path.polygon and other.polygon:
-                    if polygon_contains(other.polygon, path.polygon):
-                        is_contained = True
-                        contained_by[path.path_id] = other.path_id
-                        break
-                else:
-                    if path.bbox and other.bbox:
-                        if bbox_contains(other.bbox, path.bbox, tolerance=1.0):
-                            is_contained = True
-                            contained_by[path.path_id] = other.path_id
-                            break
-
-            if not is_contained:
+        tree = trees.get(layer_key) if trees is not None else None
+        if tree is None:
+            tree = ContainmentTree(layer_candidates, GEOMETRY_CONFIG['containment_tolerance'])
+        candidate_ids = {id(c) for c in layer_candidates}
+        is_candidate = np.fromiter((id(p) in candidate_ids for p in tree.paths),
+                                   dtype=bool, count=len(tree.paths))
+        parent = tree.parents(is_candidate)
+
+        for i in np.flatnonzero(is_candidate).tolist():
+            path = tree.paths[i]
+            if parent[i] < 0:
                 letters.append(path)
-
-    # Attach debug info for diagnostics
-    for path in candidates:
-        if path.path_id in contained_by:
-            path._contained_by = contained_by[path.path_id]
-        elif path.path_id not in [l.path_id for l in letters]:
-            path._contained_by = '__not_candidate__'
+            else:
+                # Debug info for diagnostics: the immediate containing candidate
+                path._contained_by = tree.paths[parent[i]].path_id
 
     return letters
 
@@ -163,7 +283,7 @@ def path_is_inside_letter(hole: PathInfo, letter: PathInfo,
     """
     # Use compound_polygon if available (has counter holes subtracted)
     # This correctly excludes the counter area from containment checks
-    letter_poly = getattr(letter, 'compound_polygon', None) or letter.polygon
+    letter_poly = letter.compound_polygon or letter.polygon
 
     # Prefer polygon-based containment
     if hole.polygon and letter_poly:
@@ -198,7 +318,7 @@ def find_paths_inside_letter(letter: PathInfo, all_paths: List[PathInfo],
     """
     inside = []
     letter_layer = (letter.layer_name or '').lower()
-    letter_poly = getattr(letter, 'compound_polygon', None) or letter.polygon
+    letter_poly = letter.compound_polygon or letter.polygon
 
     # Use spatial index if available and letter has a polygon
     if spatial_index is not None and letter_poly is not None:
@@ -223,6 +343,116 @@ def find_paths_inside_letter(letter: PathInfo, all_paths: List[PathInfo],
     return inside
 
 
+def find_holes_in_letters(letters: List[PathInfo], all_paths: List[PathInfo],
+                          tolerance: float = 0.5,
+                          trees: Optional[Dict[str, ContainmentTree]] = None
+                          ) -> List[List[PathInfo]]:
+    """
+    Find the paths inside every letter in one bulk pass.
+
+    Equivalent to calling find_paths_inside_letter() for each letter, but per
+    layer it builds one STRtree over the candidate hole polygons, queries all
+    letters' tolerance-expanded bounds at once, and evaluates containment
+    with polygon_contains_many() (centroids computed once per hole, tolerance
+    buffers once per letter). Paths without usable polygons, and letters
+    without one, take the scalar path_is_inside_letter() route.
+
+    With per-layer containment trees (build_containment_trees over
+    all_paths, same tolerance), letters whose containment polygon is their
+    own polygon read their holes straight off the tree's containment pairs.
+
+    Args:
+        letters: Letter paths (compound_polygon used when set)
+        all_paths: All paths to check
+        tolerance: Containment tolerance
+        trees: Optional build_containment_trees(all_paths, tolerance) result
+
+    Returns:
+        One list of inner paths per letter, in all_paths order
+    """
+    if STRtree is None:
+        return [find_paths_inside_letter(letter, all_paths, tolerance) for letter in letters]
+
+    if trees is not None and all(
+        (letter.compound_polygon is None or letter.compound_polygon is letter.polygon)
+        and _layer_key(letter) in trees and trees[_layer_key(letter)].tolerance == tolerance
+        for letter in letters
+    ):
+        return [trees[_layer_key(letter)].inside(letter) for letter in letters]
+
+    results: List[List[PathInfo]] = [[] for _ in letters]
+
+    layer_letters: Dict[str, List[int]] = {}
+    for i, letter in enumerate(letters):
+        layer_letters.setdefault(_layer_key(letter), []).append(i)
+
+    layer_paths: Dict[str, List[int]] = {}
+    for j, path in enumerate(all_paths):
+        key = _layer_key(path)
+        if key in layer_letters:
+            layer_paths.setdefault(key, []).append(j)
+
+    for key, letter_ids in layer_letters.items():
+        path_ids = layer_paths.get(key, [])
+        if not path_ids:
+            continue
+
+        # (letter index, path index) pairs found inside, gathered per layer
+        found = set()
+
+        letter_polys = [letters[i].compound_polygon or letters[i].polygon
+                        for i in letter_ids]
+        vec_letters = [n for n, poly in enumerate(letter_polys) if _has_area_geometry(poly)]
+        vec_paths = [j for j in path_ids if _has_area_geometry(all_paths[j].polygon)]
+        vec_path_set = set(vec_paths)
+
+        # Vectorized: polygon letters x polygon holes
+        if vec_letters and vec_paths:
+            try:
+                outers = np.array([letter_polys[n] for n in vec_letters], dtype=object)
+                inners = np.array([all_paths[j].polygon for j in vec_paths], dtype=object)
+                tree = STRtree(inners)
+
+                # Same bbox pre-check as polygon_contains (bounds grown by tolerance)
+                bounds = shapely.bounds(outers)
+                search = shapely.box(bounds[:, 0] - tolerance, bounds[:, 1] - tolerance,
+                                     bounds[:, 2] + tolerance, bounds[:, 3] + tolerance)
+                outer_idx, inner_idx = tree.query(search)
+
+                # Drop self-pairs (a letter is never its own hole)
+                letter_pids = np.array([letters[letter_ids[n]].path_id for n in vec_letters],
+                                       dtype=object)
+                path_pids = np.array([all_paths[j].path_id for j in vec_paths], dtype=object)
+                keep = letter_pids[outer_idx] != path_pids[inner_idx]
+                outer_idx, inner_idx = outer_idx[keep], inner_idx[keep]
+
+                inside = polygon_contains_many(outers, inners, outer_idx, inner_idx, tolerance)
+                for o, h in zip(outer_idx[inside].tolist(), inner_idx[inside].tolist()):
+                    found.add((letter_ids[vec_letters[o]], vec_paths[h]))
+            except Exception:
+                # Invalid geometry somewhere in the batch — fall back to scalar checks
+                vec_letters = []
+                vec_path_set = set()
+
+        # Scalar: every pair the vectorized pass did not cover
+        vec_letter_ids = {letter_ids[n] for n in vec_letters}
+        for i in letter_ids:
+            letter = letters[i]
+            for j in path_ids:
+                if i in vec_letter_ids and j in vec_path_set:
+                    continue
+                path = all_paths[j]
+                if path.path_id == letter.path_id:
+                    continue
+                if path_is_inside_letter(path, letter, tolerance):
+                    found.add((i, j))
+
+        for i, j in sorted(found):
+            results[i].append(all_paths[j])
+
+    return results
+
+
 def create_hole_info(path: PathInfo, scale: float = 1.0) -> HoleInfo:
     """
     Create an UNCLASSIFIED HoleInfo object from a PathInfo.
@@ -236,7 +466,7 @@ def create_hole_info(path: PathInfo, scale: float = 1.0) -> HoleInfo:
     """
     # Use original_bbox (raw coordinates) for center since svg_path_data is also raw
     # This ensures SVG rendering is consistent (both in same coordinate space)
-    raw_bbox = getattr(path, 'original_bbox', None) or path.bbox
+    raw_bbox = path.original_bbox or path.bbox
     center = (0.0, 0.0)
     if raw_bbox:
         center = get_centroid(raw_bbox)
@@ -299,10 +529,10 @@ def build_letter_group(letter: PathInfo, inner_paths: List[PathInfo],
     net_area = letter.area or 0
 
     # Get raw bbox (matches path coordinates for SVG rendering)
-    raw_bbox = getattr(letter, 'original_bbox', None) or letter.bbox or (0, 0, 0, 0)
+    raw_bbox = letter.original_bbox or letter.bbox or (0, 0, 0, 0)
 
     # Get transformed bbox for positioning in global coordinate space
-    if hasattr(letter, 'original_bbox') and letter.original_bbox:
+    if letter.original_bbox:
         bbox = letter.bbox or (0, 0, 0, 0)  # Already transformed
     else:
         bbox = raw_bbox
@@ -381,46 +611,43 @@ def analyze_letter_hole_associations(
     # TODO: 3D Print files are 100% scale even for Working File — implement spec-specific scale override later
     scale = cfg.get('file_scale', 0.1)
 
+    # Columnar view of the (now globally transformed) paths for the vectorized filters below
+    table = PathTable(paths_info)
+
     # Filter out tiny circles (< 2% of the SVG extent) — they're artifacts, not holes
     # But preserve circles that match known standard hole sizes (wire, mounting, etc.)
     min_hole_pct = cfg.get('min_hole_percent', 0.02)
-    standard_sizes = cfg.get('standard_hole_sizes', [])
-    all_bboxes = [p.bbox for p in paths_info if p.bbox]
-    if all_bboxes:
-        svg_width = max(b[2] for b in all_bboxes) - min(b[0] for b in all_bboxes)
-        svg_height = max(b[3] for b in all_bboxes) - min(b[1] for b in all_bboxes)
+    hole_sizes = HoleSizeCatalog.from_config(cfg)
+    bboxes = table.bbox[table.has_bbox]
+    if len(bboxes):
+        svg_width = bboxes[:, 2].max() - bboxes[:, 0].min()
+        svg_height = bboxes[:, 3].max() - bboxes[:, 1].min()
         min_circle_diameter = max(svg_width, svg_height) * min_hole_pct
-        for p in paths_info:
-            # Compare in transformed coordinate space (bbox is already transformed above)
-            if p.is_circle and p.bbox:
-                transformed_w = p.bbox[2] - p.bbox[0]
-                transformed_h = p.bbox[3] - p.bbox[1]
-                transformed_diameter = (transformed_w + transformed_h) / 2
-                if transformed_diameter < min_circle_diameter:
-                    # Before stripping is_circle, check if this matches a standard hole size
-                    if standard_sizes and scale > 0 and p.circle_diameter is not None:
-                        real_mm = p.circle_diameter / (72 * scale) * 25.4
-                        matches_standard = any(
-                            abs(real_mm - s['diameter_mm']) <= s.get('tolerance_mm', 0.03)
-                            for s in standard_sizes
-                        )
-                        if matches_standard:
-                            continue  # Keep is_circle — it's a real hole
-                    p.is_circle = False  # Too small to be a hole — exclude from analysis
+        # Compare in transformed coordinate space (bbox is already transformed above)
+        transformed_diameter = ((table.bbox[:, 2] - table.bbox[:, 0]) +
+                                (table.bbox[:, 3] - table.bbox[:, 1])) / 2
+        too_small = table.is_circle & table.has_bbox & (transformed_diameter < min_circle_diameter)
+        # Before stripping is_circle, check if this matches a standard hole size
+        if hole_sizes and scale > 0:
+            real_mm = table.circle_diameter / (72 * scale) * 25.4
+            too_small &= ~hole_sizes.matches_any(real_mm)  # Keep is_circle — it's a real hole
+        _clear_circles(table, too_small)  # Too small to be a hole — exclude from analysis
 
     # Reclassify circles that are too LARGE to be holes — they're letter shapes
     # (e.g., the dot of "i", a period, a circular logo element)
     # Max real-world hole is 16mm; anything larger is definitely a letter
     max_hole_mm = 16.0
     if scale > 0:
-        for p in paths_info:
-            if p.is_circle and p.circle_diameter is not None:
-                real_mm = p.circle_diameter / (72 * scale) * 25.4
-                if real_mm > max_hole_mm:
-                    p.is_circle = False
+        real_mm = table.circle_diameter / (72 * scale) * 25.4
+        _clear_circles(table, table.is_circle & (real_mm > max_hole_mm))
+
+    # One containment sweep per layer, shared by letter and hole detection
+    trees = None
+    if STRtree is not None:
+        trees = build_containment_trees(paths_info, cfg['containment_tolerance'])
 
     # Find all letters
-    letters = identify_letters(paths_info, layer_name)
+    letters = identify_letters(paths_info, layer_name, table, trees)
 
     if not letters:
         # No letters found, check for orphan circles
@@ -434,8 +661,9 @@ def analyze_letter_hole_associations(
             orphan_holes=orphan_holes,
             unassigned_paths=[],
             detected_scale=scale,
+            path_table=table,
             stats={
-                'layers_analyzed': list(set(p.layer_name for p in paths_info if p.layer_name)),
+                'layers_analyzed': list(table.layers_found()),
                 'total_paths': len(paths_info),
                 'circles_found': len(circles)
             }
@@ -451,31 +679,14 @@ def analyze_letter_hole_associations(
     for letter in letters:
         letter.compound_polygon = letter.polygon
 
-    # Build per-layer spatial indices for fast hole lookup
-    # Only index paths with valid polygons; track non-indexed paths separately
-    layer_indices: Dict[str, Tuple] = {}
-    if STRtree is not None:
-        layer_paths: Dict[str, List[PathInfo]] = {}
-        for p in paths_info:
-            key = (p.layer_name or '').lower()
-            layer_paths.setdefault(key, []).append(p)
-        for key, lp in layer_paths.items():
-            indexed = [p for p in lp if p.polygon is not None]
-            non_indexed = [p for p in lp if p.polygon is None]
-            if len(indexed) >= 10:
-                geoms = [p.polygon for p in indexed]
-                layer_indices[key] = (STRtree(geoms), indexed, non_indexed)
-
-    # Find holes inside letters (using compound polygons for correct containment)
-    letter_groups = []
-    for letter in letters:
-        l_key = (letter.layer_name or '').lower()
-        idx = layer_indices.get(l_key)
-        inner_paths = find_paths_inside_letter(
-            letter, paths_info, cfg['containment_tolerance'],
-            spatial_index=idx
-        )
+    # Find holes inside letters in one bulk pass per layer
+    # (using compound polygons for correct containment)
+    letter_inner_paths = find_holes_in_letters(
+        letters, paths_info, cfg['containment_tolerance'], trees
+    )
 
+    letter_groups = []
+    for letter, inner_paths in zip(letters, letter_inner_paths):
         for inner in inner_paths:
             assigned_path_ids.add(inner.path_id)
 
@@ -524,11 +735,11 @@ def analyze_letter_hole_associations(
             'path_id': p.path_id,
             'reason': reason,
             'layer': p.layer_name or '',
-            'is_compound': getattr(p, 'is_compound', False),
+            'is_compound': p.is_compound,
             'is_closed': p.is_closed,
             'has_polygon': p.polygon is not None,
             'area': round(p.area, 2) if p.area else 0,
-            'contained_by': getattr(p, '_contained_by', None),
+            'contained_by': p._contained_by,
         })
 
     # Build stats with full path accounting
@@ -551,6 +762,7 @@ def analyze_letter_hole_associations(
         unassigned_paths=unassigned_paths,
         unprocessed_paths=unprocessed_paths,
         detected_scale=scale,
+        path_table=table,
         stats={
             'layers_analyzed': layers_with_letters,
             'total_paths': len(paths_info),
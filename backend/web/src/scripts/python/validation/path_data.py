@@ -0,0 +1,289 @@
+"""
+Native SVG path-data parser with array-backed segment storage.
+
+svgpathtools.parse_path builds one Line / CubicBezier / ... object (with
+complex-number attributes) per segment, and corner_analysis used to parse
+every d attribute a second time. parse_path_data() tokenizes a d string once
+and writes the segments straight into NumPy arrays (sampling.SegmentArrays):
+
+    kinds  int8 segment code (SEG_LINE / SEG_QUAD / SEG_CUBIC / SEG_ARC)
+    ctrl   complex (n, 4) control points, padded with the end point
+    arc    float (n, 8) ellipse parameters for arcs
+
+plus the subpath boundaries, split exactly where svgpathtools'
+continuous_subpaths() would split. Grammar handling follows svgpathtools'
+parser (implicit commands, S/T reflection, closing line on Z, zero-radius
+arcs as lines) so the geometry is identical; arcs are parameterized through
+svgpathtools.Arc itself.
+
+PathData mirrors the parts of the svgpathtools Path API the validators use
+(len, bbox, length, iscontinuous, continuous_subpaths) and can still build a
+real Path (to_path) where one is needed.
+"""
+
+import math
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .sampling import (
+    SegmentArrays, SEG_LINE, SEG_QUAD, SEG_CUBIC, SEG_ARC, bounding_box, segment_lengths
+)
+
+try:
+    from svgpathtools import Path, Line, QuadraticBezier, CubicBezier, Arc
+except ImportError:
+    Path = Line = QuadraticBezier = CubicBezier = Arc = None
+
+# Same tokens as svgpathtools' parser
+_COMMAND_SPLIT = re.compile(r'([MmZzLlHhVvCcSsQqTtAa])')
+_FLOAT = re.compile(r'[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?')
+_ARC_FLAG = re.compile(r'[01]')
+_SEPARATOR = re.compile(r'[\s,]*')
+
+_NUM_ARGS = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0}
+
+
+class PathData:
+    """Parsed path data: segment arrays plus continuous-subpath boundaries."""
+
+    __slots__ = ('arrays', 'subpath_bounds', '_arcs')
+
+    def __init__(self, arrays: SegmentArrays, arcs: Optional[Dict[int, object]] = None):
+        self.arrays = arrays
+        self._arcs = arcs or {}
+        n = len(arrays)
+        if n:
+            ctrl = arrays.ctrl
+            breaks = np.flatnonzero(ctrl[:-1, 3] != ctrl[1:, 0]) + 1
+            self.subpath_bounds = np.concatenate(([0], breaks, [n]))
+        else:
+            self.subpath_bounds = np.zeros(1, dtype=np.int64)
+
+    @classmethod
+    def from_segments(cls, kinds: Sequence[int], ctrl: Sequence[Sequence[complex]]) -> 'PathData':
+        """Build from segment codes and (start, c1, c2, end)-padded control points (no arcs)."""
+        arrays = SegmentArrays.from_arrays(
+            np.asarray(kinds, dtype=np.int8),
+            np.asarray(ctrl, dtype=complex).reshape(-1, 4),
+        )
+        return cls(arrays)
+
+    @classmethod
+    def from_path(cls, path) -> 'PathData':
+        """Array view of an existing svgpathtools Path."""
+        segments = list(path)
+        arcs = {i: seg for i, seg in enumerate(segments) if Arc is not None and isinstance(seg, Arc)}
+        return cls(SegmentArrays(segments), arcs)
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    @property
+    def num_subpaths(self) -> int:
+        return max(1, len(self.subpath_bounds) - 1)
+
+    def iscontinuous(self) -> bool:
+        return len(self.subpath_bounds) <= 2
+
+    def subpath_ends(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and end point of every continuous subpath."""
+        bounds = self.subpath_bounds
+        if len(bounds) < 2:
+            return np.empty(0, dtype=complex), np.empty(0, dtype=complex)
+        ctrl = self.arrays.ctrl
+        return ctrl[bounds[:-1], 0], ctrl[bounds[1:] - 1, 3]
+
+    def continuous_subpaths(self) -> List['PathData']:
+        bounds = self.subpath_bounds
+        if len(bounds) <= 2:
+            return [self]
+        return [self._slice(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+    def _slice(self, lo: int, hi: int) -> 'PathData':
+        arrays = self.arrays
+        sub = SegmentArrays.from_arrays(arrays.kinds[lo:hi], arrays.ctrl[lo:hi], arrays.arc[lo:hi])
+        if arrays.lengths is not None:
+            sub.lengths = arrays.lengths[lo:hi]
+        return PathData(sub, {i - lo: a for i, a in self._arcs.items() if lo <= i < hi})
+
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """(xmin, xmax, ymin, ymax), in svgpathtools' Path.bbox() order."""
+        xmin, ymin, xmax, ymax = bounding_box(self.arrays)
+        return xmin, xmax, ymin, ymax
+
+    def length(self) -> float:
+        """Total arc length (segment lengths are memoized on the arrays)."""
+        return math.fsum(segment_lengths(self.arrays).tolist())
+
+    def to_path(self):
+        """Equivalent svgpathtools Path (built segment by segment, no string parsing)."""
+        segments = []
+        for i, (kind, c) in enumerate(zip(self.arrays.kinds, self.arrays.ctrl)):
+            if kind == SEG_LINE:
+                segments.append(Line(c[0], c[1]))
+            elif kind == SEG_QUAD:
+                segments.append(QuadraticBezier(c[0], c[1], c[2]))
+            elif kind == SEG_CUBIC:
+                segments.append(CubicBezier(c[0], c[1], c[2], c[3]))
+            else:
+                segments.append(self._arcs[i])
+        return Path(*segments)
+
+
+def _arc_tokens(text: str) -> List[str]:
+    """Arc arguments: flags may be written without separators ("0110 0")."""
+    tokens = []
+    pos = 0
+    n = len(text)
+    while True:
+        pos = _SEPARATOR.match(text, pos).end()
+        if pos >= n:
+            return tokens
+        match = _ARC_FLAG.match(text, pos) if len(tokens) % 7 in (3, 4) else None
+        if match is None:
+            match = _FLOAT.match(text, pos)
+        if match is None:
+            return tokens
+        tokens.append(match.group())
+        pos = match.end()
+
+
+def parse_path_data(d: str) -> PathData:
+    """
+    Parse an SVG path d attribute into PathData.
+
+    Raises:
+        ValueError for malformed path data (same cases svgpathtools rejects)
+    """
+    kinds: List[int] = []
+    ctrl: List[Tuple[complex, complex, complex, complex]] = []
+    arcs: Dict[int, object] = {}
+
+    chunks = _COMMAND_SPLIT.split(d)
+    if _FLOAT.search(chunks[0]):
+        raise ValueError(f"Unallowed implicit command in {d}")
+
+    current = 0j
+    start = None
+    previous = None  # Effective previous command (M continues as L, Z resets)
+
+    for i in range(1, len(chunks), 2):
+        letter = chunks[i]
+        command = letter.upper()
+        absolute = letter == command
+
+        if command == 'Z':
+            if _FLOAT.search(chunks[i + 1]):
+                raise ValueError(f"Unallowed implicit command in {d}")
+            if start is None:
+                raise ValueError(f"Close path without a current subpath in {d}")
+            if current != start:
+                kinds.append(SEG_LINE)
+                ctrl.append((current, start, start, start))
+            current = start
+            previous = None
+            continue
+
+        text = chunks[i + 1]
+        values = [float(v) for v in (_arc_tokens(text) if command == 'A' else _FLOAT.findall(text))]
+        n_args = _NUM_ARGS[command]
+        if not values or len(values) % n_args:
+            raise ValueError(f"Invalid path string: command '{letter}' expects "
+                             f"{n_args} values per segment in {d!r}")
+
+        for k in range(0, len(values), n_args):
+            v = values[k:k + n_args]
+            last = previous
+            if command == 'M':
+                pos = v[0] + v[1] * 1j
+                current = pos if absolute else current + pos
+                start = current
+                # Implicit coordinates after a moveto are linetos
+                command = previous = 'L'
+                continue
+
+            if command == 'L':
+                pos = v[0] + v[1] * 1j
+                if not absolute:
+                    pos += current
+                kinds.append(SEG_LINE)
+                ctrl.append((current, pos, pos, pos))
+            elif command == 'H':
+                pos = v[0] + current.imag * 1j
+                if not absolute:
+                    pos += current.real
+                kinds.append(SEG_LINE)
+                ctrl.append((current, pos, pos, pos))
+            elif command == 'V':
+                pos = current.real + v[0] * 1j
+                if not absolute:
+                    pos += current.imag * 1j
+                kinds.append(SEG_LINE)
+                ctrl.append((current, pos, pos, pos))
+            elif command in ('C', 'S'):
+                if command == 'C':
+                    control1 = v[0] + v[1] * 1j
+                    rest = v[2:]
+                    if not absolute:
+                        control1 += current
+                elif last in ('C', 'S'):
+                    # Reflection of the previous second control point
+                    control1 = current + current - ctrl[-1][2]
+                    rest = v
+                else:
+                    control1 = current
+                    rest = v
+                control2 = rest[0] + rest[1] * 1j
+                pos = rest[2] + rest[3] * 1j
+                if not absolute:
+                    control2 += current
+                    pos += current
+                kinds.append(SEG_CUBIC)
+                ctrl.append((current, control1, control2, pos))
+            elif command in ('Q', 'T'):
+                if command == 'Q':
+                    control = v[0] + v[1] * 1j
+                    rest = v[2:]
+                    if not absolute:
+                        control += current
+                elif last in ('Q', 'T'):
+                    control = current + current - ctrl[-1][1]
+                    rest = v
+                else:
+                    control = current
+                    rest = v
+                pos = rest[0] + rest[1] * 1j
+                if not absolute:
+                    pos += current
+                kinds.append(SEG_QUAD)
+                ctrl.append((current, control, pos, pos))
+            else:  # 'A'
+                radius = v[0] + v[1] * 1j
+                pos = v[5] + v[6] * 1j
+                if not absolute:
+                    pos += current
+                if radius.real == 0 or radius.imag == 0:
+                    # Zero-radius arcs render as lines
+                    kinds.append(SEG_LINE)
+                    ctrl.append((current, pos, pos, pos))
+                else:
+                    if Arc is None:
+                        raise ValueError("Arc segments require svgpathtools")
+                    arcs[len(kinds)] = Arc(current, radius, v[2], v[3], v[4], pos)
+                    kinds.append(SEG_ARC)
+                    ctrl.append((current, pos, pos, pos))
+            current = pos
+            previous = command
+
+    arrays = SegmentArrays.from_arrays(
+        np.asarray(kinds, dtype=np.int8),
+        np.asarray(ctrl, dtype=complex).reshape(-1, 4),
+    )
+    for i, arc in arcs.items():
+        arrays.arc[i] = (arc.center.real, arc.center.imag,
+                         arc.radius.real, arc.radius.imag,
+                         arc.rot_matrix.real, arc.rot_matrix.imag,
+                         arc.theta, arc.delta)
+    return PathData(arrays, arcs)
@@ -0,0 +1,132 @@
+"""
+Deferred per-path geometry for PathInfo.
+
+Extraction used to compute every path's bbox, arc length, subpath
+decomposition, circle test and sampled polygon up front, whether or not any
+active rule would look at them. PathGeometry holds the parsed path data
+(path_data.PathData segment arrays, or just the d-string) plus the sampling
+parameters and computes each group of PathInfo fields on first request,
+memoizing the result. An svgpathtools Path is only built when something
+still needs the object API.
+
+Groups (method name → PathInfo fields, see core.LAZY_FIELD_GROUPS):
+    bbox     → bbox
+    length   → length
+    closure  → is_closed, is_compound, num_subpaths
+    polygon  → polygon, area, num_holes
+    circle   → is_circle, circle_diameter
+
+Values are computed from the raw (untransformed) path only, so they stay
+correct even after letter analysis has replaced PathInfo.bbox / .polygon with
+globally transformed versions.
+"""
+
+from typing import Optional, Tuple
+
+from .geometry import is_circle_path, path_to_polygon, compound_path_to_polygon
+from .path_data import PathData, parse_path_data
+
+_UNSET = object()
+
+
+class PathGeometry:
+    """Lazily computed geometry of one parsed path."""
+
+    __slots__ = ('_path', '_data', '_d', 'max_point_distance', 'flatten_tolerance',
+                 '_bbox', '_length', '_closure', '_polygon', '_circle')
+
+    def __init__(self, path=None, d: Optional[str] = None,
+                 max_point_distance: Optional[float] = None,
+                 flatten_tolerance: Optional[float] = None,
+                 data: Optional[PathData] = None):
+        self._path = path
+        self._data = data
+        self._d = d
+        self.max_point_distance = max_point_distance
+        self.flatten_tolerance = flatten_tolerance
+        self._bbox = _UNSET
+        self._length = _UNSET
+        self._closure = _UNSET
+        self._polygon = _UNSET
+        self._circle = _UNSET
+
+    @property
+    def data(self) -> Optional[PathData]:
+        """Segment arrays, parsed from the d-string (or read off the Path) on first use."""
+        if self._data is None:
+            if self._path is not None:
+                self._data = PathData.from_path(self._path)
+            elif self._d is not None:
+                self._data = parse_path_data(self._d)
+        return self._data
+
+    @property
+    def path(self):
+        """svgpathtools Path, built from the segment arrays on first use."""
+        if self._path is None and self.data is not None:
+            self._path = self._data.to_path()
+        return self._path
+
+    def bbox(self) -> Tuple[Optional[Tuple[float, float, float, float]]]:
+        if self._bbox is _UNSET:
+            try:
+                xmin, xmax, ymin, ymax = self.data.bbox()
+                self._bbox = (xmin, ymin, xmax, ymax)
+            except Exception:
+                self._bbox = None
+        return (self._bbox,)
+
+    def length(self) -> Tuple[float]:
+        if self._length is _UNSET:
+            try:
+                self._length = self.data.length()
+            except Exception:
+                self._length = 0
+        return (self._length,)
+
+    def closure(self) -> Tuple[bool, bool, int]:
+        if self._closure is _UNSET:
+            is_closed = False
+            is_compound = False
+            num_subpaths = 1
+            try:
+                data = self.data
+                if len(data) > 0:
+                    starts, ends = data.subpath_ends()
+                    if data.iscontinuous():
+                        is_closed = bool(abs(starts[0] - ends[0]) < 0.5)
+                    else:
+                        num_subpaths = data.num_subpaths
+                        is_compound = True
+                        is_closed = bool((abs(starts - ends) < 0.5).all())
+            except Exception:
+                pass
+            self._closure = (is_closed, is_compound, num_subpaths)
+        return self._closure
+
+    def polygon(self) -> Tuple[Optional[object], Optional[float], int]:
+        if self._polygon is _UNSET:
+            is_closed, is_compound, _ = self.closure()
+            area = None
+            num_holes = 0
+            path_polygon = None
+            if is_closed:
+                to_polygon = compound_path_to_polygon if is_compound else path_to_polygon
+                path_polygon = to_polygon(self.data, max_point_distance=self.max_point_distance,
+                                          flatten_tolerance=self.flatten_tolerance)
+                if path_polygon and path_polygon.is_valid:
+                    area = abs(path_polygon.area)
+                    # Handle both Polygon and MultiPolygon types
+                    if path_polygon.geom_type == 'Polygon':
+                        num_holes = len(list(path_polygon.interiors))
+                    elif path_polygon.geom_type == 'MultiPolygon':
+                        # Sum holes from all polygons in the multipolygon
+                        num_holes = sum(len(list(poly.interiors)) for poly in path_polygon.geoms)
+            self._polygon = (path_polygon, area, num_holes)
+        return self._polygon
+
+    def circle(self) -> Tuple[bool, Optional[float]]:
+        if self._circle is _UNSET:
+            # Control-point fit: needs neither the bbox nor the arc length
+            self._circle = is_circle_path(self.data)
+        return self._circle
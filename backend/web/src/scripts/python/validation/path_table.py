@@ -0,0 +1,127 @@
+"""
+Columnar (NumPy) view of per-path scalars.
+
+Stats collection, hole-size thresholds and layer filters used to loop over
+PathInfo objects in Python, one attribute lookup at a time. PathTable pulls
+each scalar into an array once so those passes become vectorized masks:
+
+    table = PathTable(paths_info)
+    mask = table.layer_mask('return') & table.is_closed & ~table.is_circle
+    letters = table.select(mask)
+
+Columns are built on first access (so lazy PathInfo geometry is only
+computed for columns that are actually used) and are snapshots: code that
+mutates PathInfo fields afterwards must update the column too (see
+analyze_letter_hole_associations for is_circle). Missing values (bbox/area/
+circle_diameter of None) are NaN.
+"""
+
+from functools import cached_property
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from .core import PathInfo
+
+
+class PathTable:
+    """Per-path scalar columns for a list of PathInfo objects."""
+
+    def __init__(self, paths: Sequence[PathInfo]):
+        self.paths: List[PathInfo] = list(paths)
+
+        # Layer codes index into layer_names (first-seen order; None is a layer too)
+        codes: Dict[Optional[str], int] = {}
+        self.layer_code = np.fromiter(
+            (codes.setdefault(p.layer_name, len(codes)) for p in self.paths),
+            dtype=np.int32, count=len(self.paths)
+        )
+        self.layer_names: List[Optional[str]] = list(codes)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def _column(self, values, dtype) -> np.ndarray:
+        return np.fromiter(values, dtype=dtype, count=len(self.paths))
+
+    def _optional_floats(self, name: str) -> np.ndarray:
+        return self._column(
+            (np.nan if v is None else v for v in (getattr(p, name) for p in self.paths)),
+            np.float64
+        )
+
+    @cached_property
+    def bbox(self) -> np.ndarray:
+        """(n, 4) xmin, ymin, xmax, ymax; NaN rows where bbox is None."""
+        out = np.full((len(self.paths), 4), np.nan)
+        for i, p in enumerate(self.paths):
+            if p.bbox:
+                out[i] = p.bbox
+        return out
+
+    @cached_property
+    def has_bbox(self) -> np.ndarray:
+        return ~np.isnan(self.bbox[:, 0])
+
+    @cached_property
+    def length(self) -> np.ndarray:
+        return self._column((p.length for p in self.paths), np.float64)
+
+    @cached_property
+    def area(self) -> np.ndarray:
+        return self._optional_floats('area')
+
+    @cached_property
+    def is_closed(self) -> np.ndarray:
+        return self._column((bool(p.is_closed) for p in self.paths), bool)
+
+    @cached_property
+    def is_circle(self) -> np.ndarray:
+        return self._column((bool(p.is_circle) for p in self.paths), bool)
+
+    @cached_property
+    def circle_diameter(self) -> np.ndarray:
+        return self._optional_floats('circle_diameter')
+
+    @cached_property
+    def is_compound(self) -> np.ndarray:
+        return self._column((bool(p.is_compound) for p in self.paths), bool)
+
+    @cached_property
+    def num_holes(self) -> np.ndarray:
+        return self._column((p.num_holes for p in self.paths), np.int64)
+
+    @cached_property
+    def has_polygon(self) -> np.ndarray:
+        return self._column((p.polygon is not None for p in self.paths), bool)
+
+    @cached_property
+    def has_stroke(self) -> np.ndarray:
+        return self._column((bool(p.stroke) for p in self.paths), bool)
+
+    @cached_property
+    def has_fill(self) -> np.ndarray:
+        return self._column((bool(p.fill and p.fill != 'none') for p in self.paths), bool)
+
+    def layer_mask(self, layer_name: str) -> np.ndarray:
+        """Rows on the given layer (case-insensitive, like the rule modules compare)."""
+        wanted = layer_name.lower()
+        codes = [i for i, name in enumerate(self.layer_names) if name and name.lower() == wanted]
+        return np.isin(self.layer_code, codes)
+
+    def select(self, mask: np.ndarray) -> List[PathInfo]:
+        """PathInfo objects for the rows where mask is True, in table order."""
+        return [self.paths[i] for i in np.flatnonzero(mask)]
+
+    def layers_found(self) -> Set[str]:
+        """Names of all (non-empty) layers present."""
+        return set(name for name in self.layer_names if name)
+
+    def paths_per_layer(self) -> Dict[str, int]:
+        """Path count per layer in first-seen order; unnamed layers count as '_unknown_'."""
+        counts = np.bincount(self.layer_code, minlength=len(self.layer_names))
+        per_layer: Dict[str, int] = {}
+        for name, count in zip(self.layer_names, counts):
+            key = name or '_unknown_'
+            per_layer[key] = per_layer.get(key, 0) + int(count)
+        return per_layer
@@ -0,0 +1,838 @@
+"""
+In-process vector extraction for PDF-compatible AI files.
+
+Illustrator saves "PDF compatible" AI files as a regular PDF whose page
+content stream holds every visible path. Instead of shelling out to
+Inkscape (seconds of startup per file) and then guessing which SVG group
+belongs to which OCG, extract_paths_from_pdf() decodes the first page
+directly:
+
+- path construction: m l c v y h re
+- painting: S s f F f* B B* b b* (n and clipping paths are not output)
+- graphics state: q Q cm w, plus stroke/fill colors (G g RG rg K k SC sc SCN scn)
+- optional content: BDC /OC markers (and /OC on form XObjects) give each
+  path its authoritative OCG layer name. OCGs switched off in the default
+  configuration map to '_hidden_', paths outside any OCG to '_no_layer_'
+- form XObjects (Do) are followed, inline images are skipped
+
+Coordinates are baked through the CTM and flipped into SVG orientation
+(y down from the top of the MediaBox), in points, the same frame the SVG
+route works in. The output is not yet checked for parity with the converter
+route on real Illustrator files, so the extractor is opt-in. Known gaps:
+
+- CMYK colors are converted to hex naively; Separation / DeviceN colors
+  are read as gray
+- pattern fills (scn with a pattern name) come out as fill=None
+- path ids are generated (path0, path1, ...) rather than Inkscape's
+- all OCGs hidden in the default configuration share the '_hidden_' layer
+
+The extractor returns None whenever a file is outside what it handles (not
+PDF-compatible, unsupported stream filter, no optional content markers,
+parse errors) and callers fall back to the converter chain.
+
+Environment:
+    AI_NATIVE_PDF  Set to 1 to try the native extractor before the external
+                   converters (default: 0, converters only)
+"""
+
+import math
+import mmap
+import os
+import re
+import sys
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import geometry_cache
+from .ai_sniffer import sniff_ai_file
+from .core import PathInfo
+from .path_data import PathData
+from .sampling import SEG_LINE, SEG_CUBIC
+from .path_geometry import PathGeometry
+from .svg_parser import is_system_or_separator_layer, prune_to_layers
+
+try:
+    from svgpathtools import Path
+except ImportError:
+    Path = None
+
+_WHITESPACE = b' \t\r\n\f\x00'
+_DELIMITERS = b'()<>[]{}/%'
+_OBJ_HEADER = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_NUMBER = re.compile(rb'[+-]?(?:\d+\.?\d*|\.\d+)')
+_INLINE_IMAGE_END = re.compile(rb'\sEI(?=[\s]|$)')
+_MAX_FORM_DEPTH = 16
+_PX_TO_PT = 0.75
+
+_FILL_OPS = frozenset((b'f', b'F', b'f*', b'B', b'B*', b'b', b'b*'))
+_STROKE_OPS = frozenset((b'S', b's', b'B', b'B*', b'b', b'b*'))
+_CLOSE_OPS = frozenset((b's', b'b', b'b*'))
+_PAINT_OPS = _FILL_OPS | _STROKE_OPS | frozenset((b'n',))
+
+
+class PdfError(Exception):
+    """The file uses PDF features this extractor does not handle."""
+
+
+class PdfRef(tuple):
+    """Indirect object reference (num, gen)."""
+    __slots__ = ()
+
+
+class PdfName(str):
+    """A PDF name object (/Name); plain str values are never names."""
+    __slots__ = ()
+
+
+class PdfStream:
+    """A stream object: its dictionary plus the raw (still encoded) bytes."""
+    __slots__ = ('dict', 'raw')
+
+    def __init__(self, stream_dict: Dict, raw: bytes):
+        self.dict = stream_dict
+        self.raw = raw
+
+
+class _Keyword(bytes):
+    """Bare keyword token (operator in content streams)."""
+
+
+# ---------------------------------------------------------------------------
+# Lexer / object parser
+# ---------------------------------------------------------------------------
+
+def _skip_space(data, pos: int) -> int:
+    n = len(data)
+    while pos < n:
+        ch = data[pos]
+        if ch in _WHITESPACE:
+            pos += 1
+        elif ch == 0x25:  # '%' comment
+            while pos < n and data[pos] not in b'\r\n':
+                pos += 1
+        else:
+            break
+    return pos
+
+
+def _read_literal_string(data, pos: int) -> Tuple[bytes, int]:
+    # pos is just past '('
+    out = bytearray()
+    depth = 1
+    n = len(data)
+    while pos < n:
+        ch = data[pos]
+        if ch == 0x5C:  # backslash
+            pos += 1
+            esc = data[pos:pos + 1]
+            mapping = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f',
+                       b'(': b'(', b')': b')', b'\\': b'\\'}
+            if esc in mapping:
+                out += mapping[esc]
+                pos += 1
+            elif esc in (b'\r', b'\n'):
+                pos += 1
+                if esc == b'\r' and data[pos:pos + 1] == b'\n':
+                    pos += 1
+            elif esc.isdigit():
+                digits = data[pos:pos + 3]
+                m = re.match(rb'[0-7]{1,3}', digits)
+                out.append(int(m.group(0), 8) & 0xFF)
+                pos += len(m.group(0))
+            else:
+                out += esc
+                pos += 1
+            continue
+        if ch == 0x28:
+            depth += 1
+        elif ch == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), pos + 1
+        out.append(ch)
+        pos += 1
+    raise PdfError('Unterminated string')
+
+
+def _read_name(data, pos: int) -> Tuple[PdfName, int]:
+    # pos is just past '/'
+    start = pos
+    n = len(data)
+    while pos < n and data[pos] not in _WHITESPACE and data[pos] not in _DELIMITERS:
+        pos += 1
+    raw = bytes(data[start:pos])
+    if b'#' in raw:
+        raw = re.sub(rb'#([0-9A-Fa-f]{2})', lambda m: bytes([int(m.group(1), 16)]), raw)
+    return PdfName(raw.decode('latin-1')), pos
+
+
+def _next_token(data, pos: int):
+    """Next token: (kind, value, new_pos). kind in {'obj', 'open', 'close', 'kw', None}."""
+    pos = _skip_space(data, pos)
+    if pos >= len(data):
+        return None, None, pos
+    ch = data[pos]
+    if ch == 0x2F:  # '/'
+        name, pos = _read_name(data, pos + 1)
+        return 'obj', name, pos
+    if ch == 0x28:  # '('
+        value, pos = _read_literal_string(data, pos + 1)
+        return 'obj', value, pos
+    if ch == 0x3C:  # '<'
+        if data[pos + 1:pos + 2] == b'<':
+            return 'open', b'<<', pos + 2
+        end = data.find(b'>', pos)
+        if end < 0:
+            raise PdfError('Unterminated hex string')
+        hex_digits = re.sub(rb'\s', b'', bytes(data[pos + 1:end]))
+        if len(hex_digits) % 2:
+            hex_digits += b'0'
+        return 'obj', bytes.fromhex(hex_digits.decode('ascii')), end + 1
+    if ch == 0x3E:  # '>'
+        if data[pos + 1:pos + 2] == b'>':
+            return 'close', b'>>', pos + 2
+        raise PdfError('Unexpected >')
+    if ch == 0x5B:
+        return 'open', b'[', pos + 1
+    if ch == 0x5D:
+        return 'close', b']', pos + 1
+    if ch in (0x7B, 0x7D):  # '{' '}' (PostScript calculator functions)
+        return 'kw', _Keyword(bytes([ch])), pos + 1
+
+    m = _NUMBER.match(data, pos)
+    if m and (m.end() >= len(data) or data[m.end()] in _WHITESPACE
+              or data[m.end()] in _DELIMITERS):
+        text = m.group(0)
+        value = float(text) if b'.' in text else int(text)
+        return 'obj', value, m.end()
+
+    start = pos
+    n = len(data)
+    while pos < n and data[pos] not in _WHITESPACE and data[pos] not in _DELIMITERS:
+        pos += 1
+    if pos == start:
+        raise PdfError(f'Unexpected byte {data[start:start + 1]!r}')
+    word = bytes(data[start:pos])
+    if word == b'true':
+        return 'obj', True, pos
+    if word == b'false':
+        return 'obj', False, pos
+    if word == b'null':
+        return 'obj', None, pos
+    return 'kw', _Keyword(word), pos
+
+
+def _parse_value(data, pos: int) -> Tuple[Any, int]:
+    """Parse one object (resolving 'n g R' references) starting at pos."""
+    kind, value, pos = _next_token(data, pos)
+    if kind == 'obj':
+        if isinstance(value, int) and not isinstance(value, bool):
+            # Possible indirect reference: int int R
+            kind2, gen, pos2 = _next_token(data, pos)
+            if kind2 == 'obj' and isinstance(gen, int) and not isinstance(gen, bool):
+                kind3, word, pos3 = _next_token(data, pos2)
+                if kind3 == 'kw' and word == b'R':
+                    return PdfRef((value, gen)), pos3
+        return value, pos
+    if kind == 'open':
+        if value == b'[':
+            items = []
+            while True:
+                save = pos
+                kind, tok, pos = _next_token(data, pos)
+                if kind == 'close' and tok == b']':
+                    return items, pos
+                if kind is None:
+                    raise PdfError('Unterminated array')
+                item, pos = _parse_value(data, save)
+                items.append(item)
+        result = {}
+        while True:
+            kind, key, pos = _next_token(data, pos)
+            if kind == 'close' and key == b'>>':
+                return result, pos
+            if not isinstance(key, PdfName):
+                raise PdfError('Dictionary key is not a name')
+            result[key], pos = _parse_value(data, pos)
+    if kind == 'kw':
+        return value, pos
+    raise PdfError('Unexpected end of data')
+
+
+def _decode_stream(stream: PdfStream) -> bytes:
+    filters = stream.dict.get('Filter')
+    if filters is None:
+        return bytes(stream.raw)
+    if not isinstance(filters, list):
+        filters = [filters]
+    data = bytes(stream.raw)
+    for name in filters:
+        if name in ('FlateDecode', 'Fl'):
+            try:
+                data = zlib.decompress(data)
+            except zlib.error:
+                # Some writers pad the stream; decompress what is there
+                data = zlib.decompressobj().decompress(data)
+        else:
+            raise PdfError(f'Unsupported stream filter {name}')
+    parms = stream.dict.get('DecodeParms')
+    if isinstance(parms, dict) and parms.get('Predictor', 1) > 1:
+        raise PdfError('Unsupported stream predictor')
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Document: object index, page lookup
+# ---------------------------------------------------------------------------
+
+class PdfDocument:
+    """Objects of a PDF file, indexed by one sequential scan (streams skipped)."""
+
+    def __init__(self, data):
+        self.data = data
+        self.objects: Dict[int, Any] = {}
+        self._object_streams: List[PdfStream] = []
+        self._scan()
+
+    def _scan(self) -> None:
+        data = self.data
+        pos = 0
+        while True:
+            m = _OBJ_HEADER.search(data, pos)
+            if not m:
+                break
+            num = int(m.group(1))
+            try:
+                value, pos = _parse_value(data, m.end())
+            except (PdfError, ValueError, IndexError):
+                pos = m.end()
+                continue
+            kind, word, after = _next_token(data, pos)
+            if kind == 'kw' and word == b'stream' and isinstance(value, dict):
+                value, pos = self._read_stream(value, after)
+                if value.dict.get('Type') == 'ObjStm':
+                    self._object_streams.append(value)
+            self.objects[num] = value
+
+    def _read_stream(self, stream_dict: Dict, pos: int) -> Tuple[PdfStream, int]:
+        data = self.data
+        if data[pos:pos + 2] == b'\r\n':
+            pos += 2
+        elif data[pos:pos + 1] in (b'\n', b'\r'):
+            pos += 1
+        length = stream_dict.get('Length')
+        if isinstance(length, int) and data[pos + length:pos + length + 20].lstrip().startswith(b'endstream'):
+            end = pos + length
+        else:
+            # Indirect or wrong /Length: find the terminator instead
+            end = data.find(b'endstream', pos)
+            if end < 0:
+                raise PdfError('Unterminated stream')
+            while end > pos and data[end - 1] in b'\r\n':
+                end -= 1
+        stream = PdfStream(stream_dict, data[pos:end])
+        after = data.find(b'endstream', end)
+        return stream, (after + len(b'endstream')) if after >= 0 else len(data)
+
+    def _load_object_streams(self) -> None:
+        streams, self._object_streams = self._object_streams, []
+        for stream in streams:
+            body = _decode_stream(stream)
+            count = stream.dict.get('N', 0)
+            first = stream.dict.get('First', 0)
+            header = [int(v) for v in body[:first].split()]
+            for i in range(min(count, len(header) // 2)):
+                num, offset = header[2 * i], header[2 * i + 1]
+                if num not in self.objects:
+                    self.objects[num] = _parse_value(body, first + offset)[0]
+
+    def resolve(self, value):
+        """Follow indirect references."""
+        seen = 0
+        while isinstance(value, PdfRef):
+            num = value[0]
+            if num not in self.objects and self._object_streams:
+                self._load_object_streams()
+            value = self.objects.get(num)
+            seen += 1
+            if seen > 32:
+                raise PdfError('Reference loop')
+        return value
+
+    def get(self, d: Dict, key: str, default=None):
+        return self.resolve(d.get(key, default)) if isinstance(d, dict) else default
+
+    def catalog(self) -> Dict:
+        for value in list(self.objects.values()):
+            d = value.dict if isinstance(value, PdfStream) else value
+            if isinstance(d, dict) and d.get('Type') == 'Catalog':
+                return d
+        if self._object_streams:
+            self._load_object_streams()
+            return self.catalog()
+        raise PdfError('No document catalog')
+
+    def first_page(self) -> Tuple[Dict, Dict]:
+        """(page dict, inherited attributes: Resources/MediaBox)."""
+        node = self.get(self.catalog(), 'Pages')
+        inherited: Dict[str, Any] = {}
+        for _ in range(64):
+            if not isinstance(node, dict):
+                break
+            for key in ('Resources', 'MediaBox', 'CropBox'):
+                if key in node:
+                    inherited[key] = self.resolve(node[key])
+            if node.get('Type') == 'Page' or 'Kids' not in node:
+                return node, inherited
+            kids = self.get(node, 'Kids') or []
+            if not kids:
+                break
+            node = self.resolve(kids[0])
+        raise PdfError('No page found')
+
+    def hidden_ocgs(self) -> set:
+        """Object numbers of OCGs that are OFF in the default configuration."""
+        props = self.get(self.catalog(), 'OCProperties')
+        default = self.get(props, 'D') if isinstance(props, dict) else None
+        off = self.get(default, 'OFF') if isinstance(default, dict) else None
+        return {ref[0] for ref in (off or []) if isinstance(ref, PdfRef)}
+
+
+def _text_string(value) -> str:
+    """Decode a PDF text string (UTF-16BE with BOM, else UTF-8/Latin-1)."""
+    if isinstance(value, str):
+        return value
+    if value[:2] == b'\xfe\xff':
+        return value[2:].decode('utf-16-be', errors='replace')
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        return value.decode('latin-1')
+
+
+# ---------------------------------------------------------------------------
+# Content stream interpretation
+# ---------------------------------------------------------------------------
+
+def _mat_mul(m1, m2):
+    """m1 × m2 for PDF matrices [a b c d e f] (row-vector convention)."""
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return (a1 * a2 + b1 * c2, a1 * b2 + b1 * d2,
+            c1 * a2 + d1 * c2, c1 * b2 + d1 * d2,
+            e1 * a2 + f1 * c2 + e2, e1 * b2 + f1 * d2 + f2)
+
+
+def _color_hex(components: List[float]) -> Optional[str]:
+    try:
+        values = [min(1.0, max(0.0, float(v))) for v in components]
+    except (TypeError, ValueError):
+        return None
+    if len(values) == 1:
+        rgb = values * 3
+    elif len(values) == 3:
+        rgb = values
+    elif len(values) == 4:
+        c, m, y, k = values
+        rgb = [1 - min(1.0, c + k), 1 - min(1.0, m + k), 1 - min(1.0, y + k)]
+    else:
+        return None
+    return '#' + ''.join(f'{int(round(v * 255)):02x}' for v in rgb)
+
+
+def _fmt(v: float) -> str:
+    text = f'{v:.4f}'.rstrip('0').rstrip('.')
+    return '0' if text in ('-0', '') else text
+
+
+class _GraphicsState:
+    __slots__ = ('ctm', 'stroke', 'fill', 'line_width')
+
+    def __init__(self, ctm, stroke='#000000', fill='#000000', line_width=1.0):
+        self.ctm = ctm
+        self.stroke = stroke
+        self.fill = fill
+        self.line_width = line_width
+
+    def copy(self) -> '_GraphicsState':
+        return _GraphicsState(self.ctm, self.stroke, self.fill, self.line_width)
+
+
+class _ContentInterpreter:
+    """Walks content streams and collects painted paths with their layer."""
+
+    def __init__(self, doc: PdfDocument, page_matrix):
+        self.doc = doc
+        self.hidden = doc.hidden_ocgs()
+        self.page_matrix = page_matrix  # PDF user space → SVG orientation
+        self.records: List[Dict[str, Any]] = []
+        self.saw_optional_content = False
+
+    # -- optional content --------------------------------------------------
+
+    def _layer_for(self, ref_or_dict) -> Optional[str]:
+        if isinstance(ref_or_dict, PdfRef) and ref_or_dict[0] in self.hidden:
+            return '_hidden_'
+        ocg = self.doc.resolve(ref_or_dict)
+        if not isinstance(ocg, dict):
+            return None
+        if ocg.get('Type') == 'OCMD':
+            members = self.doc.resolve(ocg.get('OCGs'))
+            if isinstance(members, list):
+                members = members[0] if members else None
+            return self._layer_for(members) if members is not None else None
+        name = self.doc.resolve(ocg.get('Name'))
+        return _text_string(name) if name is not None else None
+
+    # -- main loop ----------------------------------------------------------
+
+    def run(self, content: bytes, resources: Dict, gs: _GraphicsState,
+            layer_stack: List[Optional[str]], depth: int = 0) -> None:
+        if depth > _MAX_FORM_DEPTH:
+            raise PdfError('Form XObjects nested too deeply')
+        doc = self.doc
+        properties = doc.get(resources, 'Properties') or {}
+        xobjects = doc.get(resources, 'XObject') or {}
+
+        stack: List[_GraphicsState] = []
+        operands: List[Any] = []
+        subpaths: List[List[Tuple]] = []  # each: list of ('L'|'C', points...)
+        current = None                    # current point (PDF user space → device)
+        start = None
+        closed_flags: List[bool] = []
+
+        def device(x, y):
+            a, b, c, d, e, f = gs.ctm
+            return (a * x + c * y + e, b * x + d * y + f)
+
+        def move_to(p):
+            nonlocal current, start
+            subpaths.append([('M', p)])
+            closed_flags.append(False)
+            current = start = p
+
+        def close_subpath():
+            nonlocal current
+            if subpaths and not closed_flags[-1]:
+                if current != start:
+                    subpaths[-1].append(('L', start))
+                closed_flags[-1] = True
+                current = start
+
+        pos = 0
+        while True:
+            kind, value, pos = _next_token(content, pos)
+            if kind is None:
+                break
+            if kind in ('obj', 'open'):
+                if kind == 'open':
+                    # Arrays / dicts as operands (e.g. BDC property lists, dash arrays)
+                    value, pos = _parse_value(content, pos - len(value))
+                operands.append(value)
+                continue
+            if kind == 'close':
+                raise PdfError('Unbalanced delimiter in content stream')
+
+            op = bytes(value)
+            ops = operands
+            operands = []
+
+            try:
+                if op == b'm':
+                    move_to(device(ops[0], ops[1]))
+                elif op == b'l':
+                    if current is None:
+                        continue
+                    p = device(ops[0], ops[1])
+                    subpaths[-1].append(('L', p))
+                    current = p
+                elif op in (b'c', b'v', b'y'):
+                    if current is None:
+                        continue
+                    if op == b'c':
+                        c1 = device(ops[0], ops[1])
+                        c2 = device(ops[2], ops[3])
+                        p = device(ops[4], ops[5])
+                    elif op == b'v':
+                        c1 = current
+                        c2 = device(ops[0], ops[1])
+                        p = device(ops[2], ops[3])
+                    else:
+                        c1 = device(ops[0], ops[1])
+                        p = device(ops[2], ops[3])
+                        c2 = p
+                    subpaths[-1].append(('C', c1, c2, p))
+                    current = p
+                elif op == b're':
+                    x, y, w, h = ops[:4]
+                    move_to(device(x, y))
+                    for px, py in ((x + w, y), (x + w, y + h), (x, y + h)):
+                        p = device(px, py)
+                        subpaths[-1].append(('L', p))
+                        current = p
+                    close_subpath()
+                elif op == b'h':
+                    close_subpath()
+                elif op in (b'W', b'W*'):
+                    # Clipping paths are not output: a clip-only path ends in
+                    # 'n', and a painted one is emitted by its paint operator
+                    pass
+                elif op in _PAINT_OPS:
+                    if op in _CLOSE_OPS:
+                        close_subpath()
+                    if op != b'n' and subpaths:
+                        self._emit(subpaths, closed_flags, gs, layer_stack,
+                                   fill=op in _FILL_OPS, stroke=op in _STROKE_OPS)
+                    subpaths, closed_flags = [], []
+                    current = start = None
+                elif op == b'q':
+                    stack.append(gs.copy())
+                elif op == b'Q':
+                    if stack:
+                        gs = stack.pop()
+                elif op == b'cm':
+                    gs.ctm = _mat_mul(tuple(float(v) for v in ops[:6]), gs.ctm)
+                elif op == b'w':
+                    gs.line_width = float(ops[0])
+                elif op in (b'G', b'RG', b'K'):
+                    gs.stroke = _color_hex(ops)
+                elif op in (b'g', b'rg', b'k'):
+                    gs.fill = _color_hex(ops)
+                elif op in (b'SC', b'SCN'):
+                    gs.stroke = _color_hex(ops) if not any(isinstance(v, PdfName) for v in ops) else None
+                elif op in (b'sc', b'scn'):
+                    gs.fill = _color_hex(ops) if not any(isinstance(v, PdfName) for v in ops) else None
+                elif op == b'BDC':
+                    tag, prop = (ops + [None, None])[:2]
+                    layer = None
+                    if tag == 'OC':
+                        self.saw_optional_content = True
+                        target = properties.get(prop) if isinstance(prop, PdfName) else prop
+                        layer = self._layer_for(target)
+                    layer_stack.append(layer)
+                elif op == b'BMC':
+                    layer_stack.append(None)
+                elif op == b'EMC':
+                    if layer_stack:
+                        layer_stack.pop()
+                elif op == b'Do':
+                    self._do_xobject(xobjects.get(ops[0]), resources, gs, layer_stack, depth)
+                elif op == b'BI':
+                    pos = self._skip_inline_image(content, pos)
+            except (IndexError, TypeError, ValueError) as e:
+                raise PdfError(f'Bad operands for {op!r}: {e}')
+
+    def _skip_inline_image(self, content: bytes, pos: int) -> int:
+        id_pos = content.find(b'ID', pos)
+        if id_pos < 0:
+            raise PdfError('Inline image without ID')
+        m = _INLINE_IMAGE_END.search(content, id_pos + 3)
+        if not m:
+            raise PdfError('Inline image without EI')
+        return m.end()
+
+    def _do_xobject(self, ref, resources, gs, layer_stack, depth) -> None:
+        xobject = self.doc.resolve(ref)
+        if not isinstance(xobject, PdfStream) or xobject.dict.get('Subtype') != 'Form':
+            return  # Images carry no vector paths
+        form = xobject.dict
+        matrix = self.doc.resolve(form.get('Matrix')) or [1, 0, 0, 1, 0, 0]
+        form_gs = gs.copy()
+        form_gs.ctm = _mat_mul(tuple(float(v) for v in matrix), gs.ctm)
+        form_resources = self.doc.resolve(form.get('Resources')) or resources
+
+        pushed = 'OC' in form
+        if pushed:
+            self.saw_optional_content = True
+            layer_stack.append(self._layer_for(form['OC']))
+        try:
+            self.run(_decode_stream(xobject), form_resources, form_gs, layer_stack, depth + 1)
+        finally:
+            if pushed:
+                layer_stack.pop()
+
+    def _emit(self, subpaths, closed_flags, gs, layer_stack, fill: bool, stroke: bool) -> None:
+        a, b, c, d, e, f = self.page_matrix
+        to_svg = lambda p: complex(a * p[0] + c * p[1] + e, b * p[0] + d * p[1] + f)
+
+        kinds = []
+        ctrl = []
+        d_parts = []
+        for subpath, closed in zip(subpaths, closed_flags):
+            if len(subpath) < 2:
+                continue
+            prev = to_svg(subpath[0][1])
+            d_parts.append(f'M {_fmt(prev.real)},{_fmt(prev.imag)}')
+            for seg in subpath[1:]:
+                if seg[0] == 'L':
+                    end = to_svg(seg[1])
+                    kinds.append(SEG_LINE)
+                    ctrl.append((prev, end, end, end))
+                    d_parts.append(f'L {_fmt(end.real)},{_fmt(end.imag)}')
+                else:
+                    c1, c2, end = to_svg(seg[1]), to_svg(seg[2]), to_svg(seg[3])
+                    kinds.append(SEG_CUBIC)
+                    ctrl.append((prev, c1, c2, end))
+                    d_parts.append(f'C {_fmt(c1.real)},{_fmt(c1.imag)} '
+                                   f'{_fmt(c2.real)},{_fmt(c2.imag)} '
+                                   f'{_fmt(end.real)},{_fmt(end.imag)}')
+                prev = end
+            if closed:
+                d_parts.append('Z')
+        if not kinds:
+            return
+
+        # Illustrator only writes OCGs for top-level layers: the outermost marker wins
+        layer = next((name for name in layer_stack if name is not None), None)
+        ctm_scale = math.sqrt(abs(gs.ctm[0] * gs.ctm[3] - gs.ctm[1] * gs.ctm[2]))
+        self.records.append({
+            'data': PathData.from_segments(kinds, ctrl),
+            'd': ' '.join(d_parts),
+            'layer': layer or '_no_layer_',
+            'fill': gs.fill if fill else None,
+            'stroke': gs.stroke if stroke else None,
+            # Same unit handling as unitless SVG stroke-width attributes, which
+            # parse_stroke_width() reads as px (0.75 pt)
+            'stroke_width': gs.line_width * ctm_scale * _PX_TO_PT if stroke else None,
+        })
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def native_pdf_enabled() -> bool:
+    """Opt-in until fixture-based parity with the converter route is established."""
+    return os.environ.get('AI_NATIVE_PDF', '0') == '1'
+
+
+def is_native_candidate(ai_path: str) -> bool:
+    """Whether extract_paths_from_pdf() will try this file (callers can skip converting it)."""
+    if Path is None or not native_pdf_enabled():
+        return False
+    try:
+        return sniff_ai_file(ai_path).pdf_compatible
+    except OSError:
+        return False
+
+
+def extract_paths_from_pdf(ai_path: str,
+                           max_point_distance: Optional[float] = None,
+                           flatten_tolerance: Optional[float] = None,
+                           prune_layers: bool = False,
+                           required_layers=None,
+                           use_cache: bool = True,
+                           write_cache: bool = True) -> Optional[List[PathInfo]]:
+    """
+    Extract paths from a PDF-compatible AI file without an external converter.
+
+    Args mirror extract_paths_from_svg().
+
+    Returns:
+        List of PathInfo, or None when the file must go through the
+        converter chain instead (see module docstring)
+    """
+    if not is_native_candidate(ai_path):
+        return None
+
+    cache_key = None
+    if use_cache:
+        layer_filter = ('pdf', prune_layers,
+                        tuple(sorted({n.lower() for n in required_layers}))
+                        if required_layers else None)
+        try:
+            cache_key = geometry_cache.cache_key(ai_path, None, max_point_distance,
+                                                 flatten_tolerance, layer_filter)
+        except OSError as e:
+            print(f"Warning: Could not hash AI file for geometry cache: {e}", file=sys.stderr)
+        if cache_key:
+            cached = geometry_cache.load_paths(cache_key)
+            if cached is not None:
+                print(f"Geometry cache hit: {len(cached)} paths", file=sys.stderr)
+                return cached
+
+    try:
+        records = _read_page_records(ai_path)
+    except (PdfError, OSError, ValueError, KeyError, IndexError, TypeError,
+            RecursionError, zlib.error) as e:
+        print(f"Native PDF extraction unavailable ({e}); using converters", file=sys.stderr)
+        return None
+    if records is None:
+        return None
+
+    paths_info = _records_to_paths(records, max_point_distance, flatten_tolerance,
+                                   prune_layers, required_layers)
+    print(f"Native PDF extraction: {len(paths_info)} paths, "
+          f"layers={sorted(set(p.layer_name for p in paths_info if p.layer_name))}",
+          file=sys.stderr)
+    if cache_key and write_cache:
+        geometry_cache.save_paths(cache_key, paths_info)
+    return paths_info
+
+
+def _read_page_records(ai_path: str) -> Optional[List[Dict[str, Any]]]:
+    with open(ai_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _interpret_first_page(PdfDocument(mm))
+
+
+def _interpret_first_page(doc: PdfDocument) -> Optional[List[Dict[str, Any]]]:
+    page, inherited = doc.first_page()
+
+    media_box = doc.get(page, 'MediaBox') or inherited.get('MediaBox')
+    if not media_box or len(media_box) != 4:
+        raise PdfError('Page has no MediaBox')
+    x0, y0, x1, y1 = (float(doc.resolve(v)) for v in media_box)
+    # Flip into SVG orientation: origin at the top-left of the MediaBox
+    page_matrix = (1.0, 0.0, 0.0, -1.0, -min(x0, x1), max(y0, y1))
+
+    contents = doc.get(page, 'Contents')
+    streams = contents if isinstance(contents, list) else [contents]
+    content = b'\n'.join(_decode_stream(doc.resolve(s)) for s in streams
+                         if isinstance(doc.resolve(s), PdfStream))
+    resources = doc.get(page, 'Resources') or inherited.get('Resources') or {}
+
+    interpreter = _ContentInterpreter(doc, page_matrix)
+    interpreter.run(content, resources, _GraphicsState((1.0, 0.0, 0.0, 1.0, 0.0, 0.0)), [])
+    if not interpreter.saw_optional_content:
+        # No layer markers: the converter route's layer heuristics handle these
+        return None
+    return interpreter.records
+
+
+def _records_to_paths(records: List[Dict[str, Any]],
+                      max_point_distance: Optional[float],
+                      flatten_tolerance: Optional[float],
+                      prune_layers: bool, required_layers) -> List[PathInfo]:
+    candidates = []
+    for i, record in enumerate(records):
+        layer = record['layer']
+        if prune_layers and is_system_or_separator_layer(layer):
+            continue
+        geometry = PathGeometry(data=record['data'], max_point_distance=max_point_distance,
+                                flatten_tolerance=flatten_tolerance)
+        path_length, = geometry.length()
+        # Skip degenerate paths (zero-length points, dummy lines)
+        if path_length < 0.1:
+            continue
+        candidates.append((f'path{i + 1}', record, geometry, path_length))
+
+    if prune_layers or required_layers:
+        candidates = prune_to_layers(candidates, lambda c: c[1]['layer'],
+                                     prune_layers, required_layers)
+
+    return [
+        PathInfo(
+            path_id=path_id,
+            d_attribute=record['d'],
+            stroke=record['stroke'],
+            stroke_width=record['stroke_width'],
+            fill=record['fill'],
+            transform=None,
+            length=path_length,
+            layer_name=record['layer'],
+            transform_chain='',
+            geometry=geometry,
+        )
+        for path_id, record, geometry, path_length in candidates
+    ]
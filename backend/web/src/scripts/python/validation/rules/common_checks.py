@@ -5,10 +5,56 @@ These functions accept configurable thresholds so any spec type
 (front_lit, halo_lit, etc.) can invoke them with its own values.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
-from ..core import ValidationIssue, LetterAnalysisResult
-from ..geometry import compute_hole_centering, get_centroid
+from ..core import ValidationIssue, LetterAnalysisResult, LetterGroup
+from ..geometry import (
+    compute_hole_centering, get_centroid, buffer_polygon_with_mitre, find_close_pairs
+)
+
+
+def find_close_buffered_letters(
+    letter_analysis: LetterAnalysisResult,
+    return_layer: str,
+    buffer_file_units: float,
+    mitre_limit: float,
+    max_distance: float,
+) -> List[Tuple[LetterGroup, LetterGroup, float]]:
+    """
+    Find return letter pairs whose mitre-buffered outlines are within max_distance.
+
+    Shared by the trim cap and acrylic face spacing checks. Each letter is
+    buffered once, then an STRtree query only measures nearby pairs.
+
+    Args:
+        letter_analysis: Pre-computed LetterAnalysisResult with polygon data
+        return_layer: Layer name for return paths
+        buffer_file_units: Outward mitre buffer in file units
+        mitre_limit: Maximum miter extension ratio before bevel
+        max_distance: Maximum buffered distance to report, in file units
+
+    Returns:
+        List of (letter_a, letter_b, distance_file_units), in letter order
+    """
+    letters = []
+    for lg in letter_analysis.letter_groups:
+        if lg.layer_name.lower() != return_layer.lower():
+            continue
+        if lg.main_path and lg.main_path.polygon is not None:
+            letters.append(lg)
+
+    if len(letters) < 2:
+        return []
+
+    buffered = [
+        buffer_polygon_with_mitre(lg.main_path.polygon, buffer_file_units,
+                                  mitre_limit=mitre_limit)
+        for lg in letters
+    ]
+    return [
+        (letters[i], letters[j], dist)
+        for i, j, dist in find_close_pairs(buffered, max_distance)
+    ]
 
 
 def check_hole_centering(
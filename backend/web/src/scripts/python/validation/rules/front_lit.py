@@ -35,13 +35,13 @@ Integration with letter_analysis.py:
 from typing import List, Dict, Optional, Any
 
 from ..core import PathInfo, ValidationIssue, LetterAnalysisResult
-from ..geometry import polygon_distance, buffer_polygon_with_mitre
+from ..hole_sizes import HoleSizeCatalog
 from .legacy_analysis import (
     analyze_letters_in_layer,
     match_trim_to_return,
     convert_letter_groups_to_analysis,
 )
-from .common_checks import check_hole_centering
+from .common_checks import check_hole_centering, find_close_buffered_letters
 
 
 def generate_letter_analysis_issues(
@@ -183,7 +183,8 @@ def check_trim_cap_spacing(
     1. Get return letter polygons from letter_analysis
     2. Buffer each outward by trim_offset_max with mitre join to simulate
        physical trim cap shape including mitered corners
-    3. Pairwise distance check between buffered polygons
+    3. Distance check between nearby buffered polygons (STRtree query
+       within the minimum spacing, so far-apart pairs are never measured)
     4. Convert distance to inches, compare against min_trim_spacing_inches
 
     Args:
@@ -204,60 +205,37 @@ def check_trim_cap_spacing(
     if letter_analysis and letter_analysis.detected_scale:
         file_scale = letter_analysis.detected_scale
 
-    # Collect return layer letters that have polygon data
-    return_letters_with_poly = []
-    for lg in letter_analysis.letter_groups:
-        if lg.layer_name.lower() != return_layer.lower():
-            continue
-        if lg.main_path and lg.main_path.polygon is not None:
-            return_letters_with_poly.append(lg)
-
-    if len(return_letters_with_poly) < 2:
-        # Need at least 2 letters to check spacing
-        return issues
-
     # Convert trim_offset_max from real mm to file units
     # mm -> inches -> points -> file-scale points
     points_per_real_inch = 72 * file_scale
     trim_buffer_file_units = trim_offset_max_mm * points_per_real_inch / 25.4
 
-    # Buffer each return letter polygon to simulate mitered trim cap shape
-    buffered = []
-    for lg in return_letters_with_poly:
-        sim = buffer_polygon_with_mitre(
-            lg.main_path.polygon, trim_buffer_file_units, mitre_limit=miter_factor
-        )
-        buffered.append((lg, sim))
-
-    # Pairwise distance check
-    for i in range(len(buffered)):
-        lg_a, poly_a = buffered[i]
-        if poly_a is None:
-            continue
-        for j in range(i + 1, len(buffered)):
-            lg_b, poly_b = buffered[j]
-            if poly_b is None:
-                continue
+    # Buffer each return letter once; only measure pairs within min spacing
+    close_pairs = find_close_buffered_letters(
+        letter_analysis, return_layer, trim_buffer_file_units,
+        mitre_limit=miter_factor,
+        max_distance=min_spacing_inches * points_per_real_inch,
+    )
 
-            dist = polygon_distance(poly_a, poly_b)
-            dist_inches = dist / points_per_real_inch
+    for lg_a, lg_b, dist in close_pairs:
+        dist_inches = dist / points_per_real_inch
 
-            if dist_inches < min_spacing_inches:
-                issues.append(ValidationIssue(
-                    rule='front_lit_trim_spacing',
-                    severity='error',
-                    message=(
-                        f'Trim caps for {lg_a.letter_id} and {lg_b.letter_id} '
-                        f'are {dist_inches:.3f}" apart (min {min_spacing_inches}")'
-                    ),
-                    details={
-                        'letter_a': lg_a.letter_id,
-                        'letter_b': lg_b.letter_id,
-                        'distance_inches': round(dist_inches, 4),
-                        'required_inches': min_spacing_inches,
-                        'distance_file_units': round(dist, 2),
-                    }
-                ))
+        if dist_inches < min_spacing_inches:
+            issues.append(ValidationIssue(
+                rule='front_lit_trim_spacing',
+                severity='error',
+                message=(
+                    f'Trim caps for {lg_a.letter_id} and {lg_b.letter_id} '
+                    f'are {dist_inches:.3f}" apart (min {min_spacing_inches}")'
+                ),
+                details={
+                    'letter_a': lg_a.letter_id,
+                    'letter_b': lg_b.letter_id,
+                    'distance_inches': round(dist_inches, 4),
+                    'required_inches': min_spacing_inches,
+                    'distance_file_units': round(dist, 2),
+                }
+            ))
 
     return issues
 
@@ -324,8 +302,7 @@ def check_front_lit_structure(paths_info: List[PathInfo], rules: Dict) -> List[V
     points_per_real_inch = 72 * file_scale
 
     # Extract standard mounting hole size from standard_hole_sizes (if available)
-    standard_hole_sizes = rules.get('_standard_hole_sizes', [])
-    mounting_std = next((s for s in standard_hole_sizes if s.get('category') == 'mounting'), None)
+    mounting_std = HoleSizeCatalog.from_config(rules).first('mounting')
     mounting_std_diameter = mounting_std['diameter_mm'] if mounting_std else None
     mounting_std_name = mounting_std['name'] if mounting_std else None
 
@@ -22,12 +22,13 @@ Engraving classification runs after hole classification, before issue generation
 from typing import List, Dict, Optional, Any
 
 from ..core import PathInfo, ValidationIssue, LetterAnalysisResult, HoleInfo
-from ..geometry import polygon_distance, buffer_polygon_with_mitre
+from ..hole_sizes import HoleSizeCatalog
 from .legacy_analysis import (
     analyze_letters_in_layer,
     match_trim_to_return,
     convert_letter_groups_to_analysis,
 )
+from .common_checks import find_close_buffered_letters
 
 
 def classify_engraving_paths(
@@ -157,58 +158,36 @@ def check_face_spacing(
     if letter_analysis and letter_analysis.detected_scale:
         file_scale = letter_analysis.detected_scale
 
-    # Collect return layer letters with polygon data
-    return_letters_with_poly = []
-    for lg in letter_analysis.letter_groups:
-        if lg.layer_name.lower() != return_layer.lower():
-            continue
-        if lg.main_path and lg.main_path.polygon is not None:
-            return_letters_with_poly.append(lg)
-
-    if len(return_letters_with_poly) < 2:
-        return issues
-
     # Convert face offset from real mm to file units
     points_per_real_inch = 72 * file_scale
     face_buffer_file_units = face_offset_min_mm * points_per_real_inch / 25.4
 
-    # Buffer each return letter polygon to simulate face shape
-    buffered = []
-    for lg in return_letters_with_poly:
-        sim = buffer_polygon_with_mitre(
-            lg.main_path.polygon, face_buffer_file_units, mitre_limit=4.0
-        )
-        buffered.append((lg, sim))
-
-    # Pairwise distance check
-    for i in range(len(buffered)):
-        lg_a, poly_a = buffered[i]
-        if poly_a is None:
-            continue
-        for j in range(i + 1, len(buffered)):
-            lg_b, poly_b = buffered[j]
-            if poly_b is None:
-                continue
+    # Buffer each return letter once; only measure pairs within min spacing
+    close_pairs = find_close_buffered_letters(
+        letter_analysis, return_layer, face_buffer_file_units,
+        mitre_limit=4.0,
+        max_distance=min_spacing_inches * points_per_real_inch,
+    )
 
-            dist = polygon_distance(poly_a, poly_b)
-            dist_inches = dist / points_per_real_inch
+    for lg_a, lg_b, dist in close_pairs:
+        dist_inches = dist / points_per_real_inch
 
-            if dist_inches < min_spacing_inches:
-                issues.append(ValidationIssue(
-                    rule='acrylic_face_spacing',
-                    severity='error',
-                    message=(
-                        f'Face letters {lg_a.letter_id} and {lg_b.letter_id} '
-                        f'are {dist_inches:.3f}" apart (min {min_spacing_inches}")'
-                    ),
-                    details={
-                        'letter_a': lg_a.letter_id,
-                        'letter_b': lg_b.letter_id,
-                        'distance_inches': round(dist_inches, 4),
-                        'required_inches': min_spacing_inches,
-                        'distance_file_units': round(dist, 2),
-                    }
-                ))
+        if dist_inches < min_spacing_inches:
+            issues.append(ValidationIssue(
+                rule='acrylic_face_spacing',
+                severity='error',
+                message=(
+                    f'Face letters {lg_a.letter_id} and {lg_b.letter_id} '
+                    f'are {dist_inches:.3f}" apart (min {min_spacing_inches}")'
+                ),
+                details={
+                    'letter_a': lg_a.letter_id,
+                    'letter_b': lg_b.letter_id,
+                    'distance_inches': round(dist_inches, 4),
+                    'required_inches': min_spacing_inches,
+                    'distance_file_units': round(dist, 2),
+                }
+            ))
 
     return issues
 
@@ -274,8 +253,7 @@ def check_front_lit_acrylic_face_structure(
     points_per_real_inch = 72 * file_scale
 
     # Extract standard mounting hole size
-    standard_hole_sizes = rules.get('_standard_hole_sizes', [])
-    mounting_std = next((s for s in standard_hole_sizes if s.get('category') == 'mounting'), None)
+    mounting_std = HoleSizeCatalog.from_config(rules).first('mounting')
     mounting_std_diameter = mounting_std['diameter_mm'] if mounting_std else None
     mounting_std_name = mounting_std['name'] if mounting_std else None
 
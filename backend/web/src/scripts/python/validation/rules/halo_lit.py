@@ -9,6 +9,7 @@ Face layer: front face, LARGER than return (overhang)
 from typing import List, Dict, Optional, Any
 
 from ..core import PathInfo, ValidationIssue, LetterAnalysisResult
+from ..hole_sizes import HoleSizeCatalog
 from .legacy_analysis import (
     analyze_letters_in_layer,
     match_trim_to_return,
@@ -213,8 +214,7 @@ def check_halo_lit_structure(
     mm_per_file_unit = 25.4 / points_per_real_inch
 
     # Standard hole sizes for mounting detail
-    standard_hole_sizes = rules.get('_standard_hole_sizes', [])
-    mounting_std = next((s for s in standard_hole_sizes if s.get('category') == 'mounting'), None)
+    mounting_std = HoleSizeCatalog.from_config(rules).first('mounting')
     mounting_std_diameter = mounting_std['diameter_mm'] if mounting_std else None
     mounting_std_name = mounting_std['name'] if mounting_std else None
 
@@ -31,7 +31,7 @@ def identify_outside_paths(paths_info: List[PathInfo], layer_name: str) -> List[
     path_bboxes = []
     for p in layer_paths:
         # If original_bbox exists, bbox was already globally transformed by letter_analysis.py
-        if hasattr(p, 'original_bbox') and p.original_bbox:
+        if p.original_bbox:
             transformed_bbox = p.bbox
         else:
             transformed_bbox = apply_transform_to_bbox(p.bbox, p.transform_chain or '')
@@ -131,7 +131,7 @@ def analyze_letters_in_layer(paths_info: List[PathInfo],
         if not letter.bbox:
             continue
 
-        if hasattr(letter, 'original_bbox') and letter.original_bbox:
+        if letter.original_bbox:
             bbox = letter.bbox
             raw_bbox = letter.original_bbox
         else:
@@ -19,6 +19,7 @@ Key differences from channel letter types:
 from typing import List, Dict, Optional
 
 from ..core import PathInfo, ValidationIssue, LetterAnalysisResult
+from ..path_table import PathTable
 from .push_thru_helpers import (
     decompose_backer_compounds,
     match_acrylic_to_cutouts,
@@ -97,10 +98,15 @@ def check_push_thru_structure(
 
     points_per_real_inch = 72 * file_scale
 
+    # Columnar view for the layer filters (shared with letter analysis when it ran)
+    table = letter_analysis.path_table if letter_analysis else None
+    if table is None:
+        table = PathTable(paths_info)
+
     # --- Step 1: Decompose backer layer ---
-    boxes, cutouts = decompose_backer_compounds(paths_info, backer_layer)
+    boxes, cutouts = decompose_backer_compounds(paths_info, backer_layer, table)
 
-    layers_found = set(p.layer_name for p in paths_info if p.layer_name)
+    layers_found = table.layers_found()
 
     issues.append(ValidationIssue(
         rule='push_thru_structure',
@@ -126,11 +132,9 @@ def check_push_thru_structure(
         return issues
 
     # --- Step 2: Find acrylic letters ---
-    acrylic_paths = [
-        p for p in paths_info
-        if p.layer_name and p.layer_name.lower() == acrylic_layer.lower()
-        and p.is_closed and not p.is_circle and p.polygon is not None
-    ]
+    acrylic_paths = table.select(
+        table.layer_mask(acrylic_layer) & table.is_closed & ~table.is_circle & table.has_polygon
+    )
 
     issues.append(ValidationIssue(
         rule='push_thru_structure',
@@ -215,7 +219,7 @@ def check_push_thru_structure(
     # --- Step 7: Lexan layer validation ---
     check_lexan_layer(issues, paths_info, lexan_layer, layers_found, boxes,
                       cutouts, lexan_inset_inches, max_cutout_area_ratio,
-                      min_lexan_cutout_clearance, points_per_real_inch)
+                      min_lexan_cutout_clearance, points_per_real_inch, table)
 
     return issues
 
@@ -7,6 +7,7 @@ import sys
 from typing import List, Dict, Any, Optional, Tuple
 
 from ..core import PathInfo, ValidationIssue
+from ..path_table import PathTable
 from ..geometry import polygon_contains
 from ..corner_analysis import extract_corner_radii
 
@@ -32,6 +33,7 @@ def is_roughly_rectangular(polygon, tolerance: float = 0.90) -> bool:
 def decompose_backer_compounds(
     paths_info: List[PathInfo],
     backer_layer: str,
+    table: Optional[PathTable] = None,
 ) -> Tuple[List[Polygon], List[Polygon]]:
     """
     Extract box outlines + cutout polygons from the backer layer.
@@ -47,11 +49,11 @@ def decompose_backer_compounds(
     Returns:
         (box_polygons, cutout_polygons)
     """
-    backer_paths = [
-        p for p in paths_info
-        if p.layer_name and p.layer_name.lower() == backer_layer.lower()
-        and p.is_closed and p.polygon is not None and not p.is_circle
-    ]
+    if table is None:
+        table = PathTable(paths_info)
+    backer_paths = table.select(
+        table.layer_mask(backer_layer) & table.is_closed & table.has_polygon & ~table.is_circle
+    )
 
     if not backer_paths:
         return [], []
@@ -226,8 +228,10 @@ def check_corner_radii_for_path(
         is_compound_interior: True if this is a cutout from a compound path
     """
     violations = []
+    # Reuse the segment arrays parsed during extraction when available
+    data = path.geometry.data if path.geometry is not None else None
     radii = extract_corner_radii(
-        path.d_attribute, file_scale, is_compound=is_compound_interior
+        path.d_attribute, file_scale, is_compound=is_compound_interior, data=data
     )
 
     for corner in radii:
@@ -273,13 +277,12 @@ def check_lexan_layer(
     max_cutout_area_ratio: float,
     min_cutout_clearance_inches: float,
     points_per_real_inch: float,
+    table: Optional[PathTable] = None,
 ) -> None:
     """Validate lexan layer: exists, simple, contains cutouts, inset, area ratio, clearance."""
-    lexan_paths = [
-        p for p in paths_info
-        if p.layer_name and p.layer_name.lower() == lexan_layer.lower()
-        and p.is_closed and p.polygon is not None
-    ]
+    if table is None:
+        table = PathTable(paths_info)
+    lexan_paths = table.select(table.layer_mask(lexan_layer) & table.is_closed & table.has_polygon)
 
     if not lexan_paths:
         issues.append(ValidationIssue(
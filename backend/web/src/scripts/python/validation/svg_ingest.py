@@ -0,0 +1,234 @@
+"""
+Single-pass SVG ingestion.
+
+Validating one AI file used to parse the same SVG up to four times
+(detect_svg_scale, _prepare_native_svg, build_layer_and_transform_map and
+svg2paths2's own minidom parse). ingest_svg() walks the document once with
+ElementTree.iterparse and records everything the later stages need:
+
+- root attributes (width / viewBox → file scale)
+- every shape element with its ancestor <g> id chain, accumulated transforms,
+  <defs> / display:none flags and owning top-level element
+- the element tree itself, for the structural layer-mapping heuristics
+
+Path data is then parsed straight from the recorded elements
+(shape_to_path_data), in the same order svg2paths2 would return them.
+
+Sources are file paths or, for converter output held in memory, the SVG
+document itself as bytes (SvgSource).
+"""
+
+import io
+import sys
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple, Union
+
+from .path_data import PathData, parse_path_data
+
+try:
+    from svgpathtools.svg_to_paths import (
+        ellipse2pathd, polyline2pathd, polygon2pathd, rect2pathd
+    )
+except ImportError:
+    ellipse2pathd = polyline2pathd = polygon2pathd = rect2pathd = None
+
+# Shape tags in the order svg2paths2 emits them (grouped by tag, then document order)
+PATH_TAG_ORDER = ('path', 'polyline', 'polygon', 'line', 'ellipse', 'circle', 'rect')
+SHAPE_TAGS = frozenset(PATH_TAG_ORDER)
+
+_TAG_RANK = {tag: i for i, tag in enumerate(PATH_TAG_ORDER)}
+
+# SVG file path, or the document bytes (e.g. Inkscape stdout)
+SvgSource = Union[str, bytes]
+
+
+def local_name(tag: str) -> str:
+    """Strip the '{namespace}' prefix from an ElementTree tag."""
+    return tag.split('}')[-1] if '}' in tag else tag
+
+
+def is_display_none(style: str) -> bool:
+    """True when an inline style hides the element."""
+    return 'display:none' in style or 'display: none' in style
+
+
+class SvgShape:
+    """
+    One shape element (path, circle, rect, ...) seen during ingestion.
+
+    Attributes:
+        element: The ElementTree element
+        tag: Local tag name
+        order: Position among all shapes in document order
+        group_chain: ids of ancestor <g> elements (outermost first)
+        transforms: Accumulated transform attributes, ancestors first,
+                    including the element's own transform
+        in_defs: Inside a <defs> block
+        hidden: Element or an ancestor has display:none
+        top_element: The root child this shape lives under (None if it is one)
+    """
+
+    __slots__ = ('element', 'tag', 'order', 'group_chain', 'transforms',
+                 'in_defs', 'hidden', 'top_element')
+
+    def __init__(self, element, tag: str, order: int, group_chain: Tuple[str, ...],
+                 transforms: Tuple[str, ...], in_defs: bool, hidden: bool, top_element):
+        self.element = element
+        self.tag = tag
+        self.order = order
+        self.group_chain = group_chain
+        self.transforms = transforms
+        self.in_defs = in_defs
+        self.hidden = hidden
+        self.top_element = top_element
+
+    @property
+    def attrib(self) -> Dict[str, str]:
+        return self.element.attrib
+
+
+class SvgDocument:
+    """Result of ingest_svg(): element tree plus per-shape context."""
+
+    __slots__ = ('root', 'shapes')
+
+    def __init__(self, root, shapes: List[SvgShape]):
+        self.root = root
+        self.shapes = shapes
+
+    @property
+    def root_attrib(self) -> Dict[str, str]:
+        return self.root.attrib
+
+    @property
+    def scale(self) -> Optional[float]:
+        """File scale derived from the root width/viewBox (see scale_from_root_attributes)."""
+        return scale_from_root_attributes(self.root.attrib)
+
+    def shapes_in_path_order(self) -> List[SvgShape]:
+        """Shapes ordered the way svg2paths2 returns them (by tag, then document order)."""
+        return sorted(self.shapes, key=lambda s: (_TAG_RANK[s.tag], s.order))
+
+
+def _open_source(source: SvgSource):
+    """Argument for ET.iterparse: the path itself, or a buffer over in-memory bytes."""
+    return io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def ingest_svg(svg_path: SvgSource) -> SvgDocument:
+    """
+    Parse an SVG once, recording every shape element with its context.
+
+    Raises:
+        ET.ParseError / OSError when the file cannot be read
+    """
+    shapes: List[SvgShape] = []
+    # Per open element: (group_chain, transforms, in_defs, hidden, top_element)
+    stack: List[Tuple] = []
+    root = None
+
+    for event, element in ET.iterparse(_open_source(svg_path), events=('start', 'end')):
+        if event == 'end':
+            stack.pop()
+            continue
+
+        tag = local_name(element.tag)
+        if root is None:
+            root = element
+            parent = ((), (), False, False, None)
+        else:
+            parent = stack[-1]
+
+        group_chain, transforms, in_defs, hidden, top_element = parent
+        if len(stack) == 1:
+            top_element = element
+
+        elem_id = element.get('id', '')
+        transform = element.get('transform', '')
+
+        if tag == 'defs':
+            in_defs = True
+        if not hidden and is_display_none(element.get('style', '')):
+            hidden = True
+        if tag == 'g' and elem_id:
+            group_chain = group_chain + (elem_id,)
+        if transform:
+            transforms = transforms + (transform,)
+
+        stack.append((group_chain, transforms, in_defs, hidden, top_element))
+
+        if tag in SHAPE_TAGS:
+            shapes.append(SvgShape(element, tag, len(shapes), group_chain, transforms,
+                                   in_defs, hidden, top_element))
+
+    return SvgDocument(root, shapes)
+
+
+def read_root_attributes(svg_path: SvgSource) -> Dict[str, str]:
+    """Attributes of the root <svg> element, without parsing the rest of the file."""
+    for _, element in ET.iterparse(_open_source(svg_path), events=('start',)):
+        return dict(element.attrib)
+    return {}
+
+
+def scale_from_root_attributes(attrs: Dict[str, str]) -> Optional[float]:
+    """
+    Detect file_scale from SVG root dimensions/units.
+
+    Returns scale factor such that: real_mm = diameter / (72 * scale) * 25.4
+
+    - viewBox in points (typical AI→Inkscape conversion): returns None (caller uses its own file_scale)
+    - viewBox in inches (Illustrator SVG export with width="Xin"): returns 1/72
+      This makes 72 * (1/72) = 1.0, so diameter_inches * 25.4 = real_mm
+    """
+    width_str = attrs.get('width', '')
+    viewBox = attrs.get('viewBox', '')
+
+    if not viewBox:
+        return None
+
+    vb_parts = viewBox.replace(',', ' ').split()
+    if len(vb_parts) < 4:
+        return None
+
+    # Check if width attribute has explicit inch unit
+    if 'in' in width_str:
+        # Width in inches, viewBox matches → units are inches
+        # scale = 1/72 makes the formula: diameter_inches / 1.0 * 25.4 = real_mm
+        return 1.0 / 72.0
+
+    # Default: assume points (standard AI→SVG conversion)
+    return None
+
+
+def shape_to_d(shape: SvgShape) -> str:
+    """Path d-string for a shape element, converted the same way svg2paths2 does."""
+    attrs = shape.attrib
+    tag = shape.tag
+    if tag == 'path':
+        return attrs.get('d', '')
+    if tag == 'polyline':
+        return polyline2pathd(attrs)
+    if tag == 'polygon':
+        return polygon2pathd(attrs, True)
+    if tag == 'line':
+        return ('M' + attrs.get('x1', '0') + ' ' + attrs.get('y1', '0') +
+                'L' + attrs.get('x2', '0') + ' ' + attrs.get('y2', '0'))
+    if tag in ('ellipse', 'circle'):
+        return ellipse2pathd(attrs)
+    return rect2pathd(attrs)
+
+
+def shape_to_path_data(shape: SvgShape) -> Optional[PathData]:
+    """
+    Parse the path data of a shape element.
+
+    Returns:
+        PathData, or None if the element's geometry cannot be parsed
+    """
+    try:
+        return parse_path_data(shape_to_d(shape))
+    except Exception as e:
+        elem_id = shape.attrib.get('id', '(no id)')
+        print(f"Warning: Could not parse <{shape.tag} id='{elem_id}'>: {e}", file=sys.stderr)
+        return None
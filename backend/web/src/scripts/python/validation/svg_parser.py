@@ -7,50 +7,60 @@ import re
 import subprocess
 import sys
 import tempfile
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Tuple, Optional
+from typing import (
+    Callable, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+)
 
+from . import geometry_cache
+from .ai_sniffer import sniff_ai_file
 from .core import PathInfo
-from .geometry import is_circle_path, path_to_polygon, compound_path_to_polygon
+from .path_geometry import PathGeometry
+from .svg_ingest import (
+    SvgDocument, SvgShape, SvgSource, ingest_svg, read_root_attributes,
+    scale_from_root_attributes, shape_to_path_data, is_display_none,
+)
 
 try:
-    from svgpathtools import svg2paths2
+    import svgpathtools
 except ImportError:
-    svg2paths2 = None
+    svgpathtools = None
 
+# Layers that never carry production geometry
+SYSTEM_LAYERS = frozenset(('_no_layer_', '_defs_', '_hidden_'))
+DEFAULT_LAYER_RE = re.compile(r'^Layer[\s_]\d+$')
 
-def detect_svg_scale(svg_path: str) -> Optional[float]:
-    """
-    Detect file_scale from SVG dimensions/units.
 
-    Returns scale factor such that: real_mm = diameter / (72 * scale) * 25.4
+def is_system_or_separator_layer(name: str) -> bool:
+    """System layers and separator layers (no alphanumeric chars) are always excluded."""
+    return name in SYSTEM_LAYERS or not re.search(r'[a-zA-Z0-9]', name)
 
-    - viewBox in points (typical AI→Inkscape conversion): returns None (caller uses its own file_scale)
-    - viewBox in inches (Illustrator SVG export with width="Xin"): returns 1/72
-      This makes 72 * (1/72) = 1.0, so diameter_inches * 25.4 = real_mm
-    """
-    try:
-        tree = ET.parse(svg_path)
-        root = tree.getroot()
 
-        width_str = root.get('width', '')
-        viewBox = root.get('viewBox', '')
+def non_production_layers(layer_names: Iterable[Optional[str]]) -> Set[str]:
+    """
+    Layers excluded from production, given every layer name present in a file.
 
-        if not viewBox:
-            return None
+    System and separator layers are always excluded. Default Illustrator
+    layers (Layer 1, Layer_2, etc.) are excluded ONLY when named production
+    layers also exist — if they are the only layers, they are kept so
+    non-front-lit files still get analysis.
+    """
+    names = {name for name in layer_names if name}
+    dropped = {name for name in names if is_system_or_separator_layer(name)}
+    remaining = names - dropped
+    if any(not DEFAULT_LAYER_RE.match(name) for name in remaining):
+        dropped.update(name for name in remaining if DEFAULT_LAYER_RE.match(name))
+    return dropped
 
-        vb_parts = viewBox.replace(',', ' ').split()
-        if len(vb_parts) < 4:
-            return None
 
-        # Check if width attribute has explicit inch unit
-        if 'in' in width_str:
-            # Width in inches, viewBox matches → units are inches
-            # scale = 1/72 makes the formula: diameter_inches / 1.0 * 25.4 = real_mm
-            return 1.0 / 72.0
+def detect_svg_scale(svg_path: SvgSource) -> Optional[float]:
+    """
+    Detect file_scale from SVG dimensions/units.
 
-        # Default: assume points (standard AI→SVG conversion)
-        return None
+    Only the root <svg> start tag is read (streaming), so this stays cheap
+    even for multi-megabyte files. See scale_from_root_attributes().
+    """
+    try:
+        return scale_from_root_attributes(read_root_attributes(svg_path))
     except Exception as e:
         print(f"Warning: Could not detect SVG scale: {e}", file=sys.stderr)
         return None
@@ -68,12 +78,12 @@ def convert_ai_to_svg(ai_path: str) -> Tuple[bool, str, Optional[str]]:
     Returns:
         Tuple of (success, svg_path_or_error, temp_file_path)
     """
-    from .ai_converters import convert_ai_to_svg_multi
+    from .ai_converters import convert_ai_to_svg_multi, scratch_dir
 
     if not os.path.exists(ai_path):
         return False, f"File not found: {ai_path}", None
 
-    temp_fd, temp_svg_path = tempfile.mkstemp(suffix='.svg')
+    temp_fd, temp_svg_path = tempfile.mkstemp(suffix='.svg', dir=scratch_dir())
     os.close(temp_fd)
 
     try:
@@ -94,6 +104,86 @@ def convert_ai_to_svg(ai_path: str) -> Tuple[bool, str, Optional[str]]:
         return False, f"Conversion error: {str(e)}", None
 
 
+def convert_ai_to_svg_bytes(ai_path: str) -> Tuple[bool, Union[bytes, str]]:
+    """
+    Convert AI file to SVG held in memory (no temp SVG file to clean up).
+
+    Same converter chain as convert_ai_to_svg(); the result can be passed
+    straight to extract_paths_from_svg().
+
+    Returns:
+        Tuple of (success, svg_bytes_or_error)
+    """
+    from .ai_converters import convert_ai_to_svg_in_memory
+
+    try:
+        success, message, _, data = convert_ai_to_svg_in_memory(ai_path)
+    except Exception as e:
+        return False, f"Conversion error: {str(e)}"
+    return (True, data) if success else (False, message)
+
+
+def iter_convert_many_ai_to_svg(ai_paths: Sequence[str], sessions: int = 1
+                                ) -> Iterator[Tuple[str, Tuple[bool, str, Optional[str]]]]:
+    """
+    Convert several AI files, sharing Inkscape shell sessions between them.
+
+    Batch counterpart of convert_ai_to_svg(): files that fail in the shell
+    session fall back to the per-file converter chain individually. Each file
+    is yielded as soon as its SVG is ready.
+
+    Args:
+        ai_paths: AI files to convert
+        sessions: Number of Inkscape shell sessions to run in parallel
+
+    Yields:
+        (ai_path, (success, svg_path_or_error, temp_file_path)) per file, in
+        completion order. The caller owns yielded temp files.
+    """
+    from .ai_converters import iter_convert_many_ai_to_svg_multi, scratch_dir
+
+    pending: Dict[str, str] = {}  # ai_path -> temp SVG not yet handed to the caller
+    for ai_path in dict.fromkeys(ai_paths):
+        temp_fd, temp_svg_path = tempfile.mkstemp(suffix='.svg', dir=scratch_dir())
+        os.close(temp_fd)
+        pending[ai_path] = temp_svg_path
+
+    try:
+        try:
+            for ai_path, (success, message, _) in iter_convert_many_ai_to_svg_multi(
+                    list(pending.items()), sessions=sessions):
+                temp_svg_path = pending.pop(ai_path)
+                if success:
+                    yield ai_path, (True, temp_svg_path, temp_svg_path)
+                else:
+                    # Cleanup on failure
+                    if os.path.exists(temp_svg_path):
+                        os.unlink(temp_svg_path)
+                    yield ai_path, (False, message, None)
+        except Exception as e:
+            for ai_path in list(pending):
+                temp_svg_path = pending.pop(ai_path)
+                if os.path.exists(temp_svg_path):
+                    os.unlink(temp_svg_path)
+                yield ai_path, (False, f"Conversion error: {str(e)}", None)
+    finally:
+        # Abandoned before every file was reported
+        for temp_svg_path in pending.values():
+            if os.path.exists(temp_svg_path):
+                os.unlink(temp_svg_path)
+
+
+def convert_many_ai_to_svg(ai_paths: Sequence[str],
+                           sessions: int = 1) -> Dict[str, Tuple[bool, str, Optional[str]]]:
+    """
+    iter_convert_many_ai_to_svg() collected into a dict.
+
+    Returns:
+        Dict of ai_path -> (success, svg_path_or_error, temp_file_path)
+    """
+    return dict(iter_convert_many_ai_to_svg(ai_paths, sessions=sessions))
+
+
 def parse_color(color_str: Optional[str]) -> Optional[str]:
     """Normalize color string to hex format."""
     if not color_str or color_str == 'none':
@@ -143,25 +233,13 @@ def extract_layer_names_from_ai(ai_path: str) -> List[str]:
     """
     Extract layer names directly from an AI file.
     AI files are PDF-based and store layer names as OCG (Optional Content Groups).
+    The file is memory-mapped and scanned once (see ai_sniffer.py).
     """
-    layer_names = []
     try:
-        with open(ai_path, 'rb') as f:
-            content = f.read()
-
-        ocg_pattern = rb'/Name\(([^)]+)\)/Type/OCG'
-        matches = re.findall(ocg_pattern, content)
-
-        for match in matches:
-            try:
-                layer_name = match.decode('utf-8')
-                layer_names.append(layer_name)
-            except:
-                pass
+        return list(sniff_ai_file(ai_path).ocg_names)
     except Exception as e:
         print(f"Warning: Could not extract layer names from AI file: {e}", file=sys.stderr)
-
-    return layer_names
+        return []
 
 
 def _classify_svg_group(group, ns_strip=True) -> str:
@@ -213,82 +291,68 @@ def _decode_illustrator_id(raw_id: str) -> str:
     return re.sub(r'_x([0-9A-Fa-f]{2,4})_', _replace, raw_id)
 
 
-def _prepare_native_svg(svg_path: str) -> str:
+def _native_svg_records(document: SvgDocument) -> List[Tuple[SvgShape, Dict[str, str]]]:
     """
-    Pre-process a native SVG file to encode layer names into element IDs.
+    Resolve native SVG shapes to (shape, attributes) with layer-encoded IDs.
 
     Native SVGs (Illustrator SVG export) have clean `<g id="layername">`
-    structure, but child shape elements lack id attributes. svgpathtools
-    flattens the tree, losing parent-child relationships.
-
-    This function:
-    1. Removes top-level <g> elements with display:none (hidden layers)
-    2. Sets id="layername__N" on each child shape element
-    3. Writes modified SVG to a temp file
-
-    Returns the path to the temp file (caller must clean up).
+    structure, but child shape elements lack id attributes. Working from the
+    ingested element tree (no rewritten temp copy):
+    1. Skips top-level <g> elements with display:none (hidden layers)
+    2. Assigns id="layername__N" to each shape under a top-level <g id>,
+       numbered per layer in document order
+
+    Returns records in svg2paths2 order; attributes are copies with the
+    encoded id applied.
     """
-    # Register SVG namespaces so ET.write() preserves them (not ns0:)
-    ET.register_namespace('', 'http://www.w3.org/2000/svg')
-    ET.register_namespace('xlink', 'http://www.w3.org/1999/xlink')
-
-    tree = ET.parse(svg_path)
-    root = tree.getroot()
-
+    root = document.root
     ns = ''
     if root.tag.startswith('{'):
         ns = root.tag.split('}')[0] + '}'
-
-    shape_tags = {f'{ns}path', f'{ns}circle', f'{ns}ellipse',
-                  f'{ns}rect', f'{ns}line', f'{ns}polyline', f'{ns}polygon'}
     g_tag = f'{ns}g'
 
-    # Pass 1: Remove hidden top-level <g> elements
-    to_remove = []
-    for child in root:
-        if child.tag == g_tag:
-            style = child.get('style', '')
-            if 'display:none' in style or 'display: none' in style:
-                to_remove.append(child)
-    for elem in to_remove:
-        layer_id = elem.get('id', '(no id)')
-        print(f"Native SVG: removing hidden layer '{layer_id}'", file=sys.stderr)
-        root.remove(elem)
-
-    # Pass 2: Encode layer names into child element IDs
-    layers_found = []
+    hidden_layers = set()
+    layer_names = {}
     for child in root:
-        if child.tag == g_tag:
-            gid = child.get('id', '')
-            if not gid:
-                continue
-            layer_name = _decode_illustrator_id(gid)
-            layers_found.append(layer_name)
-            counter = 0
-
-            def stamp_ids(element):
-                nonlocal counter
-                if element.tag in shape_tags:
-                    element.set('id', f'{layer_name}__{counter}')
-                    counter += 1
-                for sub in element:
-                    stamp_ids(sub)
-
-            stamp_ids(child)
-
-    print(f"Native SVG prepared: layers={layers_found}", file=sys.stderr)
-
-    # Write to temp file
-    temp_fd, temp_path = tempfile.mkstemp(suffix='.svg')
-    os.close(temp_fd)
-    tree.write(temp_path, xml_declaration=True, encoding='unicode')
-    return temp_path
-
-
-def build_layer_and_transform_map(svg_path: str,
-                                   ai_path: Optional[str] = None) -> Tuple[Dict[str, str], Dict[str, str]]:
+        if child.tag != g_tag:
+            continue
+        if is_display_none(child.get('style', '')):
+            layer_id = child.get('id', '(no id)')
+            print(f"Native SVG: removing hidden layer '{layer_id}'", file=sys.stderr)
+            hidden_layers.add(id(child))
+        elif child.get('id', ''):
+            layer_names[id(child)] = _decode_illustrator_id(child.get('id', ''))
+
+    print(f"Native SVG prepared: layers={list(layer_names.values())}", file=sys.stderr)
+
+    encoded_ids = {}
+    counters: Dict[int, int] = {}
+    for shape in document.shapes:
+        top = id(shape.top_element) if shape.top_element is not None else None
+        if top in layer_names and shape.element.tag.startswith(ns):
+            counter = counters.get(top, 0)
+            encoded_ids[shape.order] = f'{layer_names[top]}__{counter}'
+            counters[top] = counter + 1
+
+    records = []
+    for shape in document.shapes_in_path_order():
+        if shape.top_element is not None and id(shape.top_element) in hidden_layers:
+            continue
+        attrs = dict(shape.attrib)
+        if shape.order in encoded_ids:
+            attrs['id'] = encoded_ids[shape.order]
+        records.append((shape, attrs))
+    return records
+
+
+def build_layer_and_transform_map(svg_path: SvgSource,
+                                   ai_path: Optional[str] = None,
+                                   document: Optional[SvgDocument] = None
+                                   ) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
     Build mappings from path IDs to layer names and transform chains.
+
+    Pass an already ingested document to avoid re-parsing the SVG.
     """
     layer_map: Dict[str, str] = {}
     transform_map: Dict[str, str] = {}
@@ -302,8 +366,9 @@ def build_layer_and_transform_map(svg_path: str,
         ai_layer_names = [n for n in ai_layer_names_raw if re.search(r'[a-zA-Z0-9]', n)]
 
     try:
-        tree = ET.parse(svg_path)
-        root = tree.getroot()
+        if document is None:
+            document = ingest_svg(svg_path)
+        root = document.root
 
         # Find all <g> elements that are direct children of root
         root_groups = []
@@ -451,52 +516,31 @@ def build_layer_and_transform_map(svg_path: str,
                 # Log final heuristic assignments
                 print(f"  Heuristic layer assignments: {group_to_layer}", file=sys.stderr)
 
-        def get_top_level_parent(element, parent_chain):
-            for parent_id in parent_chain:
-                if parent_id in group_to_layer:
-                    return group_to_layer[parent_id]
-            return None
-
-        def traverse(element, parent_chain: List[str], transform_chain: List[str],
-                     in_defs: bool = False, hidden: bool = False):
-            tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
-            elem_id = element.get('id', '')
-            transform = element.get('transform', '')
-
-            if tag == 'defs':
-                in_defs = True
-
-            # Detect display:none (hidden annotation layers in SVG exports)
-            if not hidden:
-                style = element.get('style', '')
-                if 'display:none' in style or 'display: none' in style:
-                    hidden = True
-
-            new_chain = parent_chain + [elem_id] if tag == 'g' and elem_id else parent_chain
-            new_transforms = transform_chain + [transform] if transform else transform_chain
-
-            # Match all SVG shape elements that svgpathtools converts to paths
-            if tag in ('path', 'circle', 'ellipse', 'rect', 'line', 'polyline', 'polygon'):
-                path_id = element.get('id')
-                if path_id:
-                    if in_defs:
-                        layer_map[path_id] = '_defs_'
-                    elif hidden:
-                        layer_map[path_id] = '_hidden_'
-                    else:
-                        # Check if this path is directly mapped (loose path in wrapper)
-                        # before falling back to parent chain lookup
-                        layer_name = group_to_layer.get(path_id) or get_top_level_parent(element, new_chain)
-                        layer_map[path_id] = layer_name or '_no_layer_'
-
-                    path_transform = element.get('transform', '')
-                    all_transforms = new_transforms + ([path_transform] if path_transform else [])
-                    transform_map[path_id] = '|'.join(all_transforms) if all_transforms else ''
-
-            for child in element:
-                traverse(child, new_chain, new_transforms, in_defs, hidden)
-
-        traverse(root, [], [])
+        # Resolve every shape recorded during ingestion (ancestor chain,
+        # transforms and defs/hidden flags were captured in the same walk)
+        for shape in document.shapes:
+            path_id = shape.attrib.get('id')
+            if not path_id:
+                continue
+
+            if shape.in_defs:
+                layer_map[path_id] = '_defs_'
+            elif shape.hidden:
+                layer_map[path_id] = '_hidden_'
+            else:
+                # Check if this path is directly mapped (loose path in wrapper)
+                # before falling back to the nearest mapped ancestor group
+                layer_name = group_to_layer.get(path_id)
+                if not layer_name:
+                    layer_name = next(
+                        (group_to_layer[g] for g in shape.group_chain if g in group_to_layer),
+                        None
+                    )
+                layer_map[path_id] = layer_name or '_no_layer_'
+
+            path_transform = shape.attrib.get('transform', '')
+            all_transforms = list(shape.transforms) + ([path_transform] if path_transform else [])
+            transform_map[path_id] = '|'.join(all_transforms) if all_transforms else ''
 
     except Exception as e:
         print(f"Warning: Could not parse layer structure: {e}", file=sys.stderr)
@@ -504,45 +548,157 @@ def build_layer_and_transform_map(svg_path: str,
     return layer_map, transform_map
 
 
-def extract_paths_from_svg(svg_path: str, ai_path: Optional[str] = None,
-                           max_point_distance: Optional[float] = None) -> List[PathInfo]:
+def prune_to_layers(items: List, layer_of: Callable[[object], Optional[str]],
+                    prune_layers: bool,
+                    required_layers: Optional[Collection[str]]) -> List:
+    """
+    Drop items on non-production layers and, if given, layers not required.
+
+    Call once every non-degenerate item is known: whether default layers are
+    dropped depends on all the layers present (see non_production_layers).
+    """
+    dropped = non_production_layers(layer_of(item) for item in items) if prune_layers else set()
+    wanted = {name.lower() for name in required_layers} if required_layers else None
+    kept = [
+        item for item in items
+        if layer_of(item) not in dropped
+        and (wanted is None or (layer_of(item) or '').lower() in wanted)
+    ]
+    print(f"Layer pruning: {len(kept)} paths kept, "
+          f"dropped layers={sorted(dropped)}", file=sys.stderr)
+    return kept
+
+
+def extract_paths_from_svg(svg_path: SvgSource, ai_path: Optional[str] = None,
+                           max_point_distance: Optional[float] = None,
+                           use_cache: bool = True,
+                           flatten_tolerance: Optional[float] = None,
+                           prune_layers: bool = False,
+                           required_layers: Optional[Collection[str]] = None,
+                           write_cache: bool = True) -> List[PathInfo]:
     """
     Extract all paths from SVG file with their attributes.
 
     Args:
-        svg_path: Path to SVG file
+        svg_path: Path to SVG file, or the SVG document as bytes
         ai_path: Optional path to original AI file (for OCG layer extraction)
         max_point_distance: Max distance between polygon samples in file units.
             When provided, polygon sampling is dynamic per curve segment arc length.
+        use_cache: Reuse/store parsed geometry in the on-disk geometry cache.
+            Storing an entry computes every lazy PathInfo field; with
+            use_cache=False geometry is only computed when a rule reads it.
+        flatten_tolerance: Max chord deviation in file units. Enables adaptive
+            curve flattening for polygons (see sampling.py).
+        prune_layers: Drop non-production layers (see non_production_layers)
+            before polygonization instead of after extraction
+        required_layers: Only keep paths on these layers (case-insensitive),
+            e.g. the return/trimcap/face layers the active rules inspect.
+            None keeps every layer.
+        write_cache: Store an entry on a cache miss. Pass False when no active
+            rule reads polygon geometry: cache hits are still used, but the
+            lazy fields are not computed just to fill the entry.
     """
-    if svg2paths2 is None:
+    if svgpathtools is None:
         print("Error: svgpathtools not installed", file=sys.stderr)
         return []
 
+    cache_key = None
+    if use_cache:
+        try:
+            layer_filter = (prune_layers,
+                            tuple(sorted({n.lower() for n in required_layers}))
+                            if required_layers else None)
+            cache_key = geometry_cache.cache_key(svg_path, ai_path, max_point_distance,
+                                                 flatten_tolerance, layer_filter)
+        except OSError as e:
+            print(f"Warning: Could not hash SVG for geometry cache: {e}", file=sys.stderr)
+        if cache_key:
+            cached = geometry_cache.load_paths(cache_key)
+            if cached is not None:
+                print(f"Geometry cache hit: {len(cached)} paths", file=sys.stderr)
+                return cached
+
+    paths_info = _parse_paths_from_svg(svg_path, ai_path, max_point_distance,
+                                       flatten_tolerance, prune_layers, required_layers)
+    if cache_key and write_cache:
+        geometry_cache.save_paths(cache_key, paths_info)
+    return paths_info
+
+
+def _parse_paths_from_svg(svg_path: SvgSource, ai_path: Optional[str],
+                          max_point_distance: Optional[float],
+                          flatten_tolerance: Optional[float] = None,
+                          prune_layers: bool = False,
+                          required_layers: Optional[Collection[str]] = None) -> List[PathInfo]:
+    """Parse paths, attributes, layers and polygons from an SVG (uncached)."""
+
     paths_info = []
     native_svg = ai_path is None
     layer_map: Dict[str, str] = {}
     transform_map: Dict[str, str] = {}
-    temp_native_path: Optional[str] = None
 
-    if native_svg:
-        temp_native_path = _prepare_native_svg(svg_path)
-    else:
-        layer_map, transform_map = build_layer_and_transform_map(svg_path, ai_path)
+    # One parse feeds layer mapping, transforms and path construction.
+    # Native uploads surface parse errors to the caller; AI conversions
+    # degrade to "no paths" like the converter output always has.
+    document = ingest_svg(svg_path) if native_svg else None
 
     try:
-        parse_path = temp_native_path if native_svg else svg_path
-        paths, attributes, svg_attributes = svg2paths2(parse_path)
+        if document is None:
+            document = ingest_svg(svg_path)
+        if native_svg:
+            shape_records = _native_svg_records(document)
+        else:
+            layer_map, transform_map = build_layer_and_transform_map(svg_path, ai_path, document)
+            shape_records = [(shape, shape.attrib) for shape in document.shapes_in_path_order()]
 
-        for i, (path, attrs) in enumerate(zip(paths, attributes)):
+        # Pass 1: resolve layers and lengths only. System/separator layers are
+        # dropped before their geometry is even parsed.
+        candidates = []
+        for i, (shape, attrs) in enumerate(shape_records):
             path_id = attrs.get('id', f'path_{i}')
+
+            # Layer resolution: encoded ID for native SVGs, map-based for AI→SVG
+            if native_svg:
+                raw_id = attrs.get('id', '')
+                if '__' in raw_id:
+                    resolved_layer = raw_id.rsplit('__', 1)[0]
+                else:
+                    resolved_layer = None
+            else:
+                resolved_layer = layer_map.get(path_id)
+
+            if prune_layers and resolved_layer and is_system_or_separator_layer(resolved_layer):
+                continue
+
+            data = shape_to_path_data(shape)
+            if data is None:
+                continue
+
+            geometry = PathGeometry(data=data, max_point_distance=max_point_distance,
+                                    flatten_tolerance=flatten_tolerance)
+            path_length, = geometry.length()
+
+            # Skip degenerate paths (zero-length points, dummy lines)
+            if path_length < 0.1:
+                continue
+
+            candidates.append((geometry, attrs, path_id, resolved_layer, path_length))
+
+        # Default layers can only be judged once every surviving layer is known
+        if prune_layers or required_layers:
+            candidates = prune_to_layers(candidates, lambda c: c[3],
+                                         prune_layers, required_layers)
+
+        # Pass 2: attributes for the kept paths. Bbox, closure, polygon and
+        # circle detection are left to PathGeometry and computed on first access.
+        for geometry, attrs, path_id, resolved_layer, path_length in candidates:
             d_attr = attrs.get('d', '')
 
             # For non-<path> elements (polygon, circle, rect, etc.),
             # svgpathtools converts internally but attrs lacks 'd'.
-            # Reconstruct from the Path object so SVG rendering works.
-            if not d_attr and len(path) > 0:
-                d_attr = path.d()
+            # Reconstruct from the parsed segments so SVG rendering works.
+            if not d_attr and len(geometry.data) > 0:
+                d_attr = geometry.path.d()
 
             style = attrs.get('style', '')
             style_dict = {}
@@ -557,72 +713,6 @@ def extract_paths_from_svg(svg_path: str, ai_path: Optional[str] = None,
             fill = attrs.get('fill') or style_dict.get('fill')
             transform = attrs.get('transform')
 
-            try:
-                path_length = path.length()
-            except Exception:
-                path_length = 0
-
-            is_closed = False
-            is_compound = False
-            num_subpaths = 1
-            try:
-                if len(path) > 0:
-                    if path.iscontinuous():
-                        start = path[0].start
-                        end = path[-1].end
-                        is_closed = abs(start - end) < 0.5
-                    else:
-                        subpaths = path.continuous_subpaths()
-                        num_subpaths = len(subpaths)
-                        is_compound = num_subpaths > 1
-                        if is_compound:
-                            is_closed = all(
-                                abs(sp[0].start - sp[-1].end) < 0.5
-                                for sp in subpaths if len(sp) > 0
-                            )
-            except Exception:
-                pass
-
-            bbox = None
-            try:
-                xmin, xmax, ymin, ymax = path.bbox()
-                bbox = (xmin, ymin, xmax, ymax)
-            except Exception:
-                pass
-
-            area = None
-            num_holes = 0
-            path_polygon = None
-            if is_closed:
-                if is_compound:
-                    path_polygon = compound_path_to_polygon(path, max_point_distance=max_point_distance)
-                else:
-                    path_polygon = path_to_polygon(path, max_point_distance=max_point_distance)
-                if path_polygon and path_polygon.is_valid:
-                    area = abs(path_polygon.area)
-                    # Handle both Polygon and MultiPolygon types
-                    if path_polygon.geom_type == 'Polygon':
-                        num_holes = len(list(path_polygon.interiors))
-                    elif path_polygon.geom_type == 'MultiPolygon':
-                        # Sum holes from all polygons in the multipolygon
-                        num_holes = sum(len(list(poly.interiors)) for poly in path_polygon.geoms)
-
-            path_is_circle, circle_diameter = is_circle_path(path)
-
-            # Skip degenerate paths (zero-length points, dummy lines)
-            if path_length < 0.1:
-                continue
-
-            # Layer resolution: encoded ID for native SVGs, map-based for AI→SVG
-            if native_svg:
-                raw_id = attrs.get('id', '')
-                if '__' in raw_id:
-                    resolved_layer = raw_id.rsplit('__', 1)[0]
-                else:
-                    resolved_layer = None
-            else:
-                resolved_layer = layer_map.get(path_id)
-
             paths_info.append(PathInfo(
                 path_id=path_id,
                 d_attribute=d_attr,
@@ -630,24 +720,13 @@ def extract_paths_from_svg(svg_path: str, ai_path: Optional[str] = None,
                 stroke_width=parse_stroke_width(stroke_width_str),
                 fill=parse_color(fill),
                 transform=transform,
-                bbox=bbox,
                 length=path_length,
-                area=area,
-                is_closed=is_closed,
-                num_holes=num_holes,
                 layer_name=resolved_layer,
                 transform_chain=transform_map.get(path_id),
-                is_circle=path_is_circle,
-                circle_diameter=circle_diameter,
-                polygon=path_polygon,
-                is_compound=is_compound,
-                num_subpaths=num_subpaths
+                geometry=geometry
             ))
 
     except Exception as e:
         print(f"Error parsing SVG: {e}", file=sys.stderr)
-    finally:
-        if temp_native_path and os.path.exists(temp_native_path):
-            os.unlink(temp_native_path)
 
     return paths_info
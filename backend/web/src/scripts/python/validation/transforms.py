@@ -1,9 +1,25 @@
 """
 SVG Transform utilities - parsing and applying transforms to coordinates.
+
+Transform chains are compiled once into a single affine matrix
+(compile_transform_chain, memoized per chain string) and applied to whole
+coordinate arrays, instead of re-parsing and walking each step per point.
 """
 
+import math
 import re
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+try:
+    from shapely.affinity import affine_transform as _affine_transform
+except ImportError:
+    _affine_transform = None
+
+# Affine coefficients in shapely order: x' = a*x + b*y + xoff, y' = d*x + e*y + yoff
+AffineParams = Tuple[float, float, float, float, float, float]
+
+_IDENTITY: AffineParams = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
 
 
 def parse_transform(transform_str: str) -> List[Tuple[str, List[float]]]:
@@ -55,7 +71,6 @@ def apply_transform_to_point(x: float, y: float,
                 new_y = b * x + d * y + f
                 x, y = new_x, new_y
         elif transform_type == 'rotate':
-            import math
             angle = math.radians(values[0]) if len(values) > 0 else 0
             cx = values[1] if len(values) > 1 else 0
             cy = values[2] if len(values) > 2 else 0
@@ -71,35 +86,93 @@ def apply_transform_to_point(x: float, y: float,
     return x, y
 
 
-def apply_transform_to_bbox(bbox: Tuple[float, float, float, float],
-                            transform_chain: str) -> Tuple[float, float, float, float]:
+def _step_matrix(transform_type: str, values: List[float]) -> Optional[AffineParams]:
+    """Affine coefficients for a single parsed transform (None if unsupported)."""
+    if transform_type == 'translate':
+        tx = values[0] if len(values) > 0 else 0
+        ty = values[1] if len(values) > 1 else 0
+        return (1.0, 0.0, 0.0, 1.0, tx, ty)
+    if transform_type == 'scale':
+        sx = values[0] if len(values) > 0 else 1
+        sy = values[1] if len(values) > 1 else sx
+        return (sx, 0.0, 0.0, sy, 0.0, 0.0)
+    if transform_type == 'matrix':
+        if len(values) >= 6:
+            a, b, c, d, e, f = values[:6]
+            return (a, c, b, d, e, f)
+        return None
+    if transform_type == 'rotate':
+        angle = math.radians(values[0]) if len(values) > 0 else 0
+        cx = values[1] if len(values) > 1 else 0
+        cy = values[2] if len(values) > 2 else 0
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        # Translate to origin, rotate, translate back
+        return (cos_a, -sin_a, sin_a, cos_a,
+                cx - cos_a * cx + sin_a * cy,
+                cy - sin_a * cx - cos_a * cy)
+    return None
+
+
+def _compose(outer: AffineParams, inner: AffineParams) -> AffineParams:
+    """Affine for applying inner first, then outer."""
+    a1, b1, d1, e1, x1, y1 = outer
+    a2, b2, d2, e2, x2, y2 = inner
+    return (
+        a1 * a2 + b1 * d2, a1 * b2 + b1 * e2,
+        d1 * a2 + e1 * d2, d1 * b2 + e1 * e2,
+        a1 * x2 + b1 * y2 + x1, d1 * x2 + e1 * y2 + y1,
+    )
+
+
+@lru_cache(maxsize=4096)
+def compile_transform_chain(transform_chain: str) -> Optional[AffineParams]:
     """
-    Apply transform chain to a bounding box and return transformed bbox.
-    Transform chain is pipe-separated: "transform1|transform2|..."
+    Compile a pipe-separated transform chain into one affine matrix.
+
+    Same semantics as apply_transform_to_point(): steps are applied
+    right-to-left, unsupported steps (skewX/skewY) are ignored.
+
+    Returns:
+        Affine coefficients (a, b, d, e, xoff, yoff) in shapely order,
+        or None when the chain contains no transforms
     """
     if not transform_chain:
-        return bbox
-
-    xmin, ymin, xmax, ymax = bbox
+        return None
 
-    # Parse all transforms in the chain
     all_transforms = []
     for transform_str in transform_chain.split('|'):
         all_transforms.extend(parse_transform(transform_str))
 
     if not all_transforms:
+        return None
+
+    matrix = _IDENTITY
+    for transform_type, values in all_transforms:
+        step = _step_matrix(transform_type, values)
+        if step is not None:
+            # Left-to-right composition == right-to-left application
+            matrix = _compose(matrix, step)
+    return matrix
+
+
+def apply_transform_to_bbox(bbox: Tuple[float, float, float, float],
+                            transform_chain: str) -> Tuple[float, float, float, float]:
+    """
+    Apply transform chain to a bounding box and return transformed bbox.
+    Transform chain is pipe-separated: "transform1|transform2|..."
+    """
+    matrix = compile_transform_chain(transform_chain) if transform_chain else None
+    if matrix is None:
         return bbox
 
-    # Transform all four corners and compute new bbox
-    corners = [(xmin, ymin), (xmax, ymin), (xmin, ymax), (xmax, ymax)]
-    transformed = [apply_transform_to_point(x, y, all_transforms) for x, y in corners]
+    xmin, ymin, xmax, ymax = bbox
+    a, b, d, e, xoff, yoff = matrix
 
-    new_xmin = min(c[0] for c in transformed)
-    new_xmax = max(c[0] for c in transformed)
-    new_ymin = min(c[1] for c in transformed)
-    new_ymax = max(c[1] for c in transformed)
+    # Transform all four corners and compute new bbox
+    xs = (a * xmin + b * ymin, a * xmax + b * ymin, a * xmin + b * ymax, a * xmax + b * ymax)
+    ys = (d * xmin + e * ymin, d * xmax + e * ymin, d * xmin + e * ymax, d * xmax + e * ymax)
 
-    return (new_xmin, new_ymin, new_xmax, new_ymax)
+    return (min(xs) + xoff, min(ys) + yoff, max(xs) + xoff, max(ys) + yoff)
 
 
 def apply_transform_to_polygon(polygon, transform_chain: str):
@@ -113,41 +186,14 @@ def apply_transform_to_polygon(polygon, transform_chain: str):
     Returns:
         New Polygon with transformed coordinates, or original if no transform
     """
-    if not polygon or not transform_chain:
+    if not polygon or not transform_chain or _affine_transform is None:
         return polygon
 
-    # Import Shapely Polygon type
-    try:
-        from shapely.geometry import Polygon as ShapelyPolygon
-    except ImportError:
+    matrix = compile_transform_chain(transform_chain)
+    if matrix is None:
         return polygon
 
-    # Parse all transforms in the chain
-    all_transforms = []
-    for transform_str in transform_chain.split('|'):
-        all_transforms.extend(parse_transform(transform_str))
-
-    if not all_transforms:
-        return polygon
-
-    # Transform exterior ring coordinates
-    exterior_coords = list(polygon.exterior.coords)
-    transformed_exterior = [
-        apply_transform_to_point(x, y, all_transforms)
-        for x, y in exterior_coords
-    ]
-
-    # Transform interior rings (holes in the polygon geometry, not to be confused with wire holes)
-    transformed_interiors = []
-    for interior in polygon.interiors:
-        interior_coords = list(interior.coords)
-        transformed_interior = [
-            apply_transform_to_point(x, y, all_transforms)
-            for x, y in interior_coords
-        ]
-        transformed_interiors.append(transformed_interior)
-
     try:
-        return ShapelyPolygon(transformed_exterior, transformed_interiors)
+        return _affine_transform(polygon, matrix)
     except Exception:
         return polygon